@@ -0,0 +1,154 @@
+import argparse
+import os
+import sys
+from typing import List
+
+from main import expand_input_patterns
+from src.greedy.benchmark import (
+    STAGES,
+    compare_with_baseline,
+    load_report,
+    run_benchmarks,
+    save_report,
+)
+from src.greedy.settings import (
+    BENCHMARK_BASELINE,
+    BENCHMARK_REPEAT,
+    BENCHMARK_THRESHOLDS,
+    BENCHMARK_TOLERANCE,
+    CACHED_ENGINE,
+    DENSE_RESULTS,
+    DIRPATH,
+    ENGINE,
+    NUMPY_ENGINE,
+    PYTHON_ENGINE,
+    RESULTS_FORMAT,
+    SPARSE_RESULTS,
+)
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measures speed and memory of stages of the algorithm for "
+        "departments' input files and compares them with baseline."
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        default=[os.path.join(DIRPATH, "*-input.txt")],
+        help="input files or glob patterns (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=BENCHMARK_REPEAT,
+        help="number of timed calls of every stage (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--thresholds",
+        nargs="+",
+        type=int,
+        default=BENCHMARK_THRESHOLDS,
+        help="thresholds of timed run of the algorithm, the last one is its "
+        "budget of full iterations (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-e",
+        "--engine",
+        choices=[CACHED_ENGINE, NUMPY_ENGINE, PYTHON_ENGINE],
+        default=ENGINE,
+        help="implementation of choosing publications (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=[SPARSE_RESULTS, DENSE_RESULTS],
+        default=RESULTS_FORMAT,
+        help="format of saved result files (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        default=BENCHMARK_BASELINE,
+        help="baseline report (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="save report as new baseline instead of comparing with baseline",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=BENCHMARK_TOLERANCE,
+        help="allowed relative increase of time and memory over baseline "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "-o", "--output", default=None, help="path to save benchmark report"
+    )
+
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("argument --repeat: must be positive")
+    if args.tolerance < 0:
+        parser.error("argument --tolerance: must not be negative")
+    return args
+
+
+def format_ratio(stage: dict, metric: str) -> str:
+    ratio = stage.get(f"{metric}_ratio")
+    return f"x{ratio:.2f}" if ratio is not None else "-"
+
+
+def print_report(report: dict) -> None:
+    for name, department in report["departments"].items():
+        print(
+            f"{name} (A = {department['authors']}, P = {department['publications']}, "
+            f"pairs = {department['pairs']})"
+        )
+        for stage_name in STAGES:
+            stage = department["stages"][stage_name]
+            evaluations = stage.get("evaluations_per_second")
+            print(
+                f"  {stage_name:<40}"
+                f"{stage['time'] * 1000:>10.2f} ms {format_ratio(stage, 'time'):>7}"
+                f"{stage['peak_memory_kb']:>11.0f} KB "
+                f"{format_ratio(stage, 'peak_memory_kb'):>7}"
+                + (f"{evaluations:>12.0f} evals/s" if evaluations else "")
+            )
+        print()
+
+    for regression in report.get("regressions", []):
+        print(f"Regression: {regression}")
+
+
+def main(argv: List[str] = None) -> dict:
+    args = parse_args(argv)
+    report = run_benchmarks(
+        expand_input_patterns(args.inputs),
+        args.repeat,
+        args.thresholds,
+        args.engine,
+        args.format,
+    )
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        save_report(args.baseline, report)
+    elif os.path.exists(args.baseline):
+        report["regressions"] = compare_with_baseline(
+            report, load_report(args.baseline), args.tolerance
+        )
+    else:
+        print(f"Baseline {args.baseline} not found, use --save-baseline to create it")
+
+    if args.output:
+        save_report(args.output, report)
+    print_report(report)
+    return report
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main().get("regressions") else 0)
@@ -0,0 +1,142 @@
+import argparse
+from typing import List
+
+from src.greedy.generator import (
+    CONTRIBUTION_DISTRIBUTIONS,
+    DENSITY,
+    EMPLOYEE_RATIO,
+    EQUAL_CONTRIBUTIONS,
+    EXTERNAL_AUTHORS,
+    MONOGRAPH_RATIO,
+    PART_TIME_RATIO,
+    PHD_RATIO,
+    generate_instance,
+    save_generated_files,
+)
+from src.greedy.settings import SEED
+
+# Formats of generated files: input file, binary dataset file or both
+TEXT_FORMAT = "text"
+BINARY_FORMAT = "binary"
+BOTH_FORMATS = "both"
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generates synthetic department in format of input files."
+    )
+    parser.add_argument(
+        "output", help="path to the generated input file (ex. data/x-input.txt)"
+    )
+    parser.add_argument(
+        "-a", "--authors", type=int, required=True, help="number of authors (A)"
+    )
+    parser.add_argument(
+        "-p",
+        "--publications",
+        type=int,
+        required=True,
+        help="number of publications (P)",
+    )
+    parser.add_argument(
+        "--density",
+        type=float,
+        default=DENSITY,
+        help="mean number of department's authors of publication "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--external-authors",
+        type=float,
+        default=EXTERNAL_AUTHORS,
+        help="mean number of external authors of publication (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--monograph-ratio",
+        type=float,
+        default=MONOGRAPH_RATIO,
+        help="fraction of monographs (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--phd-ratio",
+        type=float,
+        default=PHD_RATIO,
+        help="fraction of PhD students (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--employee-ratio",
+        type=float,
+        default=EMPLOYEE_RATIO,
+        help="fraction of employees (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--part-time-ratio",
+        type=float,
+        default=PART_TIME_RATIO,
+        help="fraction of part-time authors (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-c",
+        "--contribution",
+        choices=CONTRIBUTION_DISTRIBUTIONS,
+        default=EQUAL_CONTRIBUTIONS,
+        help="distribution of contributions of publication's authors "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=[TEXT_FORMAT, BINARY_FORMAT, BOTH_FORMATS],
+        default=BOTH_FORMATS,
+        help="format of generated files (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-s",
+        "--seed",
+        type=int,
+        default=SEED,
+        help="seed of random numbers generator (default: %(default)s)",
+    )
+
+    args = parser.parse_args(argv)
+    for name in ["authors", "publications"]:
+        if getattr(args, name) < 1:
+            parser.error(f"argument --{name}: must be positive")
+    if args.density < 1:
+        parser.error("argument --density: must be at least 1")
+    if args.external_authors < 0:
+        parser.error("argument --external-authors: must not be negative")
+    for name in ["monograph_ratio", "phd_ratio", "employee_ratio", "part_time_ratio"]:
+        if not 0 <= getattr(args, name) <= 1:
+            option = name.replace("_", "-")
+            parser.error(f"argument --{option}: must be between 0 and 1")
+    return args
+
+
+def main(argv: List[str] = None) -> List[str]:
+    args = parse_args(argv)
+    data = generate_instance(
+        args.authors,
+        args.publications,
+        args.density,
+        args.external_authors,
+        args.monograph_ratio,
+        args.phd_ratio,
+        args.employee_ratio,
+        args.part_time_ratio,
+        args.contribution,
+        args.seed,
+    )
+    paths = save_generated_files(
+        args.output,
+        data,
+        args.format in (TEXT_FORMAT, BOTH_FORMATS),
+        args.format in (BINARY_FORMAT, BOTH_FORMATS),
+    )
+    for path in paths:
+        print(path)
+    return paths
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,32 @@
+import argparse
+import glob
 import os
 from typing import List
 
-from src.greedy.data_loader import load_data
-from src.greedy.data_preparation import get_initial_publications, normalize_data
-from src.greedy.greedy import run_algorithm
-from src.greedy.output_converter import (
-    convert_dictionary_to_vector,
-    convert_publications_to_dictionary,
-    get_result_path,
-    save_results
-)
-from src.greedy.publication import Publication
+from src.greedy.batch import run_batch
+from src.greedy.runner import Job, create_jobs, run_experiments
 from src.greedy.settings import (
-    DIGITAL_VARIABLES,
+    ALPHA,
+    AUTH_PUBS_NUM,
+    BATCH_MODE,
+    DENSE_RESULTS,
     DIRPATH,
     FILEPATH,
     HEURISTIC_RESULT_PUBS_LEN,
-    INITIAL_PUBS,
-    LIST_VARIABLES,
-    NESTED_LIST_VARIABLES,
-    PUBLICATIONS_NUM,
+    MAX_EVALUATIONS,
+    MODES,
+    PATIENCE,
     RESULTS_DIR,
-    STRING_LIST_VARIIABLES,
-    THRESHOLDS_SUFFIX,
+    RESULTS_FORMAT,
+    SEED,
+    SPARSE_RESULTS,
+    TESTS_NUM,
+    THRESHOLDS,
+    TIME_LIMIT,
+    TRIES_NUM,
+    WORKER_MEMORY_LIMIT,
+    WORKERS,
 )
-from src.greedy.tools import get_list_of_files_from_dir
 
 
 def test_algorithm(
@@ -35,6 +37,8 @@ def test_algorithm(
     data: dict,
     filepath: str,
     results_dir: str,
+    workers: int = WORKERS,
+    seed: int = SEED,
 ):
     """
     0 - empty publications list
@@ -42,59 +46,245 @@ def test_algorithm(
     2 - first auth_pubs_num publications from sorted publications list
     3 - first auth_pubs_num publications from shuffled publications list
     """
-    max_goal = 0
-    for test_num in range(number_of_tests):
-        data[INITIAL_PUBS] = get_initial_publications(mode, data, auth_pubs_num)
-        data["goal_calculations_num"] = 0
-        data["threshold_goal_values"] = {}
-        data["best_result"] = {"res_pubs": [], "goal_fun": 0}
-        
-        heuristic_len = int(data[PUBLICATIONS_NUM] * HEURISTIC_RESULT_PUBS_LEN)
-        publications, goal_function = run_algorithm(data, heuristic_len)
-
-        result_publications = convert_publications_to_dictionary(publications)
-        result_vector = convert_dictionary_to_vector(result_publications, data)
-        max_goal = max(max_goal, goal_function)
-        path = get_result_path(filepath, mode, test_num, test_try, RESULTS_DIR)
-        save_results(path, data, goal_function, result_vector)
-    return max_goal
+    jobs = create_jobs(mode, auth_pubs_num, number_of_tests, test_try, seed)
+    max_goals = run_experiments(jobs, data, filepath, results_dir, workers)
+    return max_goals[(mode, test_try)]
 
 
-if __name__ == "__main__":
-    # files = get_list_of_files_from_dir(DIRPATH, ".txt")
-    files = [FILEPATH]
-
-    for filepath in files:
-        print(filepath)
-
-        try:
-            with open(filepath, "r") as file:
-                data = file.read()
-
-            source_data = normalize_data(
-                load_data(
-                    data,
-                    DIGITAL_VARIABLES,
-                    LIST_VARIABLES,
-                    NESTED_LIST_VARIABLES,
-                    STRING_LIST_VARIIABLES,
-                )
+def create_all_jobs(
+    seed: int,
+    modes: List[int] = MODES,
+    auth_pubs_num: int = AUTH_PUBS_NUM,
+    number_of_tests: int = TESTS_NUM,
+    tries: int = TRIES_NUM,
+    thresholds: List[int] = THRESHOLDS,
+    alpha: float = ALPHA,
+    heuristic_len: float = HEURISTIC_RESULT_PUBS_LEN,
+) -> List[Job]:
+    """
+    Creates tests of every mode. Mode 3 (shuffled publications) is repeated in
+    number of tries, other modes are run in single try.
+    """
+    jobs = []
+    for mode in modes:
+        for test_try in range(tries if mode == 3 else 1):
+            jobs += create_jobs(
+                mode,
+                auth_pubs_num,
+                number_of_tests,
+                test_try,
+                seed,
+                thresholds,
+                alpha,
+                heuristic_len,
             )
+    return jobs
+
+
+def expand_input_patterns(patterns: List[str]) -> List[str]:
+    """
+    Expands glob patterns to paths of input files. Patterns that do not match any
+    file are kept, so missing files are reported by batch as errors.
+    """
+    files = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)) or [pattern]:
+            if path not in files:
+                files.append(path)
+    return files
+
+
+def get_default_inputs() -> List[str]:
+    return [os.path.join(DIRPATH, "*.txt")] if BATCH_MODE else [FILEPATH]
 
-            val = test_algorithm(0, 2, 28, 0, source_data.copy(), filepath, RESULTS_DIR)
-            print(f"0: 1/1: {val}")
-            val = test_algorithm(1, 2, 28, 0, source_data.copy(), filepath, RESULTS_DIR)
-            print(f"1: 1/1: {val}")
-            val = test_algorithm(2, 2, 28, 0, source_data.copy(), filepath, RESULTS_DIR)
-            print(f"2: 1/1: {val}")
-            for i in range(0, 25):
-                val = test_algorithm(
-                    3, 2, 28, i, source_data.copy(), filepath, RESULTS_DIR
-                )
-                print(f"3: {i + 1}/25: {val}")
-            print()
-            print()
-
-        except Exception as e:
-            print(e)
-            continue
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Runs greedy algorithm tests for departments' input files."
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        default=get_default_inputs(),
+        help="input files or glob patterns (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-m",
+        "--modes",
+        nargs="+",
+        type=int,
+        choices=[0, 1, 2, 3],
+        default=MODES,
+        help="modes of choosing initial publications (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-n",
+        "--tests",
+        type=int,
+        default=TESTS_NUM,
+        help="number of tests in single try (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-t",
+        "--tries",
+        type=int,
+        default=TRIES_NUM,
+        help="number of tries of mode 3 (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--auth-pubs-num",
+        type=int,
+        default=AUTH_PUBS_NUM,
+        help="initial number of publications of author (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--thresholds",
+        nargs="+",
+        type=int,
+        default=THRESHOLDS,
+        help="numbers of full iterations after which goal function values are "
+        "saved, the last one is iteration budget of test (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=ALPHA,
+        help="probability of publication's revocation (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=TIME_LIMIT,
+        help="time limit of single test in seconds, test is stopped with the best "
+        "result found so far (default: no limit)",
+    )
+    parser.add_argument(
+        "--max-evaluations",
+        type=int,
+        default=MAX_EVALUATIONS,
+        help="budget of goal function calculations of single test (default: no "
+        "limit)",
+    )
+    parser.add_argument(
+        "--patience",
+        type=int,
+        default=PATIENCE,
+        help="stop test after given number of iterations without improvement "
+        "(default: no limit)",
+    )
+    parser.add_argument(
+        "--heuristic-len",
+        type=float,
+        default=HEURISTIC_RESULT_PUBS_LEN,
+        help="heuristic number of publications to publish divided by number of "
+        "publications (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-s",
+        "--seed",
+        type=int,
+        default=SEED,
+        help="base seed of experiment (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=WORKERS,
+        help="number of processes (default: all cores)",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=int,
+        default=WORKER_MEMORY_LIMIT,
+        help="maximal size of worker's memory in bytes (default: no limit)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="measure time of algorithm's phases and save profiling report next "
+        "to every result file",
+    )
+    parser.add_argument(
+        "--profile-iteration",
+        type=int,
+        default=None,
+        help="profile given iteration of every test with cProfile (implies "
+        "--profile)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=[SPARSE_RESULTS, DENSE_RESULTS],
+        default=RESULTS_FORMAT,
+        help="format of result files (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-o",
+        "--results-dir",
+        default=RESULTS_DIR,
+        help="directory to store results (default: %(default)s)",
+    )
+
+    args = parser.parse_args(argv)
+    for name in ["tests", "tries", "workers", "patience"]:
+        if getattr(args, name) is not None and getattr(args, name) < 1:
+            parser.error(f"argument --{name}: must be positive")
+    if args.time_limit is not None and args.time_limit <= 0:
+        parser.error("argument --time-limit: must be positive")
+    if args.max_evaluations is not None and args.max_evaluations < 0:
+        parser.error("argument --max-evaluations: must not be negative")
+    if not 0 <= args.alpha <= 1:
+        parser.error("argument --alpha: must be between 0 and 1")
+    return args
+
+
+def main(argv: List[str] = None) -> dict:
+    args = parse_args(argv)
+    jobs = create_all_jobs(
+        args.seed,
+        args.modes,
+        args.auth_pubs_num,
+        args.tests,
+        args.tries,
+        args.thresholds,
+        args.alpha,
+        args.heuristic_len,
+    )
+    if args.profile or args.profile_iteration is not None:
+        jobs = [
+            job._replace(profile=True, profiled_iteration=args.profile_iteration)
+            for job in jobs
+        ]
+    jobs = [
+        job._replace(
+            time_limit=args.time_limit,
+            max_evaluations=args.max_evaluations,
+            patience=args.patience,
+        )
+        for job in jobs
+    ]
+
+    manifest = run_batch(
+        expand_input_patterns(args.inputs),
+        jobs,
+        args.results_dir,
+        args.workers,
+        args.memory_limit,
+        args.format,
+    )
+
+    for department in manifest["departments"]:
+        print(department["file"])
+        for mode, val in department["best_goal_by_mode"].items():
+            print(f"{mode}: {val}")
+        for reason, count in department["stop_reasons"].items():
+            print(f"stopped by {reason}: {count}")
+        for error in department["errors"]:
+            print(error)
+        print()
+    return manifest
+
+
+if __name__ == "__main__":
+    main()
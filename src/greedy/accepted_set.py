@@ -0,0 +1,90 @@
+from typing import List
+
+import numpy as np
+
+from src.greedy.publications_table import PublicationsTable
+
+
+class AcceptedSet:
+    """
+    Publications accepted during the run, kept between iterations of the
+    algorithm as arrays indexed by ranks. Accepting and cancelling publications
+    changes only their elements and sums of their authors' contributions, so
+    accepted publications are not read from authors again in every iteration.
+    Authors are updated once, by sync().
+
+    Sums of authors' contributions are updated by the same additions and
+    subtractions (in the same order) as Author does, so they are exactly equal
+    to sums that authors would have.
+    """
+
+    __slots__ = ("table", "is_accepted", "order", "authors_sums", "_next_order")
+
+    def __init__(self, table: PublicationsTable):
+        """
+        Creates set of publications currently accepted by authors of the table.
+        """
+        self.table = table
+        accepted = [
+            pub
+            for author in table.authors
+            for pub in author.get_accepted_publications()
+        ]
+        ranks = table.get_ranks(accepted)
+
+        self.is_accepted = np.zeros(len(table), dtype=bool)
+        self.is_accepted[ranks] = True
+        # Number of acceptance of publication (defines order of accepted
+        # publications of single author)
+        self.order = np.zeros(len(table), dtype=np.int64)
+        self.order[ranks] = np.arange(len(ranks))
+        self._next_order = len(ranks)
+        self.authors_sums = table.get_authors_contrib_sums()
+
+    def get_ranks(self) -> np.ndarray:
+        """
+        Returns ranks of accepted publications in the same order as
+        get_all_accepted_publications() (by author, then by acceptance).
+        """
+        ranks = np.flatnonzero(self.is_accepted)
+        return ranks[np.lexsort((self.order[ranks], self.table.author_idx[ranks]))]
+
+    def get_candidates(self) -> np.ndarray:
+        """
+        Returns ranks of publications that are not accepted (in ranking order).
+        """
+        return np.flatnonzero(~self.is_accepted)
+
+    def accept(self, ranks: List[int]) -> None:
+        """
+        Accepts publications in given order. Publications must meet author's
+        limits, they are not checked.
+        """
+        contribs = self.table.contribs[ranks].tolist()
+        authors_idx = self.table.author_idx[ranks].tolist()
+        for auth_idx, contrib in zip(authors_idx, contribs):
+            self.authors_sums[auth_idx] += contrib
+
+        self.is_accepted[ranks] = True
+        self.order[ranks] = np.arange(self._next_order, self._next_order + len(ranks))
+        self._next_order += len(ranks)
+
+    def cancel(self, ranks: List[int]) -> None:
+        """
+        Cancels accepted publications in given order.
+        """
+        contribs = self.table.contribs[ranks].tolist()
+        authors_idx = self.table.author_idx[ranks].tolist()
+        for auth_idx, contrib in zip(authors_idx, contribs):
+            self.authors_sums[auth_idx] -= contrib
+        self.is_accepted[ranks] = False
+
+    def sync(self) -> None:
+        """
+        Updates authors, so their accepted publications are publications from the
+        set (accepted in the same order).
+        """
+        for author in self.table.authors:
+            author.reset_accepted_publications()
+        for pub in self.table.get_publications(self.get_ranks().tolist()):
+            pub.get_author().accept_publication(pub)
@@ -1,3 +1,5 @@
+from typing import List, Tuple
+
 from src.greedy.publication import Publication
 from src.greedy.tools import compare_lists
 
@@ -24,6 +26,7 @@ class Author:
         self.publications = []
         self.__publications_to_considerate_sum = None
 
+        # accepted publications indexed by publication's id (in acceptance order)
         self.accepted_publications = []
         self.__accepted_pubs_contrib_sum = 0
         self.__accepted_mons_contrib_sum = 0
@@ -41,8 +44,29 @@ class Author:
             and compare_lists(self.publications, other.publications)
         )
 
+    @property
+    def publications(self) -> List[Publication]:
+        return self.__publications
+
+    @publications.setter
+    def publications(self, publications: List[Publication]) -> None:
+        self.__publications = publications
+        self.__publications_ids = {pub.get_id() for pub in publications}
+
+    @property
+    def accepted_publications(self) -> Tuple[Publication, ...]:
+        # Read-only snapshot cached until accepted publications change
+        if self.__accepted_tuple is None:
+            self.__accepted_tuple = tuple(self.__accepted.values())
+        return self.__accepted_tuple
+
+    @accepted_publications.setter
+    def accepted_publications(self, publications: List[Publication]) -> None:
+        self.__accepted = {pub.get_id(): pub for pub in publications}
+        self.__accepted_tuple = None
+
     def __check_if_publication_is_on_publications_list(self, pub: Publication):
-        if pub not in self.publications:
+        if pub.get_id() not in self.__publications_ids:
             raise AttributeError(f"Publication {pub} not in publications list")
 
     def __update_contribution(contribution: float):
@@ -85,15 +109,25 @@ class Author:
             if not self.accept_publication(pub):
                 pub.set_is_accepted(False)
 
+    def reset_accepted_publications(self) -> None:
+        """
+        Cancels all accepted publications, so author can be reused in next run.
+        """
+        for pub in self.publications:
+            pub.set_is_accepted(False)
+        self.accepted_publications = []
+        self.__accepted_pubs_contrib_sum = 0
+        self.__accepted_mons_contrib_sum = 0
+
     def get_pubs_to_considerate(self):
-        pubs = list(
-            filter(lambda x: x not in self.accepted_publications, self.publications)
-        )
-        return pubs
+        return [pub for pub in self.publications if pub.get_id() not in self.__accepted]
 
     def get_accepted_publications(self):
         return self.accepted_publications
 
+    def get_accepted_pubs_contrib_sum(self):
+        return self.__accepted_pubs_contrib_sum
+
     def __check_limits(self, pub: Publication) -> bool:
         return (
             self.__accepted_pubs_contrib_sum + pub.get_contribution()
@@ -137,8 +171,9 @@ class Author:
     def accept_publication(self, pub: Publication) -> bool:
         self.__check_if_publication_is_on_publications_list(pub)
 
-        if pub not in self.accepted_publications and self.__check_limits(pub):
-            self.accepted_publications.append(pub)
+        if pub.get_id() not in self.__accepted and self.__check_limits(pub):
+            self.__accepted[pub.get_id()] = pub
+            self.__accepted_tuple = None
             pub.set_is_accepted(True)
             self.__accepted_pubs_contrib_sum += pub.get_contribution()
             if pub.is_monograph():
@@ -151,4 +186,5 @@ class Author:
         self.__accepted_pubs_contrib_sum -= pub.get_contribution()
         if pub.is_monograph():
             self.__accepted_mons_contrib_sum -= pub.get_contribution()
-        self.accepted_publications.remove(pub)
+        del self.__accepted[pub.get_id()]
+        self.__accepted_tuple = None
@@ -0,0 +1,272 @@
+import json
+import multiprocessing
+import os
+import resource
+import time
+import traceback
+from itertools import groupby
+from typing import Iterator, List, NamedTuple
+
+from src.greedy.data_preparation import normalize_data
+from src.greedy.dataset import load_input
+from src.greedy.results_store import append_rows, create_run_id
+from src.greedy.runner import (
+    Job,
+    JobResult,
+    get_store_rows,
+    init_worker,
+    run_job,
+    save_job_result,
+)
+from src.greedy.settings import (
+    EMPLOYEES_NUM,
+    MANIFEST_FILE,
+    PUBLICATIONS_NUM,
+    RESULTS_FORMAT,
+    RESULTS_STORE_FILE,
+)
+
+# Modules imported by fork server before it forks workers. Workers do not inherit
+# memory of the main process, so their peak RSS is peak of single department.
+PRELOADED_MODULES = ["numpy", "src.greedy.batch"]
+
+
+class BatchJob(NamedTuple):
+    filepath: str
+    job: Job
+
+
+class BatchJobResult(NamedTuple):
+    batch_job: BatchJob
+    result: JobResult
+    error: str
+    start: float
+    end: float
+    cpu_time: float
+    peak_rss_kb: int
+
+
+def load_department(filepath: str) -> dict:
+    return normalize_data(load_input(filepath))
+
+
+def init_batch_worker(memory_limit: int = None) -> None:
+    """
+    Limits address space of worker process, so single department can not use
+    all memory of the machine.
+
+    Args:
+        memory_limit: maximal size of worker's memory in bytes (no limit if None)
+
+    """
+    if memory_limit:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+
+def split_batch_jobs(
+    batch_jobs: List[BatchJob], chunks_num: int
+) -> List[List[BatchJob]]:
+    """
+    Splits tests of every department into at most chunks_num chunks of similar
+    size (consecutive tests of the same department), so all workers can run tests
+    of the biggest department at once.
+
+    Args:
+        batch_jobs: tests (tests of single department are consecutive)
+        chunks_num: maximal number of chunks of single department
+
+    Returns:
+        chunks in the same order as batch_jobs
+
+    """
+    chunks = []
+    for _, group in groupby(batch_jobs, key=lambda batch_job: batch_job.filepath):
+        group = list(group)
+        size = -(-len(group) // chunks_num)
+        chunks += [group[idx : idx + size] for idx in range(0, len(group), size)]
+    return chunks
+
+
+def run_batch_chunk(chunk: List[BatchJob]) -> List[BatchJobResult]:
+    """
+    Runs chunk of tests of single department in new worker process (see
+    run_batch_jobs()). Department is loaded and its problem instance is built
+    once for the whole chunk. Time of loading is counted to the first test.
+    Exceptions are not raised, they are returned with results, so one broken
+    test does not stop whole batch.
+    """
+    start, cpu_start = time.time(), time.process_time()
+    try:
+        init_worker(load_department(chunk[0].filepath))
+        load_error = None
+    except Exception:
+        load_error = traceback.format_exc()
+
+    results = []
+    for batch_job in chunk:
+        result, error = None, load_error
+        if load_error is None:
+            try:
+                result = run_job(batch_job.job)
+            except Exception:
+                error = traceback.format_exc()
+
+        end, cpu_end = time.time(), time.process_time()
+        peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        results.append(
+            BatchJobResult(
+                batch_job, result, error, start, end, cpu_end - cpu_start, peak_rss_kb
+            )
+        )
+        start, cpu_start = end, cpu_end
+    return results
+
+
+def run_batch_jobs(
+    batch_jobs: List[BatchJob], workers: int = None, memory_limit: int = None
+) -> Iterator[BatchJobResult]:
+    """
+    Runs tests of many departments in one pool of processes. Tests are run in
+    chunks (see split_batch_jobs()), every chunk runs in new process forked from
+    fork server, so peak RSS of test is not mixed with other departments (also
+    when workers is 1).
+
+    Returns:
+        Iterator over results in the same order as batch_jobs
+
+    """
+    workers = workers or os.cpu_count()
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(PRELOADED_MODULES)
+    with context.Pool(
+        workers, init_batch_worker, (memory_limit,), maxtasksperchild=1
+    ) as pool:
+        for results in pool.imap(
+            run_batch_chunk, split_batch_jobs(batch_jobs, workers)
+        ):
+            yield from results
+
+
+def create_department_info(filepath: str) -> dict:
+    return {
+        "file": filepath,
+        "authors": None,
+        "publications": None,
+        "size": None,
+        "jobs": 0,
+        "failed_jobs": 0,
+        "wall_time": None,
+        "cpu_time": 0.0,
+        "peak_rss_kb": 0,
+        "best_goal": None,
+        "best_goal_by_mode": {},
+        "stop_reasons": {},
+        "errors": [],
+    }
+
+
+def update_department_info(info: dict, result: BatchJobResult) -> None:
+    info["jobs"] += 1
+    info["cpu_time"] += result.cpu_time
+    info["peak_rss_kb"] = max(info["peak_rss_kb"], result.peak_rss_kb)
+    info["first_start"] = min(info.get("first_start", result.start), result.start)
+    info["last_end"] = max(info.get("last_end", result.end), result.end)
+
+    if result.error:
+        info["failed_jobs"] += 1
+        info["errors"].append(result.error)
+        return
+
+    goal_fun = float(result.result.goal_fun)
+    mode = str(result.batch_job.job.mode)
+    info["best_goal"] = max(info["best_goal"] or 0, goal_fun)
+    info["best_goal_by_mode"][mode] = max(
+        info["best_goal_by_mode"].get(mode, 0), goal_fun
+    )
+    reason = result.result.stop_reason
+    info["stop_reasons"][reason] = info["stop_reasons"].get(reason, 0) + 1
+
+
+def run_batch(
+    files: List[str],
+    jobs: List[Job],
+    results_dir: str,
+    workers: int = None,
+    memory_limit: int = None,
+    results_format: str = RESULTS_FORMAT,
+) -> dict:
+    """
+    Runs the same tests for every department. Tests of all departments are run in
+    one pool of processes, departments with the biggest A x P are started first.
+    Results are saved in results_dir (and appended to results store
+    results_dir/RESULTS_STORE_FILE) and run manifest (wall time, peak RSS, best
+    goal function value and reasons of stopping tests for every department) is
+    saved in results_dir/MANIFEST_FILE.
+
+    Args:
+        files: paths to input files
+        jobs: tests to run for every department
+        results_dir: directory to store results
+        workers: number of processes (all cores if None)
+        memory_limit: maximal size of worker's memory in bytes
+        results_format: format of result files (SPARSE_RESULTS or DENSE_RESULTS)
+
+    Returns:
+        run manifest
+
+    """
+    started = time.time()
+    os.makedirs(results_dir, exist_ok=True)
+    store_path = os.path.join(results_dir, RESULTS_STORE_FILE)
+    run_id = create_run_id()
+
+    departments = {}
+    data_by_file = {}
+    for filepath in files:
+        info = create_department_info(filepath)
+        departments[filepath] = info
+        try:
+            data = load_department(filepath)
+        except Exception:
+            info["errors"].append(traceback.format_exc())
+            continue
+        data_by_file[filepath] = data
+        info["authors"] = int(data[EMPLOYEES_NUM])
+        info["publications"] = int(data[PUBLICATIONS_NUM])
+        info["size"] = info["authors"] * info["publications"]
+
+    order = sorted(
+        data_by_file, key=lambda path: departments[path]["size"], reverse=True
+    )
+    batch_jobs = [BatchJob(filepath, job) for filepath in order for job in jobs]
+
+    for result in run_batch_jobs(batch_jobs, workers, memory_limit):
+        filepath = result.batch_job.filepath
+        update_department_info(departments[filepath], result)
+        if result.result:
+            path = save_job_result(
+                result.result,
+                data_by_file[filepath],
+                filepath,
+                results_dir,
+                results_format,
+            )
+            append_rows(
+                store_path, get_store_rows(result.result, filepath, path, run_id)
+            )
+
+    for info in departments.values():
+        if "first_start" in info:
+            info["wall_time"] = info.pop("last_end") - info.pop("first_start")
+
+    manifest = {
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started)),
+        "wall_time": time.time() - started,
+        "workers": workers or os.cpu_count(),
+        "memory_limit": memory_limit,
+        "departments": [departments[path] for path in order]
+        + [info for path, info in departments.items() if path not in order],
+    }
+    with open(os.path.join(results_dir, MANIFEST_FILE), "w") as file:
+        json.dump(manifest, file, indent=4)
+    return manifest
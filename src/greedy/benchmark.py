@@ -0,0 +1,322 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+import numpy as np
+
+from src.greedy.accepted_set import AcceptedSet
+from src.greedy.data_preparation import (
+    get_initial_publications,
+    normalize_data,
+    prepare_authors_and_their_publications,
+)
+from src.greedy.dataset import get_dataset_path, load_input
+from src.greedy.greedy import (
+    choose_publications_to_publish,
+    choose_publications_to_publish_cached,
+    choose_publications_to_publish_vectorized,
+    get_all_accepted_publications,
+    run_algorithm,
+)
+from src.greedy.instance import ProblemInstance
+from src.greedy.output_converter import (
+    convert_pairs_to_vector,
+    get_department_name,
+    save_results,
+    save_sparse_results,
+)
+from src.greedy.ranking import get_ranked_publications_to_considerate
+from src.greedy.search_state import SearchState
+from src.greedy.settings import (
+    BENCHMARK_REPEAT,
+    BENCHMARK_THRESHOLDS,
+    BENCHMARK_TIME_RESOLUTION,
+    BENCHMARK_TOLERANCE,
+    CACHED_ENGINE,
+    DENSE_RESULTS,
+    EMPLOYEES_NUM,
+    ENGINE,
+    HEURISTIC_RESULT_PUBS_LEN,
+    INITIAL_PUBS,
+    NUMPY_ENGINE,
+    PUBLICATIONS_NUM,
+    RESULTS_FORMAT,
+    SEED,
+)
+
+# Stages timed for every input file (in order of the pipeline)
+STAGES = [
+    "load_input",
+    "load_input_cached",
+    "normalize_data",
+    "prepare_authors_and_their_publications",
+    "choose_publications_to_publish",
+    "run_algorithm",
+    "save_results",
+]
+
+# Metrics of stages compared with baseline
+METRICS = ["time", "peak_memory_kb"]
+
+
+def measure(
+    func: Callable[..., Any], setup: Callable[[], tuple] = tuple, repeat: int = 1
+) -> Tuple[Any, dict]:
+    """
+    Measures the best time of func out of repeat calls and its peak memory.
+    Memory is traced in one additional call, so tracing does not slow down timed
+    calls.
+
+    Args:
+        func: measured function
+        setup: returns arguments of func. It is called before every call of func
+            and is not measured
+        repeat: number of timed calls
+
+    Returns:
+        value returned by the last call of func and dictionary with time (in
+        seconds) and peak memory (in kilobytes)
+
+    """
+    times = []
+    for _ in range(repeat):
+        args = setup()
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+
+    args = setup()
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, {"time": min(times), "peak_memory_kb": peak / 1024}
+
+
+def measure_load_input(
+    filepath: str, directory: str, repeat: int = 1
+) -> Tuple[dict, dict, dict]:
+    """
+    Measures load_input() on copy of input file: without dataset file (it is
+    removed before every call, so input file is parsed and dataset file is
+    compiled) and with dataset file compiled by the previous call. Dataset file
+    given instead of input file is loaded the same way in both cases.
+
+    Args:
+        filepath: path to the input file or dataset file
+        directory: directory of the copy (it has to exist as long as returned
+            data is used, arrays of dataset file are memory-mapped)
+        repeat: number of timed calls
+
+    Returns:
+        data loaded from dataset file, measurements without and with dataset file
+
+    """
+    path = os.path.join(directory, os.path.basename(filepath))
+    shutil.copyfile(filepath, path)
+    dataset_path = get_dataset_path(path)
+
+    def remove_dataset() -> tuple:
+        if dataset_path != path and os.path.exists(dataset_path):
+            os.remove(dataset_path)
+        return (path,)
+
+    _, cold = measure(load_input, remove_dataset, repeat)
+    data, cached = measure(load_input, lambda: (path,), repeat)
+    return data, cold, cached
+
+
+def count_evaluations_per_second(stage: dict, evaluations: int) -> None:
+    stage["evaluations"] = evaluations
+    stage["evaluations_per_second"] = evaluations / stage["time"]
+
+
+def benchmark_file(
+    filepath: str,
+    repeat: int = BENCHMARK_REPEAT,
+    thresholds: List[int] = BENCHMARK_THRESHOLDS,
+    engine: str = ENGINE,
+    results_format: str = RESULTS_FORMAT,
+) -> dict:
+    """
+    Times stages of the pipeline on single input file. Search starts from empty
+    result (mode 0), so every run of the algorithm does the same work. Goal
+    function evaluations per second are counted for stages that search.
+    Input file is loaded without and with its dataset file (see
+    measure_load_input()). The next stages read data loaded from dataset file
+    (arrays are memory-mapped), as in runs with compiled dataset. Dataset files
+    (ex. generated ones) can be benchmarked too.
+
+    Args:
+        filepath: path to the input file or dataset file
+        repeat: number of timed calls of every stage
+        thresholds: thresholds of benchmarked run of the algorithm (the last one
+            is its fixed budget of full iterations)
+        engine: implementation of choosing publications to publish
+        results_format: format of saved result file
+
+    Returns:
+        dictionary with size of department and time, peak memory (and number of
+        evaluations) of every stage
+
+    """
+    # copy of input file, so its dataset file is compiled outside data directory
+    with tempfile.TemporaryDirectory() as input_dir:
+        stages = {}
+        raw_data, stages["load_input"], stages["load_input_cached"] = (
+            measure_load_input(filepath, input_dir, repeat)
+        )
+        data, stages["normalize_data"] = measure(
+            normalize_data, lambda: (dict(raw_data),), repeat
+        )
+        data[INITIAL_PUBS] = get_initial_publications(0, data)
+        _, stages["prepare_authors_and_their_publications"] = measure(
+            prepare_authors_and_their_publications, lambda: (data,), repeat
+        )
+
+        instance = ProblemInstance(data)
+        heur_pubs = int(data[PUBLICATIONS_NUM] * HEURISTIC_RESULT_PUBS_LEN)
+
+        def reset() -> tuple:
+            instance.reset(instance.get_initial_publications(0))
+            return (SearchState(),)
+
+        def choose(state: SearchState) -> SearchState:
+            if engine == CACHED_ENGINE:
+                accepted_set = AcceptedSet(instance.table)
+                choose_publications_to_publish_cached(
+                    accepted_set, data, heur_pubs, state
+                )
+                return state
+
+            accepted = get_all_accepted_publications(instance.authors)
+            if engine == NUMPY_ENGINE:
+                choose_publications_to_publish_vectorized(
+                    instance.table, accepted, data, heur_pubs, state
+                )
+            else:
+                pubs = get_ranked_publications_to_considerate(instance.ranking)
+                choose_publications_to_publish(pubs, accepted, data, heur_pubs, state)
+            return state
+
+        def run(state: SearchState) -> SearchState:
+            rng = np.random.default_rng(SEED)
+            run_algorithm(data, heur_pubs, engine, rng, instance, state, thresholds)
+            return state
+
+        state, stages["choose_publications_to_publish"] = measure(choose, reset, repeat)
+        count_evaluations_per_second(
+            stages["choose_publications_to_publish"], state.goal_calculations_num
+        )
+        state, stages["run_algorithm"] = measure(run, reset, repeat)
+        count_evaluations_per_second(
+            stages["run_algorithm"], state.goal_calculations_num
+        )
+
+        pairs = instance.get_pairs(state.best_ranks).tolist()
+        shape = (int(data[EMPLOYEES_NUM]), int(data[PUBLICATIONS_NUM]))
+        summary = {"threshold_goal_values": state.threshold_goal_values}
+
+        def save(path: str) -> None:
+            if results_format == DENSE_RESULTS:
+                vector = convert_pairs_to_vector(pairs, data)
+                save_results(path, summary, state.best_goal_fun, vector)
+            else:
+                save_sparse_results(path, summary, state.best_goal_fun, pairs, shape)
+
+        with tempfile.TemporaryDirectory() as results_dir:
+            path = os.path.join(results_dir, "result.txt")
+            _, stages["save_results"] = measure(save, lambda: (path,), repeat)
+
+    return {
+        "file": filepath,
+        "authors": shape[0],
+        "publications": shape[1],
+        "pairs": instance.auth_pub_pairs_num,
+        "stages": stages,
+    }
+
+
+def run_benchmarks(
+    files: List[str],
+    repeat: int = BENCHMARK_REPEAT,
+    thresholds: List[int] = BENCHMARK_THRESHOLDS,
+    engine: str = ENGINE,
+    results_format: str = RESULTS_FORMAT,
+) -> dict:
+    """
+    Benchmarks every input file (one by one, so files do not compete for CPU).
+
+    Returns:
+        benchmark report with parameters and results of every department
+
+    """
+    return {
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "repeat": repeat,
+        "thresholds": list(thresholds),
+        "engine": engine,
+        "results_format": results_format,
+        "departments": {
+            get_department_name(filepath): benchmark_file(
+                filepath, repeat, thresholds, engine, results_format
+            )
+            for filepath in files
+        },
+    }
+
+
+def compare_with_baseline(
+    report: dict, baseline: dict, tolerance: float = BENCHMARK_TOLERANCE
+) -> List[str]:
+    """
+    Compares metrics of stages with baseline report. Ratios of metrics to
+    baseline are added to stages of report. Metric regressed if it is greater than
+    baseline by more than tolerance (and, for time, by more than
+    BENCHMARK_TIME_RESOLUTION). Departments and stages missing in baseline are
+    skipped.
+
+    Args:
+        report: current benchmark report
+        baseline: benchmark report saved earlier
+        tolerance: allowed relative increase of metric
+
+    Returns:
+        descriptions of regressions
+
+    """
+    regressions = []
+    for name, department in report["departments"].items():
+        base_stages = baseline["departments"].get(name, {}).get("stages", {})
+        for stage_name, stage in department["stages"].items():
+            base_stage = base_stages.get(stage_name)
+            if not base_stage:
+                continue
+            for metric in METRICS:
+                value, base_value = stage[metric], base_stage[metric]
+                stage[f"{metric}_ratio"] = value / base_value if base_value else None
+                if value <= base_value * (1 + tolerance):
+                    continue
+                if metric == "time" and value - base_value <= BENCHMARK_TIME_RESOLUTION:
+                    continue
+                regressions.append(
+                    f"{name}: {stage_name} {metric} {value:.4g} "
+                    f"(baseline {base_value:.4g})"
+                )
+    return regressions
+
+
+def load_report(path: str) -> dict:
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def save_report(path: str, report: dict) -> None:
+    with open(path, "w") as file:
+        json.dump(report, file, indent=4)
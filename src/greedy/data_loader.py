@@ -1,6 +1,13 @@
 import ast
 import re
-from typing import Any, List
+from typing import Any, Iterator, List, TextIO, Tuple
+
+import numpy as np
+
+from src.greedy.sparse_matrix import SparseMatrix
+
+# Number of characters read from input file at once by streaming loader
+CHUNK_SIZE = 1 << 16
 
 
 # TODO: change pattern
@@ -80,3 +87,119 @@ def load_data(
         pattern = get_list_of_strings_pattern()
         result.update(extract_vars(data, string_list_vars, pattern))
     return result
+
+
+def iter_statements(
+    file: TextIO, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Tuple[str, str]]:
+    """
+    Reads file incrementally and yields `name = value;` statements one by one.
+    Only currently parsed statement is kept in memory.
+
+    Args:
+        file: opened text file with input data
+        chunk_size: number of characters read at once
+
+    Returns:
+        Iterator over pairs (variable name, raw value)
+
+    """
+    pending = []
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        *statements, rest = chunk.split(";")
+        for statement in statements:
+            pending.append(statement)
+            name, _, value = "".join(pending).partition("=")
+            pending = []
+            yield name.strip(), value.strip()
+        pending.append(rest)
+
+    if "".join(pending).strip():
+        raise ValueError("Input data ends with unterminated statement")
+
+
+def is_float_literal(raw: str) -> bool:
+    return "." in raw or "e" in raw or "E" in raw
+
+
+def parse_number(raw: str) -> Any:
+    return float(raw) if is_float_literal(raw) else int(raw)
+
+
+def parse_list_of_strings(raw: str) -> List[str]:
+    inner = raw[1:-1].strip()
+    if not inner:
+        return []
+    return [item.strip().strip('"') for item in inner.split(",")]
+
+
+def parse_list_of_numbers(raw: str) -> np.ndarray:
+    dtype = float if is_float_literal(raw) else int
+    if not raw[1:-1].strip():
+        return np.array([], dtype=dtype)
+    return np.fromstring(raw[1:-1], dtype=dtype, sep=",")
+
+
+def iter_nested_list_rows(raw: str) -> Iterator[np.ndarray]:
+    for row in raw[1:-1].split("]"):
+        start = row.find("[")
+        if start >= 0:
+            yield np.fromstring(row[start + 1 :], dtype=float, sep=",")
+
+
+def parse_nested_list_of_numbers(raw: str) -> SparseMatrix:
+    rows = list(iter_nested_list_rows(raw))
+    columns = len(rows[0]) if rows else 0
+    return SparseMatrix.from_rows(rows, columns)
+
+
+def parse_value(raw: str) -> Any:
+    """
+    Converts raw value of statement to python object. Numbers are parsed straight
+    into numpy arrays.
+
+    Args:
+        raw: value of statement, ex. `12`, `[0.5, 1.0]`, `["a", "b"]`
+
+    Returns:
+        number, list of strings, 1-D array or sparse matrix (for nested lists)
+
+    """
+    if raw.startswith("[["):
+        return parse_nested_list_of_numbers(raw)
+    if raw.startswith("[") and '"' in raw:
+        return parse_list_of_strings(raw)
+    if raw.startswith("["):
+        return parse_list_of_numbers(raw)
+    return parse_number(raw)
+
+
+def load_data_from_file(filepath: str, variables: List[str] = None) -> dict:
+    """
+    Loads variables from input file in single pass. Unlike load_data(), file is
+    not read as a whole and values are not parsed with regex and literal_eval.
+
+    Args:
+        filepath: path to the input file
+        variables: names of variables to load. If None, all variables are loaded
+
+    Returns:
+        Dictionary with variables and their values.
+
+    Raises:
+        ValueError if any of given variables is not found in file
+
+    """
+    result = {}
+    with open(filepath, "r") as file:
+        for name, raw in iter_statements(file):
+            if variables is None or name in variables:
+                result[name] = parse_value(raw)
+
+    for var in variables or []:
+        if var not in result:
+            raise ValueError(f"Variable {var} not found in file {filepath}")
+    return result
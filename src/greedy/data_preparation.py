@@ -1,3 +1,4 @@
+from functools import partial
 from typing import List
 
 import numpy as np
@@ -19,6 +20,7 @@ from src.greedy.settings import (
     PUBLICATION_POINTS_FOR_AUTHOR,
     PUBLICATIONS_NUM,
 )
+from src.greedy.sparse_matrix import SparseMatrix, as_sparse, get_common_nonzero
 
 
 def normalize_data(data: dict):
@@ -108,6 +110,42 @@ def create_publications_list(
     return result
 
 
+def create_author_publications(
+    data: dict,
+    points: SparseMatrix,
+    contribs: SparseMatrix,
+    idx: int,
+    init: List[int] = None,
+) -> List[Publication]:
+    """
+    Creates publications list for single author from sparse matrices. Only
+    (author, publication) pairs with positive points and contribution are visited.
+
+    Args:
+        data: dictionary with keys PUBLICATION_ID and IS_MONOGRAPH
+        points: publications' points for authors
+        contribs: publications' contributions for authors
+        idx: author's index
+        init: defines author's publications included in initial result
+
+    Returns:
+        List of publications sorted by publication index
+
+    """
+    pubs_ids = data[PUBLICATION_ID]
+    mons = data[IS_MONOGRAPH]
+    pubs_idx, pts, ctbs = get_common_nonzero(points, contribs, idx)
+
+    result = []
+    for pub_idx, pub_pts, contrib in zip(pubs_idx, pts.tolist(), ctbs.tolist()):
+        is_mon = False if mons[pub_idx] == 0 else True
+        ini = False if init is None or init[pub_idx] == 0 else True
+        result.append(
+            Publication(pubs_ids[pub_idx], is_mon, pub_pts, contrib, None, ini)
+        )
+    return result
+
+
 def prepare_publications(authors: List[Author], data: dict) -> None:
     """
     Prepares lists of publications, attaches them to authors and creates ranking of
@@ -118,23 +156,21 @@ def prepare_publications(authors: List[Author], data: dict) -> None:
         data: dictionary with keys:
             PUBLICATION_ID: list of publications' ids
             IS_MONOGRAPH: list that defines which publications are monographs
-            PUBLICATION_POINTS_FOR_AUTHOR: list of lists. Each list contains
-                publications' points for single author
-            PUBLICATION_CONTRIB_FOR_AUTHOR: list of lists. Each list contains
-                publications' contributions for single author
+            PUBLICATION_POINTS_FOR_AUTHOR: sparse matrix (or list of lists). Each
+                row contains publications' points for single author
+            PUBLICATION_CONTRIB_FOR_AUTHOR: sparse matrix (or list of lists). Each
+                row contains publications' contributions for single author
             INITIAL_PUBS: list of lists. Each list defines author's publications
                 included in initial result
             All keys are defined in settings.py
 
     """
-    pubs_ids = data[PUBLICATION_ID]
-    mons = data[IS_MONOGRAPH]
+    points = as_sparse(data[PUBLICATION_POINTS_FOR_AUTHOR])
+    contribs = as_sparse(data[PUBLICATION_CONTRIB_FOR_AUTHOR])
 
     for idx, author in enumerate(authors, 0):
-        auth_pubs = data[PUBLICATION_POINTS_FOR_AUTHOR][idx]
-        auth_contrs = data[PUBLICATION_CONTRIB_FOR_AUTHOR][idx]
         init = data[INITIAL_PUBS][idx]
-        pubs = create_publications_list(pubs_ids, mons, auth_pubs, auth_contrs, init)
+        pubs = create_author_publications(data, points, contribs, idx, init)
         author.load_publications(pubs)
 
     return authors
@@ -169,15 +205,12 @@ def get_full_choosen_pubs_list(data: dict) -> List[List[int]]:
 
     """
     publications = get_empty_vector(data[EMPLOYEES_NUM], data[PUBLICATIONS_NUM])
+    points = as_sparse(data[PUBLICATION_POINTS_FOR_AUTHOR])
+    contribs = as_sparse(data[PUBLICATION_CONTRIB_FOR_AUTHOR])
 
-    rows = len(data[PUBLICATION_POINTS_FOR_AUTHOR])
-    columns = len(data[PUBLICATION_POINTS_FOR_AUTHOR][0])
-    for row in range(rows):
-        for column in range(columns):
-            points = data[PUBLICATION_POINTS_FOR_AUTHOR][row][column]
-            contrib = data[PUBLICATION_CONTRIB_FOR_AUTHOR][row][column]
-            if points != 0 and contrib != 0:
-                publications[row][column] += 1
+    for row in range(len(points)):
+        for column in get_common_nonzero(points, contribs, row)[0]:
+            publications[row][column] += 1
 
     return publications
 
@@ -199,40 +232,59 @@ def get_choosen_pubs(data: dict, auth_pubs_num: int, shuffle) -> List[List[int]]
     """
     publications = get_empty_vector(data[EMPLOYEES_NUM], data[PUBLICATIONS_NUM])
     publications_idx_map = get_idx_map(data, PUBLICATION_ID)
-    pubs_ids = data[PUBLICATION_ID]
-    mons = data[IS_MONOGRAPH]
+    points = as_sparse(data[PUBLICATION_POINTS_FOR_AUTHOR])
+    contribs = as_sparse(data[PUBLICATION_CONTRIB_FOR_AUTHOR])
 
-    for auth in range(len(data[PUBLICATION_POINTS_FOR_AUTHOR])):
-        auth_pubs = data[PUBLICATION_POINTS_FOR_AUTHOR][auth]
-        auth_contribs = data[PUBLICATION_CONTRIB_FOR_AUTHOR][auth]
-        pubs = create_publications_list(pubs_ids, mons, auth_pubs, auth_contribs)
-        pubs = shuffle(pubs)
-
-        contrib_sum = 0
-        choosen_pubs = 0
-        for pub in pubs:
-            if choosen_pubs >= auth_pubs_num:
-                break
-            if pub.get_contribution() + contrib_sum <= 4:
-                pub_idx = publications_idx_map[pub.get_id()]
-                contrib_sum += pub.get_contribution()
-                publications[auth][pub_idx] += 1
-                choosen_pubs += 1
+    for auth in range(len(points)):
+        pubs = shuffle(create_author_publications(data, points, contribs, auth))
+        for pub in choose_first_publications(pubs, auth_pubs_num):
+            publications[auth][publications_idx_map[pub.get_id()]] += 1
     return publications
 
 
+def choose_first_publications(
+    pubs: List[Publication], auth_pubs_num: int
+) -> List[Publication]:
+    """
+    Chooses first auth_pubs_num publications of single author which contributions
+    sum does not exceed 4.
+
+    Args:
+        pubs: author's publications (sorted or shuffled)
+        auth_pubs_num: number of publications choosen for author
+
+    Returns:
+        list of choosen publications
+
+    """
+    result = []
+    contrib_sum = 0
+    for pub in pubs:
+        if len(result) >= auth_pubs_num:
+            break
+        if pub.get_contribution() + contrib_sum <= 4:
+            contrib_sum += pub.get_contribution()
+            result.append(pub)
+    return result
+
+
 def sort_pubs(pubs: List[Publication]) -> List[Publication]:
     result = sorted(pubs, key=lambda pub: get_temporary_pub_rate(pub), reverse=True)
     return result
 
 
-def shuffle_pubs(pubs: List[Publication]) -> List[Publication]:
-    np.random.shuffle(pubs)
+def shuffle_pubs(
+    pubs: List[Publication], rng: np.random.Generator = None
+) -> List[Publication]:
+    (rng or np.random.default_rng()).shuffle(pubs)
     return pubs
 
 
 def get_initial_publications(
-    mode: int, data: dict, auth_pubs_num: int = None
+    mode: int,
+    data: dict,
+    auth_pubs_num: int = None,
+    rng: np.random.Generator = None,
 ) -> List[List[int]]:
     """
     Prepares initial publications list according to choosen mode.
@@ -245,6 +297,7 @@ def get_initial_publications(
             3 - first auth_pubs_num publications from sorted shuffled list
         data: contains normalized data from input file
         auth_pubs_num: initial number of publications choosen for each author
+        rng: random numbers generator used to shuffle publications in mode 3
 
     Returns:
         List of initial, accepted publications (List of lists with zeros or ones)
@@ -260,7 +313,8 @@ def get_initial_publications(
     elif mode == 2:
         return get_choosen_pubs(data, auth_pubs_num, sort_pubs)
     elif mode == 3:
-        return get_choosen_pubs(data, auth_pubs_num, shuffle_pubs)
+        shuffle = partial(shuffle_pubs, rng=rng or np.random.default_rng())
+        return get_choosen_pubs(data, auth_pubs_num, shuffle)
     raise AttributeError("Wrong mode choosen. Supported modes: 0, 1, 2, 3")
 
 
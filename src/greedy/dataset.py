@@ -0,0 +1,230 @@
+import hashlib
+import json
+import os
+import struct
+from typing import Tuple
+
+import numpy as np
+
+from src.greedy.data_loader import load_data_from_file
+from src.greedy.settings import (
+    CONTRIBUTION,
+    DATASET_SUFFIX,
+    DIGITAL_VARIABLES,
+    IS_EMPLOYEE,
+    IS_IN_N,
+    IS_MONOGRAPH,
+    IS_PHD_STUDENT,
+    LIST_VARIABLES,
+    NESTED_LIST_VARIABLES,
+    STRING_LIST_VARIIABLES,
+)
+from src.greedy.sparse_matrix import SparseMatrix
+
+MAGIC = b"ALHEDS01"
+ALIGNMENT = 64
+
+# Types of arrays stored in dataset file
+LIST_DTYPES = {
+    CONTRIBUTION: np.float64,
+    IS_PHD_STUDENT: np.uint8,
+    IS_EMPLOYEE: np.uint8,
+    IS_IN_N: np.uint8,
+    IS_MONOGRAPH: np.uint8,
+}
+SPARSE_DTYPES = {"indptr": np.int64, "indices": np.int32, "values": np.float64}
+
+
+def get_dataset_path(filepath: str) -> str:
+    return os.path.splitext(filepath)[0] + DATASET_SUFFIX
+
+
+def count_file_hash(filepath: str) -> str:
+    sha = hashlib.sha256()
+    with open(filepath, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def get_dataset_arrays(data: dict) -> dict:
+    """
+    Converts loaded data to arrays stored in dataset file.
+
+    Args:
+        data: dictionary returned by load_data_from_file()
+
+    Returns:
+        dictionary with array names as keys and numpy arrays as values
+
+    """
+    arrays = {}
+    for var in LIST_VARIABLES:
+        arrays[var] = np.asarray(data[var], dtype=LIST_DTYPES[var])
+    for var in NESTED_LIST_VARIABLES:
+        for part, dtype in SPARSE_DTYPES.items():
+            arrays[f"{var}.{part}"] = getattr(data[var], part).astype(dtype)
+    for var in STRING_LIST_VARIIABLES:
+        arrays[var] = np.array(data[var], dtype=str)
+    return arrays
+
+
+def write_dataset(path: str, data: dict, source_hash: str) -> None:
+    """
+    Writes data to binary dataset file. File starts with MAGIC, length of header
+    and JSON header (scalars, source hash and positions of arrays), then arrays
+    aligned to ALIGNMENT bytes are stored.
+
+    Args:
+        path: path to dataset file
+        data: dictionary returned by load_data_from_file()
+        source_hash: hash of input file
+
+    """
+    arrays = get_dataset_arrays(data)
+    header = {
+        "source_hash": source_hash,
+        "scalars": {var: data[var] for var in DIGITAL_VARIABLES},
+        "columns": {var: data[var].shape[1] for var in NESTED_LIST_VARIABLES},
+        "arrays": {},
+    }
+
+    offset = 0
+    for name, array in arrays.items():
+        header["arrays"][name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset,
+        }
+        offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+
+    encoded_header = json.dumps(header).encode()
+    data_start = len(MAGIC) + 8 + len(encoded_header)
+    data_start = -(-data_start // ALIGNMENT) * ALIGNMENT
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(MAGIC)
+            file.write(struct.pack("<Q", len(encoded_header)))
+            file.write(encoded_header)
+            for name, array in arrays.items():
+                file.seek(data_start + header["arrays"][name]["offset"])
+                file.write(array.tobytes())
+            file.truncate(data_start + offset)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def read_dataset_header(path: str) -> Tuple[dict, int]:
+    """
+    Returns header of dataset file and position of first array in file.
+
+    Raises:
+        ValueError if file is not a dataset file
+
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"File {path} is not a dataset file")
+        (header_len,) = struct.unpack("<Q", file.read(8))
+        header = json.loads(file.read(header_len).decode())
+    data_start = len(MAGIC) + 8 + header_len
+    return header, -(-data_start // ALIGNMENT) * ALIGNMENT
+
+
+def load_dataset(path: str) -> dict:
+    """
+    Loads dataset file. Arrays are memory-mapped, so they are not read until they
+    are used.
+
+    Args:
+        path: path to dataset file
+
+    Returns:
+        Dictionary with the same keys as dictionary returned by
+        load_data_from_file()
+
+    """
+    header, data_start = read_dataset_header(path)
+
+    arrays = {}
+    for name, info in header["arrays"].items():
+        dtype = np.dtype(info["dtype"])
+        shape = tuple(info["shape"])
+        if np.prod(shape) == 0:
+            arrays[name] = np.zeros(shape, dtype=dtype)
+        else:
+            offset = data_start + info["offset"]
+            arrays[name] = np.memmap(path, dtype, "r", offset, shape)
+
+    result = dict(header["scalars"])
+    for var in LIST_VARIABLES:
+        result[var] = arrays[var]
+    for var in NESTED_LIST_VARIABLES:
+        result[var] = SparseMatrix(
+            arrays[f"{var}.indptr"],
+            arrays[f"{var}.indices"],
+            arrays[f"{var}.values"],
+            (len(arrays[f"{var}.indptr"]) - 1, header["columns"][var]),
+        )
+    for var in STRING_LIST_VARIIABLES:
+        result[var] = arrays[var].tolist()
+    return result
+
+
+def compile_dataset(filepath: str) -> str:
+    """
+    Converts input file to binary dataset file stored next to the input file.
+
+    Args:
+        filepath: path to the input file
+
+    Returns:
+        path to dataset file
+
+    """
+    path = get_dataset_path(filepath)
+    write_dataset(path, load_data_from_file(filepath), count_file_hash(filepath))
+    return path
+
+
+def load_input(filepath: str) -> dict:
+    """
+    Loads data from input file. Data is read from dataset file if it exists and
+    was compiled from current version of input file. Otherwise input file is
+    parsed and dataset file is compiled for later runs (data is returned without
+    compiling dataset file if it can not be written, ex. in read-only directory).
+    Dataset file given instead of input file (ex. generated one) is loaded
+    directly.
+
+    Args:
+        filepath: path to the input file or dataset file
+
+    Returns:
+        Dictionary with variables from input file
+
+    """
+    if filepath.endswith(DATASET_SUFFIX):
+        return load_dataset(filepath)
+
+    path = get_dataset_path(filepath)
+    source_hash = count_file_hash(filepath)
+
+    if os.path.exists(path):
+        try:
+            header, _ = read_dataset_header(path)
+            if header["source_hash"] == source_hash:
+                return load_dataset(path)
+        except (ValueError, struct.error):
+            pass
+
+    data = load_data_from_file(filepath)
+    try:
+        write_dataset(path, data, source_hash)
+    except OSError:
+        pass
+    return data
@@ -0,0 +1,284 @@
+import os
+from typing import List, TextIO
+
+import numpy as np
+
+from src.greedy.dataset import count_file_hash, get_dataset_path, write_dataset
+from src.greedy.settings import (
+    AUTHOR_ID,
+    CONTRIBUTION,
+    EMPLOYEES_NUM,
+    IS_EMPLOYEE,
+    IS_IN_N,
+    IS_MONOGRAPH,
+    IS_PHD_STUDENT,
+    N0,
+    N1,
+    N2,
+    PUBLICATION_CONTRIB_FOR_AUTHOR,
+    PUBLICATION_ID,
+    PUBLICATION_POINTS_FOR_AUTHOR,
+    PUBLICATIONS_NUM,
+)
+from src.greedy.sparse_matrix import SparseMatrix
+
+# Default parameters of generated departments, similar to the biggest shipped
+# department (inzynieria_ladowa_transport)
+DENSITY = 1.6
+EXTERNAL_AUTHORS = 1.0
+MONOGRAPH_RATIO = 0.05
+PHD_RATIO = 0.01
+EMPLOYEE_RATIO = 0.9
+PART_TIME_RATIO = 0.15
+
+# Distributions of contributions of publication's authors:
+# EQUAL_CONTRIBUTIONS - every author gets 1 / number of authors
+# DIRICHLET_CONTRIBUTIONS - shares of authors are drawn from Dirichlet(1, ..., 1)
+EQUAL_CONTRIBUTIONS = "equal"
+DIRICHLET_CONTRIBUTIONS = "dirichlet"
+CONTRIBUTION_DISTRIBUTIONS = [EQUAL_CONTRIBUTIONS, DIRICHLET_CONTRIBUTIONS]
+
+# Points of articles and monographs (drawn uniformly)
+ARTICLE_POINTS = [5, 7, 8, 10, 15, 20, 25, 30, 35, 40, 45, 50]
+MONOGRAPH_POINTS = [20, 80, 100]
+
+# Contributions (fractions of full-time job) of part-time authors
+PART_TIME_CONTRIBUTIONS = [0.25, 0.5, 0.75]
+
+# Sigma of lognormal distribution of authors' activity. Some authors write many
+# more publications than others, like in shipped departments
+ACTIVITY_SIGMA = 1.0
+
+# Number of decimal places of contributions and points (like in shipped files)
+DECIMALS = 4
+
+
+def draw_authorships(
+    authors: int, publications: int, density: float, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Draws authors of publications. Every publication gets at least one author,
+    authors are drawn with probabilities proportional to their activity.
+    Repeated authors of single publication are merged, so mean number of
+    authors is slightly lower than density for small departments.
+
+    Returns:
+        array of distinct (author's index, publication's index) pairs sorted by
+        author and publication
+
+    """
+    authors_num = 1 + rng.poisson(max(density - 1, 0), publications)
+    authors_num = np.minimum(authors_num, authors)
+    activity = rng.lognormal(0, ACTIVITY_SIGMA, authors)
+
+    pubs_idx = np.repeat(np.arange(publications), authors_num)
+    authors_idx = rng.choice(authors, len(pubs_idx), p=activity / activity.sum())
+    keys = np.unique(authors_idx.astype(np.int64) * publications + pubs_idx)
+    return np.column_stack((keys // publications, keys % publications))
+
+
+def draw_contributions(
+    pubs_idx: np.ndarray,
+    publications: int,
+    external_authors: float,
+    distribution: str,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Draws contributions of department's authors of publications. Every
+    publication also has external authors (Poisson with mean external_authors),
+    who take part of contribution.
+
+    Args:
+        pubs_idx: publication's index of every authorship
+        publications: number of publications
+        external_authors: mean number of external authors of publication
+        distribution: distribution of contributions (CONTRIBUTION_DISTRIBUTIONS)
+        rng: random numbers generator
+
+    Returns:
+        contribution of every authorship
+
+    Raises:
+        AttributeError if given distribution does not exist
+
+    """
+    externals = rng.poisson(external_authors, publications)
+    if distribution == EQUAL_CONTRIBUTIONS:
+        authors_num = np.bincount(pubs_idx, minlength=publications) + externals
+        return 1 / authors_num[pubs_idx]
+    elif distribution == DIRICHLET_CONTRIBUTIONS:
+        # Normalized Gamma(1) variables have Dirichlet(1, ..., 1) distribution,
+        # sum of shares of external authors has Gamma(externals) distribution
+        shares = rng.gamma(1.0, size=len(pubs_idx))
+        external_shares = np.where(
+            externals > 0, rng.gamma(np.maximum(externals, 1)), 0
+        )
+        totals = np.bincount(pubs_idx, shares, publications) + external_shares
+        return shares / totals[pubs_idx]
+    raise AttributeError(
+        f"Wrong contribution distribution choosen. Supported: "
+        f"{', '.join(CONTRIBUTION_DISTRIBUTIONS)}"
+    )
+
+
+def generate_instance(
+    authors: int,
+    publications: int,
+    density: float = DENSITY,
+    external_authors: float = EXTERNAL_AUTHORS,
+    monograph_ratio: float = MONOGRAPH_RATIO,
+    phd_ratio: float = PHD_RATIO,
+    employee_ratio: float = EMPLOYEE_RATIO,
+    part_time_ratio: float = PART_TIME_RATIO,
+    contribution: str = EQUAL_CONTRIBUTIONS,
+    seed: int = None,
+) -> dict:
+    """
+    Generates synthetic department. Author's points for publication are
+    publication's points multiplied by author's contribution.
+
+    Args:
+        authors: number of authors (A)
+        publications: number of publications (P)
+        density: mean number of department's authors of publication
+        external_authors: mean number of external authors of publication
+        monograph_ratio: probability that publication is a monograph
+        phd_ratio: probability that author is a PhD student
+        employee_ratio: probability that author is an employee
+        part_time_ratio: probability that author works part-time
+        contribution: distribution of contributions of publication's authors
+        seed: seed of random numbers generator
+
+    Returns:
+        Dictionary with the same keys and types as dictionary returned by
+        load_data_from_file()
+
+    """
+    rng = np.random.default_rng(seed)
+    pairs = draw_authorships(authors, publications, density, rng)
+    contribs = draw_contributions(
+        pairs[:, 1], publications, external_authors, contribution, rng
+    )
+    contribs = np.maximum(np.round(contribs, DECIMALS), 10**-DECIMALS)
+
+    is_monograph = (rng.random(publications) < monograph_ratio).astype(np.int64)
+    points = np.where(
+        is_monograph,
+        rng.choice(MONOGRAPH_POINTS, publications),
+        rng.choice(ARTICLE_POINTS, publications),
+    )
+    author_points = np.round(points[pairs[:, 1]] * contribs, DECIMALS)
+
+    indptr = np.zeros(authors + 1, dtype=np.int64)
+    np.cumsum(np.bincount(pairs[:, 0], minlength=authors), out=indptr[1:])
+    shape = (authors, publications)
+
+    part_time = rng.random(authors) < part_time_ratio
+    return {
+        EMPLOYEES_NUM: authors,
+        N0: 1,
+        N1: 0,
+        N2: 0,
+        PUBLICATIONS_NUM: publications,
+        CONTRIBUTION: np.where(
+            part_time, rng.choice(PART_TIME_CONTRIBUTIONS, authors), 1.0
+        ),
+        IS_PHD_STUDENT: (rng.random(authors) < phd_ratio).astype(np.int64),
+        IS_EMPLOYEE: (rng.random(authors) < employee_ratio).astype(np.int64),
+        IS_IN_N: np.ones(authors, dtype=np.int64),
+        PUBLICATION_CONTRIB_FOR_AUTHOR: SparseMatrix(
+            indptr, pairs[:, 1], contribs, shape
+        ),
+        PUBLICATION_POINTS_FOR_AUTHOR: SparseMatrix(
+            indptr, pairs[:, 1], author_points, shape
+        ),
+        IS_MONOGRAPH: is_monograph,
+        AUTHOR_ID: [f"SYN-A{idx}" for idx in range(authors)],
+        PUBLICATION_ID: [f"SYN-P{idx}" for idx in range(publications)],
+    }
+
+
+def format_number(value) -> str:
+    return repr(float(value)) if value else "0"
+
+
+def format_list(values: np.ndarray) -> str:
+    return "[" + ", ".join(repr(value) for value in values.tolist()) + "]"
+
+
+def write_nested_list(file: TextIO, name: str, matrix: SparseMatrix) -> None:
+    """
+    Writes matrix as dense nested list. Rows are formatted one by one, so only
+    single dense row is kept in memory.
+    """
+    file.write(f"{name} = [")
+    for idx in range(matrix.shape[0]):
+        start, end = matrix.indptr[idx], matrix.indptr[idx + 1]
+        row = ["0"] * matrix.shape[1]
+        for column, value in zip(
+            matrix.indices[start:end].tolist(), matrix.values[start:end].tolist()
+        ):
+            row[column] = format_number(value)
+        file.write(("" if idx == 0 else ", ") + "[" + ", ".join(row) + "]")
+    file.write("];\n\n")
+
+
+def write_strings_list(file: TextIO, name: str, values: List[str]) -> None:
+    file.write(f"{name} = [" + ", ".join(f'"{value}"' for value in values) + "];")
+
+
+def save_instance(path: str, data: dict) -> None:
+    """
+    Saves data in format of input files (the same order of variables and CRLF line
+    endings as in shipped files).
+
+    Args:
+        path: path to the input file
+        data: dictionary returned by generate_instance()
+
+    """
+    with open(path, "w", newline="\r\n") as file:
+        for var in [EMPLOYEES_NUM, N0, N1, N2]:
+            file.write(f"{var} = {data[var]};\n")
+        file.write(f"\n{PUBLICATIONS_NUM} = {data[PUBLICATIONS_NUM]};\n\n")
+        for var in [CONTRIBUTION, IS_PHD_STUDENT, IS_EMPLOYEE, IS_IN_N]:
+            file.write(f"{var} = {format_list(data[var])};\n\n")
+        for var in [PUBLICATION_CONTRIB_FOR_AUTHOR, PUBLICATION_POINTS_FOR_AUTHOR]:
+            write_nested_list(file, var, data[var])
+        file.write(f"{IS_MONOGRAPH} = {format_list(data[IS_MONOGRAPH])};\n\n")
+        write_strings_list(file, AUTHOR_ID, data[AUTHOR_ID])
+        file.write("\n\n")
+        write_strings_list(file, PUBLICATION_ID, data[PUBLICATION_ID])
+
+
+def save_generated_files(
+    path: str, data: dict, text: bool = True, binary: bool = True
+) -> List[str]:
+    """
+    Saves generated data as input file and/or binary dataset file stored next to
+    it. Dataset saved with input file is used by load_input() instead of parsing
+    the input file. Dense input files of very big departments are huge, so they
+    can be skipped and dataset file can be loaded directly. Missing directories
+    of path are created.
+
+    Args:
+        path: path to the input file
+        data: dictionary returned by generate_instance()
+        text: save input file
+        binary: save dataset file
+
+    Returns:
+        paths to saved files
+
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    paths = []
+    if text:
+        save_instance(path, data)
+        paths.append(path)
+    if binary:
+        dataset_path = get_dataset_path(path)
+        write_dataset(dataset_path, data, count_file_hash(path) if text else None)
+        paths.append(dataset_path)
+    return paths
@@ -1,16 +1,34 @@
+from itertools import accumulate
 from typing import List, Tuple
 
 import numpy as np
 
-from src.greedy.author import Author
+from src.greedy.accepted_set import AcceptedSet
+from src.greedy.author import BASIC_CONTRIB_COEFFICIENT, Author
 from src.greedy.check_limits import (
     check_author_limits,
     check_limits,
     count_curr_sums_for_publications,
 )
-from src.greedy.data_preparation import prepare_authors_and_their_publications
+from src.greedy.instance import ProblemInstance
+from src.greedy.profiler import NULL_PROFILER, Profiler
 from src.greedy.publication import Publication as Pub
-from src.greedy.settings import ALPHA, THRESHOLDS
+from src.greedy.publications_table import PublicationsTable
+from src.greedy.ranking import get_ranked_publications_to_considerate
+from src.greedy.search_state import SearchState
+from src.greedy.settings import (
+    ALPHA,
+    CACHED_ENGINE,
+    EMPLOYEES_NUM,
+    ENGINE,
+    INITIAL_PUBS,
+    MAX_EVALUATIONS,
+    NUMPY_ENGINE,
+    PATIENCE,
+    PYTHON_ENGINE,
+    THRESHOLDS,
+    TIME_LIMIT,
+)
 
 
 def consider_single_publication(pub: Pub, curr_sums: dict, data: dict) -> bool:
@@ -116,61 +134,74 @@ def get_all_accepted_publications(authors: List[Author]) -> List[Pub]:
     return accepted
 
 
-def sort_publications(publications: List[Pub]) -> List[Pub]:
+def get_points_prefix_sums(points: List[float]) -> List[float]:
     """
-    Sorts publications by their rate and points.
-
-    Args:
-        publications: list of publications
-
-    Returns:
-        sorted list
-
+    Counts prefix sums of points of sorted publications. Element idx is sum of
+    points of first idx publications.
     """
-    return sorted(
-        publications, key=lambda x: (x.get_rate(), x.get_points()), reverse=True
-    )
+    return [0] + list(accumulate(points))
 
 
-def get_heuristic_value(pubs: List[Pub], idx: int, remaining_pubs: int) -> float:
+def get_heuristic_value(
+    prefix_sums: List[float], idx: int, remaining_pubs: int
+) -> float:
     """
     Counts points for remaining publications. Heuristic function
 
     Args:
-        pubs: list of publications to considerate
+        prefix_sums: prefix sums of points of publications to considerate
         idx: index of currently analysed publication
         remaining_pubs: heuristic number of publications to publish
 
     Returns:
         Heuristic value that represents points that will be added to goal function
-        from remaining publications
+        from remaining publications (sum of points of remaining_pubs publications
+        starting from idx)
 
     """
-    heur = 0
-    curr_pubs = 0
+    last = len(prefix_sums) - 1
+    start = min(idx, last)
+    end = min(idx + max(remaining_pubs, 0), last)
+    return prefix_sums[end] - prefix_sums[start]
 
-    for pub in pubs[idx:]:
-        if curr_pubs >= remaining_pubs:
-            break
-        heur += pub.get_points()
-        curr_pubs += 1
 
-    return heur
+def get_replaced_points(points: List[float], idx: int, remaining_pubs: int) -> float:
+    """
+    Counts points that heuristic value loses when publication before idx is
+    published: the last of remaining_pubs publications starting from idx leaves
+    the heuristic, because one less publication remains to publish. Publication
+    is worth publishing if it has more points. Points are compared directly
+    (not as differences of prefix sums), so ties are not decided by rounding
+    errors.
 
+    Args:
+        points: points of sorted publications to considerate
+        idx: index of publication after currently analysed publication
+        remaining_pubs: heuristic number of publications to publish
 
-def get_points_from_pub(pubs: List[Pub], idx: int) -> float:
-    if len(pubs) > idx:
-        return pubs[idx].get_points()
-    return 0
+    Returns:
+        points of replaced publication (0 if there is no such publication)
+
+    """
+    end = idx + remaining_pubs - 1
+    if remaining_pubs < 1 or end >= len(points):
+        return 0
+    return points[end]
 
 
-def count_goal_function(prev_goal_fun: float, points: float, data: dict) -> float:
-    update_iterations_info(data)
+def count_goal_function(
+    prev_goal_fun: float, points: float, state: SearchState
+) -> float:
+    state.count_evaluations()
     return prev_goal_fun + points
 
 
 def choose_publications_to_publish(
-    pubs: List[Pub], accepted: List[Pub], data: dict, heur_pubs: int
+    pubs: List[Pub],
+    accepted: List[Pub],
+    data: dict,
+    heur_pubs: int,
+    state: SearchState,
 ) -> Tuple[List[Pub], float]:
     """
     Chooses publications to publish
@@ -180,6 +211,7 @@ def choose_publications_to_publish(
         authors: list of authors. Each author contains list of publications
         data: dictionary with data from input file
         heur_pubs: heuristic number of publications to publish
+        state: state of the run, counts goal function calculations
 
     Returns:
         list of publications to publish and value of goal function
@@ -192,114 +224,381 @@ def choose_publications_to_publish(
     for pub in accepted:
         if consider_single_publication(pub, curr_sums, data):
             curr_sums = update_current_sums(curr_sums, pub, pub.get_author())
-            goal_fun = count_goal_function(goal_fun, pub.get_points(), data)
+            goal_fun = count_goal_function(goal_fun, pub.get_points(), state)
             result_publications.append(pub)
             heur_pubs -= 1
 
-    heuristic_value = get_heuristic_value(pubs, 0, heur_pubs)
+    points = [pub.get_points() for pub in pubs]
 
     for idx, pub in enumerate(pubs, 0):
-        heuristic_value = round(heuristic_value, 3)
-        tmp_goal_fun = count_goal_function(goal_fun, pub.get_points(), data)
+        tmp_goal_fun = count_goal_function(goal_fun, pub.get_points(), state)
         if consider_single_publication(pub, curr_sums, data):
-            heu_pub = max(0, heuristic_value - pub.get_points())
-            heu_without_pub = max(0, heuristic_value - pub.get_points())
-            if heur_pubs > 0:
-                heu_without_pub += get_points_from_pub(pubs, idx + heur_pubs)
+            replaced_points = get_replaced_points(points, idx + 1, heur_pubs)
 
-            if tmp_goal_fun + heu_pub > goal_fun + heu_without_pub and pub.get_author().accept_publication(pub):
+            if (
+                pub.get_points() > replaced_points
+                and pub.get_author().accept_publication(pub)
+            ):
                 goal_fun = tmp_goal_fun
-                heuristic_value = heu_pub
                 heur_pubs -= 1
                 curr_sums = update_current_sums(curr_sums, pub, pub.get_author())
                 result_publications.append(pub)
-            else:
-                heuristic_value = heu_without_pub
-        else:
-            heuristic_value -= pub.get_points()
-            if heur_pubs > 0:
-                heuristic_value += get_points_from_pub(pubs, idx + heur_pubs)
 
     return result_publications, round(goal_fun, 3)
 
 
-def choose_publications_to_cancel(accepted: List[Pub], alpha: float) -> List[Pub]:
-    to_cancel = []
-
-    for pub in sort_publications(accepted):
-        cancel_prob = np.random.uniform(0, 1)
-        if cancel_prob <= alpha:
-            to_cancel.append(pub)
+def accept_prefix_of_accepted(
+    contribs: np.ndarray, points: np.ndarray, limit: float
+) -> Tuple[List[int], float, float]:
+    """
+    Chooses already accepted publications that still meet global limit. If all of
+    them meet the limit (the most common case), sums are counted with cumsum.
+    Otherwise publications are considered one by one from the first one that
+    breaks the limit.
 
-    return to_cancel
+    Args:
+        contribs: contributions of accepted publications (in acceptance order)
+        points: points of accepted publications (in acceptance order)
+        limit: maximal sum of contributions
 
+    Returns:
+        positions of publications that meet the limit, sum of their contributions
+        and sum of their points
 
-def count_auth_pub_pairs_num(authors: List[Author]) -> int:
     """
-    Counts number of pairs (author, publication),
+    if not len(contribs):
+        return [], 0, 0
+
+    contrib_sums = np.cumsum(contribs)
+    fits = int(np.searchsorted(contrib_sums > limit, True))
+    chosen = list(range(fits))
+    contrib_sum = float(contrib_sums[fits - 1]) if fits else 0
+    goal_fun = float(np.cumsum(points[:fits])[-1]) if fits else 0
+
+    for idx, (contrib, pts) in enumerate(
+        zip(contribs[fits:].tolist(), points[fits:].tolist()), fits
+    ):
+        if contrib_sum + contrib <= limit:
+            contrib_sum += contrib
+            goal_fun += pts
+            chosen.append(idx)
+
+    return chosen, contrib_sum, goal_fun
+
+
+def choose_publications_to_publish_vectorized(
+    table: PublicationsTable,
+    accepted: List[Pub],
+    data: dict,
+    heur_pubs: int,
+    state: SearchState,
+) -> Tuple[List[Pub], float]:
+    """
+    Chooses publications to publish. Works like choose_publications_to_publish(),
+    but on arrays from publications table instead of Publication and Author
+    objects. Authors are updated once, after all publications are chosen.
+    Publications are returned as their ranks in publications table.
 
     Args:
-         authors: list of authors. Each author has a list of publications
+        table: publications table created from ranking
+        accepted: list of accepted publications (in acceptance order)
+        data: dictionary with data from input file
+        heur_pubs: heuristic number of publications to publish
+        state: state of the run, counts goal function calculations
+
+    Returns:
+        ranks of publications to publish and value of goal function
+
     """
-    auth_pub_pairs_num = 0
-    for auth in authors:
-        auth_pub_pairs_num += auth.get_publications_number()
-    return auth_pub_pairs_num
+    limit = 3 * data[EMPLOYEES_NUM]
 
+    accepted_ranks = table.get_ranks(accepted)
+    chosen, contrib_sum, goal_fun = accept_prefix_of_accepted(
+        table.contribs[accepted_ranks], table.points[accepted_ranks], limit
+    )
+    result_ranks = accepted_ranks[chosen].tolist()
+    heur_pubs -= len(result_ranks)
+
+    is_candidate = np.ones(len(table), dtype=bool)
+    is_candidate[accepted_ranks] = False
+    candidates = np.flatnonzero(is_candidate)
+    state.count_evaluations(len(result_ranks) + len(candidates))
+
+    new_ranks, goal_fun = choose_candidates(
+        table,
+        candidates,
+        goal_fun,
+        contrib_sum,
+        heur_pubs,
+        table.get_authors_contrib_sums(),
+        limit,
+    )
+    for pub in table.get_publications(new_ranks):
+        accepted = pub.get_author().accept_publication(pub)
+        assert accepted, f"Publication {pub} exceeds its author's limits"
+
+    return np.array(result_ranks + new_ranks, dtype=np.int64), round(goal_fun, 3)
+
+
+def choose_candidates(
+    table: PublicationsTable,
+    candidates: np.ndarray,
+    goal_fun: float,
+    contrib_sum: float,
+    heur_pubs: int,
+    authors_sums: List[float],
+    limit: float,
+) -> Tuple[List[int], float]:
+    """
+    Chooses publications to publish from candidates (publications that are not
+    accepted), one by one in ranking order.
 
-def update_iterations_info(data: dict) -> None:
-    if data["goal_calculations_num"] in data["thresholds"]:
-        goal_fun = data["best_result"]["goal_fun"]
-        curr_th = data["goal_calculations_num"]
-        if data["threshold_goal_values"] == {}:
-            data["threshold_goal_values"][curr_th] = goal_fun
-        else:
-            max_th = max(data["threshold_goal_values"])
-            if goal_fun > data["threshold_goal_values"][max_th]:
-                data["threshold_goal_values"][curr_th] = goal_fun
-            else:
-                max_goal = data["threshold_goal_values"][max_th]
-                data["threshold_goal_values"][curr_th] = max_goal
-    data["goal_calculations_num"] += 1
+    Args:
+        table: publications table created from ranking
+        candidates: ranks of candidates (in ranking order)
+        goal_fun: goal function value of accepted publications
+        contrib_sum: sum of contributions of accepted publications
+        heur_pubs: remaining heuristic number of publications to publish
+        authors_sums: sums of contributions of authors' accepted publications
+            (updated with chosen publications)
+        limit: maximal sum of contributions
+
+    Returns:
+        ranks of chosen publications and goal function value
 
+    """
+    points = table.points[candidates].tolist()
+    contribs = table.contribs[candidates].tolist()
+    authors_idx = table.author_idx[candidates].tolist()
+
+    new_ranks = []
+    for idx, rank in enumerate(candidates.tolist()):
+        contrib = contribs[idx]
+        if contrib_sum + contrib > limit:
+            continue
+
+        replaced_points = get_replaced_points(points, idx + 1, heur_pubs)
+        auth_idx = authors_idx[idx]
+        auth_sum = authors_sums[auth_idx] + contrib
+        if points[idx] > replaced_points and auth_sum <= BASIC_CONTRIB_COEFFICIENT:
+            authors_sums[auth_idx] = auth_sum
+            goal_fun += points[idx]
+            heur_pubs -= 1
+            contrib_sum += contrib
+            new_ranks.append(rank)
 
-def update_best_result(data: dict, res_pubs: List[Pub], goal_fun) -> None:
-    if data["best_result"]["goal_fun"] < goal_fun:
-        data["best_result"]["goal_fun"] = goal_fun
-        data["best_result"]["res_pubs"] = res_pubs.copy()
+    return new_ranks, goal_fun
 
 
-def run_algorithm(data: dict, heur_pubs: int) -> Tuple[List[Pub], float]:
+def choose_publications_to_publish_cached(
+    accepted_set: AcceptedSet,
+    data: dict,
+    heur_pubs: int,
+    state: SearchState,
+) -> Tuple[np.ndarray, float]:
     """
-    Runs full greedy algorithm. Prepares authors and publications, attaches
-    publications to authors. Chooses which publications needs to be published
+    Chooses publications to publish. Works like
+    choose_publications_to_publish_vectorized(), but accepted publications are
+    kept in accepted set between iterations, so they are not read from authors
+    and authors are not updated. Chosen publications are added to accepted set.
+    Only bookkeeping of accepted publications is cached, it is not incremental
+    (delta) evaluation of candidates. Candidates are still scanned in every
+    iteration (every decision of the heuristic depends on the number of
+    publications accepted before), so cost of iteration is proportional to the
+    number of pairs like in other engines.
 
     Args:
-        data: contains normalized data from input file
+        accepted_set: publications accepted in previous iterations (without
+            cancelled ones)
+        data: dictionary with data from input file
         heur_pubs: heuristic number of publications to publish
+        state: state of the run, counts goal function calculations
 
-    Retrns:
-        list of publications to publish and value of goal function
+    Returns:
+        ranks of publications to publish and value of goal function
+
+    """
+    table = accepted_set.table
+    limit = 3 * data[EMPLOYEES_NUM]
+
+    accepted_ranks = accepted_set.get_ranks()
+    chosen, contrib_sum, goal_fun = accept_prefix_of_accepted(
+        table.contribs[accepted_ranks], table.points[accepted_ranks], limit
+    )
+    result_ranks = accepted_ranks[chosen].tolist()
+    heur_pubs -= len(result_ranks)
+
+    candidates = accepted_set.get_candidates()
+    state.count_evaluations(len(result_ranks) + len(candidates))
+
+    new_ranks, goal_fun = choose_candidates(
+        table,
+        candidates,
+        goal_fun,
+        contrib_sum,
+        heur_pubs,
+        list(accepted_set.authors_sums),
+        limit,
+    )
+    accepted_set.accept(new_ranks)
+
+    return np.array(result_ranks + new_ranks, dtype=np.int64), round(goal_fun, 3)
+
+
+def choose_publications_to_cancel(
+    ranks: np.ndarray, alpha: float, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Chooses publications to cancel. Every publication is cancelled with
+    probability alpha. Cancellation probabilities are drawn in one call, in
+    ranking order.
+
+    Args:
+        ranks: ranks of accepted publications
+        alpha: probability of publication's revocation
+        rng: random numbers generator
+
+    Returns:
+        ranks of publications to cancel
+
+    """
+    ordered = np.sort(ranks)
+    cancel_probs = rng.random(len(ordered))
+    return ordered[cancel_probs <= alpha]
 
+
+def count_auth_pub_pairs_num(authors: List[Author]) -> int:
     """
+    Counts number of pairs (author, publication),
 
-    auths = prepare_authors_and_their_publications(data)
-    auth_pub_pairs_num = count_auth_pub_pairs_num(auths)
-    data["thresholds"] = [i * auth_pub_pairs_num for i in THRESHOLDS]
+    Args:
+         authors: list of authors. Each author has a list of publications
+    """
+    auth_pub_pairs_num = 0
+    for auth in authors:
+        auth_pub_pairs_num += auth.get_publications_number()
+    return auth_pub_pairs_num
 
-    while data["goal_calculations_num"] < max(data["thresholds"]) + 1:
-        pubs = sort_publications(get_publications_to_considerate(auths))
-        acc = get_all_accepted_publications(auths)
-        res_pubs, goal_fun = choose_publications_to_publish(pubs, acc, data, heur_pubs)
 
-        update_best_result(data, res_pubs, goal_fun)
+def run_algorithm(
+    data: dict,
+    heur_pubs: int,
+    engine: str = ENGINE,
+    rng: np.random.Generator = None,
+    instance: ProblemInstance = None,
+    state: SearchState = None,
+    thresholds: List[int] = None,
+    alpha: float = ALPHA,
+    profiler: Profiler = None,
+    time_limit: float = TIME_LIMIT,
+    max_evaluations: int = MAX_EVALUATIONS,
+    patience: int = PATIENCE,
+) -> Tuple[List[Pub], float]:
+    """
+    Runs full greedy algorithm. Prepares authors and publications, attaches
+    publications to authors. Chooses which publications needs to be published
 
-        for pub in choose_publications_to_cancel(res_pubs, ALPHA):
-            pub.get_author().remove_from_accepted_publications(pub)
+    Args:
+        data: contains normalized data from input file (it is not modified)
+        heur_pubs: heuristic number of publications to publish
+        engine: implementation of choosing publications to publish:
+            PYTHON_ENGINE - choose_publications_to_publish()
+            NUMPY_ENGINE - choose_publications_to_publish_vectorized()
+            CACHED_ENGINE - choose_publications_to_publish_cached()
+        rng: random numbers generator (new unseeded generator if None)
+        instance: problem instance already reset to initial result. If None,
+            instance is built from data and reset to data[INITIAL_PUBS]
+        state: state of the run, reset at start and filled during the run (ex.
+            with goal function values for thresholds and ranks of publications
+            from the best result). New state is used if None
+        thresholds: numbers of full iterations after which goal function values
+            are saved. Algorithm stops after the last one (THRESHOLDS if None)
+        alpha: probability of publication's revocation
+        profiler: measures time of phases of the algorithm (profiling is off if
+            None)
+        time_limit: time of the run in seconds (no limit if None)
+        max_evaluations: budget of goal function calculations (no limit if None)
+        patience: maximal number of iterations without improvement of the best
+            result (no limit if None)
+
+    Anytime limits (time_limit, max_evaluations and patience) stop the run before
+    the last threshold. They are checked after every iteration, then the best
+    result found so far is returned and the reason of stopping the run is saved
+    in state.stop_reason. Thresholds that were not reached are not saved.
 
-    curr_sums = count_curr_sums_for_publications(data["best_result"]["res_pubs"])
-    assert check_limits(data, curr_sums)
-    for author in auths:
-        assert check_author_limits(author, author.get_accepted_publications())
+    Returns:
+        list of publications to publish and value of goal function. Reason of
+        stopping the run is not returned, it is available only in
+        state.stop_reason (pass state to read it, ex. as run_job() does)
 
-    return data["best_result"]["res_pubs"], data["best_result"]["goal_fun"]
+    """
+    profiler = profiler or NULL_PROFILER
+    if instance is None:
+        with profiler.phase("prepare"):
+            instance = ProblemInstance(data)
+            instance.reset_from_vector(data[INITIAL_PUBS])
+
+    auths = instance.authors
+    ranking = instance.ranking
+    table = instance.table
+    state = state or SearchState()
+    thresholds = THRESHOLDS if thresholds is None else thresholds
+    state.reset(
+        [i * instance.auth_pub_pairs_num for i in thresholds],
+        time_limit,
+        max_evaluations,
+        patience,
+    )
+    rng = rng or np.random.default_rng()
+
+    if engine not in (CACHED_ENGINE, NUMPY_ENGINE, PYTHON_ENGINE):
+        raise AttributeError(f"Wrong engine choosen: {engine}")
+    accepted_set = AcceptedSet(table) if engine == CACHED_ENGINE else None
+
+    while not state.is_finished():
+        with profiler.iteration(state.iterations):
+            if engine == CACHED_ENGINE:
+                with profiler.phase("choose_publications_to_publish"):
+                    res_ranks, goal_fun = choose_publications_to_publish_cached(
+                        accepted_set, data, heur_pubs, state
+                    )
+            else:
+                with profiler.phase("get_all_accepted_publications"):
+                    acc = get_all_accepted_publications(auths)
+
+                if engine == NUMPY_ENGINE:
+                    with profiler.phase("choose_publications_to_publish"):
+                        res_ranks, goal_fun = choose_publications_to_publish_vectorized(
+                            table, acc, data, heur_pubs, state
+                        )
+                else:
+                    with profiler.phase("get_publications_to_considerate"):
+                        pubs = get_ranked_publications_to_considerate(ranking)
+                    with profiler.phase("choose_publications_to_publish"):
+                        res_pubs, goal_fun = choose_publications_to_publish(
+                            pubs, acc, data, heur_pubs, state
+                        )
+                        res_ranks = table.get_ranks(res_pubs)
+
+            state.update_best_result(res_ranks, goal_fun)
+
+            with profiler.phase("choose_publications_to_cancel"):
+                cancelled = choose_publications_to_cancel(res_ranks, alpha, rng)
+                if accepted_set is not None:
+                    accepted_set.cancel(cancelled)
+                else:
+                    for pub in table.get_publications(cancelled.tolist()):
+                        pub.get_author().remove_from_accepted_publications(pub)
+        state.count_iteration()
+
+    with profiler.phase("check_limits"):
+        if accepted_set is not None:
+            accepted_set.sync()
+        best_publications = table.get_publications(state.best_ranks.tolist())
+        curr_sums = count_curr_sums_for_publications(best_publications)
+        assert check_limits(data, curr_sums)
+        for author in auths:
+            assert check_author_limits(author, author.get_accepted_publications())
+    profiler.count("evaluations", state.goal_calculations_num)
+
+    return best_publications, state.best_goal_fun
@@ -0,0 +1,141 @@
+from typing import List
+
+import numpy as np
+
+from src.greedy.author import Author
+from src.greedy.data_preparation import (
+    choose_first_publications,
+    create_author_publications,
+    prepare_authors,
+    shuffle_pubs,
+    sort_pubs,
+)
+from src.greedy.output_converter import get_idx_map
+from src.greedy.publication import Publication
+from src.greedy.publications_table import PublicationsTable
+from src.greedy.ranking import rank_publications
+from src.greedy.settings import (
+    PUBLICATION_CONTRIB_FOR_AUTHOR,
+    PUBLICATION_ID,
+    PUBLICATION_POINTS_FOR_AUTHOR,
+)
+from src.greedy.sparse_matrix import as_sparse
+
+
+class ProblemInstance:
+    """
+    Authors, publications, ranking and publications table built once for input
+    data. Runs of the algorithm only reset accepted publications, so nothing is
+    created again when many tests are run on the same department.
+    """
+
+    def __init__(self, data: dict):
+        points = as_sparse(data[PUBLICATION_POINTS_FOR_AUTHOR])
+        contribs = as_sparse(data[PUBLICATION_CONTRIB_FOR_AUTHOR])
+
+        self.authors = prepare_authors(data)
+        for idx, author in enumerate(self.authors, 0):
+            author.load_publications(
+                create_author_publications(data, points, contribs, idx)
+            )
+
+        self.ranking = rank_publications(self.authors)
+        self.table = PublicationsTable(self.ranking, self.authors)
+        self.auth_pub_pairs_num = len(self.ranking)
+        self.__publications_idx_map = get_idx_map(data, PUBLICATION_ID)
+
+        # (author's index, publication's index) in input data for every rank
+        pubs_idx = (self.__publications_idx_map[pub.get_id()] for pub in self.ranking)
+        self.pairs = np.column_stack(
+            (
+                self.table.author_idx,
+                np.fromiter(pubs_idx, dtype=np.int64, count=len(self.ranking)),
+            )
+        )
+
+    def get_pairs(self, ranks: np.ndarray) -> np.ndarray:
+        """
+        Returns (author's index, publication's index) pairs of publications with
+        given ranks. Indices are positions in AUTHOR_ID and PUBLICATION_ID lists.
+        """
+        return self.pairs[ranks]
+
+    def reset(self, initial_pubs: List[List[Publication]]) -> List[Author]:
+        """
+        Cancels publications accepted in previous run and accepts initial ones.
+        Publications are accepted in author's publications order, publications
+        that do not meet author's limits are skipped.
+
+        Args:
+            initial_pubs: list of lists. Each list contains author's publications
+                included in initial result
+
+        Returns:
+            List of authors
+
+        """
+        for author, pubs in zip(self.authors, initial_pubs):
+            author.reset_accepted_publications()
+            pubs_ids = {pub.get_id() for pub in pubs}
+            for pub in author.publications:
+                if pub.get_id() in pubs_ids:
+                    author.accept_publication(pub)
+        return self.authors
+
+    def reset_from_vector(self, initial_pubs: List[List[int]]) -> List[Author]:
+        """
+        Works like reset(), but initial result is given as list of lists with
+        zeros or ones (like INITIAL_PUBS in input data).
+        """
+        return self.reset(
+            [
+                [
+                    pub
+                    for pub in author.publications
+                    if initial_pubs[idx][self.__publications_idx_map[pub.get_id()]]
+                ]
+                for idx, author in enumerate(self.authors, 0)
+            ]
+        )
+
+    def get_initial_publications(
+        self, mode: int, auth_pubs_num: int = None, rng: np.random.Generator = None
+    ) -> List[List[Publication]]:
+        """
+        Prepares initial publications according to choosen mode. Chooses the same
+        publications as data_preparation.get_initial_publications().
+
+        Args:
+            mode:
+                0 - empty publications list
+                1 - full publications list
+                2 - first auth_pubs_num publications from sorted publications list
+                3 - first auth_pubs_num publications from shuffled list
+            auth_pubs_num: initial number of publications choosen for each author
+            rng: random numbers generator used to shuffle publications in mode 3
+
+        Returns:
+            List of lists. Each list contains author's initial publications
+
+        Raises:
+            AttributeError if given mode does not exist
+
+        """
+        if mode == 0:
+            return [[] for _ in self.authors]
+        elif mode == 1:
+            return [list(author.publications) for author in self.authors]
+        elif mode == 2:
+            return [
+                choose_first_publications(sort_pubs(author.publications), auth_pubs_num)
+                for author in self.authors
+            ]
+        elif mode == 3:
+            rng = rng or np.random.default_rng()
+            return [
+                choose_first_publications(
+                    shuffle_pubs(list(author.publications), rng), auth_pubs_num
+                )
+                for author in self.authors
+            ]
+        raise AttributeError("Wrong mode choosen. Supported modes: 0, 1, 2, 3")
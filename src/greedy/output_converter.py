@@ -1,11 +1,19 @@
-from typing import List
 import os
+from typing import Iterable, List, TextIO, Tuple
+
+from src.greedy.data_loader import iter_statements, parse_value
 from src.greedy.publication import Publication
 from src.greedy.settings import (
     AUTHOR_ID,
     EMPLOYEES_NUM,
+    FINAL_GOAL_FUN,
+    PROFILE_SUFFIX,
     PUBLICATION_ID,
     PUBLICATIONS_NUM,
+    RESULT_AUTHORS_IDX,
+    RESULT_PUBLICATIONS_IDX,
+    RESULT_VECTOR,
+    SEED_VARIABLE,
     THRESHOLDS_SUFFIX,
 )
 
@@ -70,6 +78,26 @@ def convert_dictionary_to_vector(pubs_auths: dict, data: dict) -> List[List[int]
     return result
 
 
+def convert_pairs_to_vector(pairs: Iterable[List[int]], data: dict) -> List[List[int]]:
+    """
+    Converts (author's index, publication's index) pairs to vector
+
+    Args:
+        pairs: indices of authors and their accepted publications
+        data: contains information about authors and publications from input file
+
+    Returns:
+        vector in which each row is a single author and columns are his publications.
+        Every '1' in vector means that specific publication was choosen to be
+        published
+
+    """
+    result = get_empty_vector(data[EMPLOYEES_NUM], data[PUBLICATIONS_NUM])
+    for row, column in pairs:
+        result[row][column] += 1
+    return result
+
+
 def convert_publications_to_dictionary(publications: List[Publication]) -> dir:
     """
     Converts list of publications to dictionary
@@ -95,11 +123,15 @@ def convert_publications_to_dictionary(publications: List[Publication]) -> dir:
     return result_publications
 
 
+def get_department_name(input_path: str) -> str:
+    path = input_path.split("/")
+    return path[len(path) - 1].split(("-"))[0]
+
+
 def get_result_path(
     input_path: str, mode: int, idx: int, test_try: int, results_dir: str
 ) -> str:
-    path = input_path.split("/")
-    filename = path[len(path) - 1].split(("-"))[0]
+    filename = get_department_name(input_path)
     single_test_dir = os.path.join(results_dir, filename)
 
     if not os.path.exists(single_test_dir):
@@ -108,14 +140,125 @@ def get_result_path(
     return os.path.join(single_test_dir, f"{filename}_{mode}_{idx}_{test_try}.txt")
 
 
-def save_results(path: str, data: dir, goal: float, vec: List[List[int]]) -> None:
+def get_profile_path(result_path: str) -> str:
+    return os.path.splitext(result_path)[0] + PROFILE_SUFFIX
+
+
+def write_results_summary(
+    file: TextIO, data: dict, goal: float, seed: int = None
+) -> None:
+    """
+    Writes seed, goal function values for thresholds and final goal function
+    value. They are stored at the beginning of every result file.
+
+    Args:
+        file: opened result file
+        data: dictionary with goal function values for thresholds
+        goal: final value of goal function
+        seed: seed of random numbers generator (not saved if None)
+
+    """
+    if seed is not None:
+        file.write(f"{SEED_VARIABLE} = {seed};")
+        file.write("\n")
+        file.write("\n")
+    tmp_goals = data["threshold_goal_values"]
+    for threshold in tmp_goals:
+        file.write(f"{THRESHOLDS_SUFFIX}{threshold} = {tmp_goals[threshold]};")
+        file.write("\n")
+    file.write("\n")
+    file.write(f"{FINAL_GOAL_FUN} = {goal};")
+    file.write("\n")
+    file.write("\n")
+
+
+def save_results(
+    path: str, data: dir, goal: float, vec: List[List[int]], seed: int = None
+) -> None:
+    with open(path, "w") as f:
+        write_results_summary(f, data, goal, seed)
+        f.write(f"{RESULT_VECTOR} = {vec};")
+
+
+def save_sparse_results(
+    path: str,
+    data: dict,
+    goal: float,
+    pairs: List[List[int]],
+    shape: Tuple[int, int],
+    seed: int = None,
+) -> None:
+    """
+    Saves result with accepted (author's index, publication's index) pairs instead
+    of full vector. Pairs are stored as two lists of indices, sorted by author and
+    publication.
+
+    Args:
+        path: path to the result file
+        data: dictionary with goal function values for thresholds
+        goal: final value of goal function
+        pairs: indices of authors and their accepted publications
+        shape: number of authors and number of publications (size of vector)
+        seed: seed of random numbers generator (not saved if None)
+
+    """
+    authors_idx, pubs_idx = zip(*sorted(map(tuple, pairs))) if pairs else ((), ())
     with open(path, "w") as f:
-        tmp_goals = data["threshold_goal_values"]
-        for threshold in tmp_goals:
-            f.write(f"{THRESHOLDS_SUFFIX}{threshold} = {tmp_goals[threshold]};")
-            f.write("\n")
+        write_results_summary(f, data, goal, seed)
+        f.write(f"{EMPLOYEES_NUM} = {shape[0]};")
         f.write("\n")
-        f.write(f"final_goal_function = {goal};")
+        f.write(f"{PUBLICATIONS_NUM} = {shape[1]};")
         f.write("\n")
+        f.write(f"{RESULT_AUTHORS_IDX} = {list(authors_idx)};")
         f.write("\n")
-        f.write(f"vector = {vec};")
\ No newline at end of file
+        f.write(f"{RESULT_PUBLICATIONS_IDX} = {list(pubs_idx)};")
+
+
+def load_results(path: str, with_pairs: bool = True) -> dict:
+    """
+    Loads result file saved by save_results() or save_sparse_results().
+
+    Args:
+        path: path to the result file
+        with_pairs: if False, accepted pairs (or vector) are not parsed. They are
+            the last variables of result file, so reading stops on them
+
+    Returns:
+        dictionary with variables from result file. Goal function values for
+        thresholds are stored under "threshold_goal_values" key (thresholds as
+        keys). Accepted pairs of sparse file are stored under RESULT_AUTHORS_IDX
+        and RESULT_PUBLICATIONS_IDX keys, vector of dense file under
+        RESULT_VECTOR key
+
+    """
+    skipped = [RESULT_AUTHORS_IDX, RESULT_PUBLICATIONS_IDX, RESULT_VECTOR]
+    result = {"threshold_goal_values": {}}
+    with open(path, "r") as file:
+        for name, raw in iter_statements(file):
+            if not with_pairs and name in skipped:
+                break
+            if name.startswith(THRESHOLDS_SUFFIX):
+                threshold = int(name[len(THRESHOLDS_SUFFIX) :])
+                result["threshold_goal_values"][threshold] = parse_value(raw)
+            else:
+                result[name] = parse_value(raw)
+    return result
+
+
+def export_dense_results(path: str, dense_path: str) -> None:
+    """
+    Converts sparse result file to dense one (with full vector), ex. for tools that
+    need vector of every result.
+
+    Args:
+        path: path to the sparse result file
+        dense_path: path to the dense result file
+
+    """
+    result = load_results(path)
+    pairs = zip(
+        result[RESULT_AUTHORS_IDX].tolist(), result[RESULT_PUBLICATIONS_IDX].tolist()
+    )
+    vec = convert_pairs_to_vector(pairs, result)
+    goal = result[FINAL_GOAL_FUN]
+    save_results(dense_path, result, goal, vec, result.get(SEED_VARIABLE))
@@ -0,0 +1,127 @@
+import cProfile
+import io
+import json
+import pstats
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Iterator
+
+# Number of the most expensive functions included in report of profiled iteration
+PROFILE_STATS_LINES = 30
+
+
+class NullContext:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+_NULL_CONTEXT = NullContext()
+
+
+class NullProfiler:
+    """
+    Profiler used when profiling is off. Its phases do nothing, so the only cost
+    of profiling hooks is a method call per phase.
+    """
+
+    enabled = False
+
+    def phase(self, name: str) -> NullContext:
+        return _NULL_CONTEXT
+
+    def iteration(self, idx: int) -> NullContext:
+        return _NULL_CONTEXT
+
+    def count(self, name: str, value: int = 1) -> None:
+        pass
+
+    def add_time(self, name: str, seconds: float) -> None:
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class Profiler:
+    """
+    Measures time (monotonic clock) and number of calls of phases of the
+    algorithm. Single iteration can be profiled with cProfile.
+    """
+
+    enabled = True
+
+    def __init__(self, profiled_iteration: int = None):
+        """
+        Args:
+            profiled_iteration: number of iteration (counted from 0) profiled with
+                cProfile (no iteration is profiled if None)
+
+        """
+        self.times = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.counters = defaultdict(int)
+        self.profiled_iteration = profiled_iteration
+        self.iteration_profile = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.times[name] += time.perf_counter() - start
+            self.calls[name] += 1
+
+    @contextmanager
+    def iteration(self, idx: int) -> Iterator[None]:
+        self.count("iterations")
+        if not idx == self.profiled_iteration:
+            yield
+            return
+
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            stream = io.StringIO()
+            stats = pstats.Stats(profile, stream=stream)
+            stats.sort_stats("cumulative").print_stats(PROFILE_STATS_LINES)
+            self.iteration_profile = {"iteration": idx, "stats": stream.getvalue()}
+
+    def count(self, name: str, value: int = 1) -> None:
+        self.counters[name] += value
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """
+        Adds single call of phase measured outside of the profiler (ex. before
+        the profiler was created).
+        """
+        self.times[name] += seconds
+        self.calls[name] += 1
+
+    def get_report(self) -> dict:
+        """
+        Returns:
+            dictionary with time and number of calls of every phase, counters and
+            cProfile statistics of profiled iteration
+
+        """
+        return {
+            "phases": {
+                name: {"time": self.times[name], "calls": self.calls[name]}
+                for name in self.times
+            },
+            "counters": dict(self.counters),
+            "iteration_profile": self.iteration_profile,
+        }
+
+
+def save_report(path: str, report: dict) -> None:
+    with open(path, "w") as file:
+        json.dump(report, file, indent=4)
@@ -1,4 +1,14 @@
 class Publication:
+    __slots__ = (
+        "id",
+        "is_mono",
+        "points",
+        "contribution",
+        "author",
+        "accepted",
+        "rank",
+    )
+
     def __init__(
         self,
         publication_id: str,
@@ -14,6 +24,7 @@ class Publication:
         self.contribution = contribution
         self.author = author
         self.accepted = accepted
+        self.rank = None
 
     def __str__(self):
         return f"id = {self.id} mono = {self.is_mono} points =  {self.points} contrib = {self.contribution} rate = {self.get_rate()} accepted = {self.accepted}"
@@ -44,11 +55,17 @@ class Publication:
     def get_points(self):
         return self.points
 
+    def get_rank(self):
+        return self.rank
+
     def get_rate(self):
         return self.points / self.contribution
 
     def set_author(self, author):
         self.author = author
 
+    def set_rank(self, rank: int):
+        self.rank = rank
+
     def set_is_accepted(self, is_accepted: bool):
         self.accepted = is_accepted
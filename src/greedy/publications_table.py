@@ -0,0 +1,41 @@
+from typing import List
+
+import numpy as np
+
+from src.greedy.author import Author
+from src.greedy.publication import Publication
+
+
+class PublicationsTable:
+    """
+    Struct-of-arrays view of publications ranking. Element `rank` of every array
+    describes publication ranking[rank].
+    """
+
+    def __init__(self, ranking: List[Publication], authors: List[Author]):
+        authors_idx_map = {id(author): idx for idx, author in enumerate(authors)}
+
+        self.publications = ranking
+        self.authors = authors
+        self.points = np.array([pub.get_points() for pub in ranking], dtype=float)
+        self.contribs = np.array(
+            [pub.get_contribution() for pub in ranking], dtype=float
+        )
+        self.rates = self.points / self.contribs
+        self.is_mono = np.array([pub.is_monograph() for pub in ranking], dtype=bool)
+        self.author_idx = np.array(
+            [authors_idx_map[id(pub.get_author())] for pub in ranking], dtype=np.int64
+        )
+
+    def __len__(self):
+        return len(self.publications)
+
+    def get_ranks(self, publications: List[Publication]) -> np.ndarray:
+        ranks = (pub.get_rank() for pub in publications)
+        return np.fromiter(ranks, dtype=np.int64, count=len(publications))
+
+    def get_publications(self, ranks: List[int]) -> List[Publication]:
+        return [self.publications[rank] for rank in ranks]
+
+    def get_authors_contrib_sums(self) -> List[float]:
+        return [author.get_accepted_pubs_contrib_sum() for author in self.authors]
@@ -0,0 +1,79 @@
+from itertools import compress
+from typing import List
+
+from src.greedy.author import Author
+from src.greedy.publication import Publication as Pub
+
+
+def sort_publications(publications: List[Pub]) -> List[Pub]:
+    """
+    Sorts publications by their rate and points.
+
+    Args:
+        publications: list of publications
+
+    Returns:
+        sorted list
+
+    """
+    return sorted(
+        publications, key=lambda x: (x.get_rate(), x.get_points()), reverse=True
+    )
+
+
+def rank_publications(authors: List[Author]) -> List[Pub]:
+    """
+    Sorts all authors' publications with sort_publications() and stores their
+    positions in ranking. Rate and points of publication never change, so ranking
+    is computed once per problem instance. Sorting is stable, so any sublist of
+    ranking has the same order as sorted sublist.
+
+    Args:
+        authors: list of authors
+
+    Returns:
+        sorted list of all publications
+
+    """
+    publications = []
+    for author in authors:
+        publications += author.publications
+
+    ranking = sort_publications(publications)
+    for rank, pub in enumerate(ranking, 0):
+        pub.set_rank(rank)
+    return ranking
+
+
+def order_by_ranking(pubs: List[Pub], ranking: List[Pub]) -> List[Pub]:
+    """
+    Returns publications in ranking order. Publications are marked in bitmap over
+    ranking, so no sorting is needed.
+
+    Args:
+        pubs: publications from ranking
+        ranking: all publications sorted by rank_publications()
+
+    Returns:
+        sorted list of publications
+
+    """
+    selected = bytearray(len(ranking))
+    for pub in pubs:
+        selected[pub.get_rank()] = 1
+    return list(compress(ranking, selected))
+
+
+def get_ranked_publications_to_considerate(ranking: List[Pub]) -> List[Pub]:
+    """
+    Returns publications that are not accepted, in ranking order. Ranking is not
+    sorted again.
+
+    Args:
+        ranking: all publications sorted by rank_publications()
+
+    Returns:
+        sorted list of publications to considerate
+
+    """
+    return [pub for pub in ranking if not pub.is_accepted()]
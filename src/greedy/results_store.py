@@ -0,0 +1,150 @@
+import csv
+import os
+import uuid
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+# Columns of results store and their types. Every row describes best goal
+# function value saved for single threshold of single run, so values of the
+# whole run (ex. final goal function value) are repeated for its thresholds.
+# Run stopped by anytime limits before its first threshold has single row with
+# empty threshold and threshold goal. Rows written by single call of the runner
+# share run id.
+COLUMNS = {
+    "department": str,
+    "mode": int,
+    "test_num": int,
+    "test_try": int,
+    "seed": int,
+    "threshold": int,
+    "threshold_goal": float,
+    "final_goal": float,
+    "wall_time": float,
+    "stop_reason": str,
+    "run_id": str,
+    "result_file": str,
+}
+
+# Columns added after the first version of the store. They are empty in rows of
+# older stores, other columns are required.
+OPTIONAL_COLUMNS = ["stop_reason", "run_id"]
+
+# Values of empty cells after loading
+NO_THRESHOLD = -1
+EMPTY_VALUES = {"threshold": NO_THRESHOLD, "threshold_goal": np.nan}
+
+# Columns identifying test. Result file of test is overwritten when test is run
+# again, so only rows of its latest run are up to date.
+TEST_KEY_COLUMNS = ["department", "mode", "test_num", "test_try"]
+
+
+def create_run_id() -> str:
+    return uuid.uuid4().hex
+
+
+def read_header(path: str) -> List[str]:
+    with open(path, "r", newline="") as file:
+        return next(csv.reader(file), [])
+
+
+def append_rows(path: str, rows: Iterable[dict]) -> None:
+    """
+    Appends rows to results store (csv file). Header is written when store is
+    created. Store written by older version (with other columns) is rewritten
+    with current columns first.
+
+    Args:
+        path: path to the results store
+        rows: dictionaries with values of all COLUMNS
+
+    """
+    is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+    if not is_new and read_header(path) != list(COLUMNS):
+        with open(path, "r", newline="") as file:
+            old_rows = list(csv.DictReader(file))
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(
+                file, fieldnames=list(COLUMNS), restval="", extrasaction="ignore"
+            )
+            writer.writeheader()
+            writer.writerows(old_rows)
+
+    with open(path, "a", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(COLUMNS))
+        if is_new:
+            writer.writeheader()
+        writer.writerows(rows)
+
+
+def select_latest_runs(store: Dict[str, np.ndarray]) -> dict:
+    """
+    Selects rows of the latest run of every test (rows of earlier runs describe
+    result files that were overwritten).
+    """
+    keys = list(zip(*(store[column].tolist() for column in TEST_KEY_COLUMNS)))
+    run_ids = store["run_id"].tolist()
+    latest = dict(zip(keys, run_ids))
+    mask = np.array(
+        [latest[key] == run_id for key, run_id in zip(keys, run_ids)], dtype=bool
+    )
+    return select_rows(store, mask)
+
+
+def load_store(path: str, latest_runs: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Reads the whole results store at once.
+
+    Args:
+        path: path to the results store
+        latest_runs: select only rows of the latest run of every test
+
+    Returns:
+        dictionary with column names as keys and arrays of column values as values
+
+    Raises:
+        ValueError if store has no required column
+
+    """
+    values: Dict[str, List[str]] = {column: [] for column in COLUMNS}
+    with open(path, "r", newline="") as file:
+        reader = csv.DictReader(file)
+        missing = [
+            column
+            for column in COLUMNS
+            if column not in (reader.fieldnames or [])
+            and column not in OPTIONAL_COLUMNS
+        ]
+        if reader.fieldnames and missing:
+            raise ValueError(
+                f"Results store {path} has no columns: {', '.join(missing)}"
+            )
+        for row in reader:
+            for column in COLUMNS:
+                values[column].append(
+                    row.get(column) or str(EMPTY_VALUES.get(column, ""))
+                )
+
+    result = {}
+    for column, column_type in COLUMNS.items():
+        if column_type is str:
+            result[column] = np.array(values[column], dtype=str)
+        else:
+            result[column] = np.array(values[column], dtype=str).astype(column_type)
+    return select_latest_runs(result) if latest_runs else result
+
+
+def select_rows(store: Dict[str, np.ndarray], mask: np.ndarray) -> dict:
+    return {column: values[mask] for column, values in store.items()}
+
+
+def split_by_department(store: Dict[str, np.ndarray]) -> Dict[str, dict]:
+    """
+    Splits results store into stores of single departments (in order of their
+    first rows).
+    """
+    departments, first_rows = np.unique(store["department"], return_index=True)
+    return {
+        department: select_rows(store, store["department"] == department)
+        for department in departments[np.argsort(first_rows)]
+    }
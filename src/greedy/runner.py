@@ -0,0 +1,330 @@
+import multiprocessing
+import os
+import time
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+import numpy as np
+
+from src.greedy.greedy import run_algorithm
+from src.greedy.instance import ProblemInstance
+from src.greedy.output_converter import (
+    convert_pairs_to_vector,
+    get_department_name,
+    get_profile_path,
+    get_result_path,
+    save_results,
+    save_sparse_results,
+)
+from src.greedy.profiler import NULL_PROFILER, Profiler, save_report
+from src.greedy.results_store import append_rows, create_run_id
+from src.greedy.search_state import SearchState
+from src.greedy.settings import (
+    ALPHA,
+    DENSE_RESULTS,
+    EMPLOYEES_NUM,
+    HEURISTIC_RESULT_PUBS_LEN,
+    MAX_EVALUATIONS,
+    PATIENCE,
+    PUBLICATIONS_NUM,
+    RESULTS_FORMAT,
+    RESULTS_STORE_FILE,
+    SPARSE_RESULTS,
+    THRESHOLDS,
+    TIME_LIMIT,
+)
+
+# Dataset shared by all jobs run in current process. It is set once per worker by
+# init_worker() (inherited without copying when processes are forked).
+_shared_data = None
+# Problem instance built from shared dataset. Jobs only reset it.
+_shared_instance = None
+# Time of building shared instance (ranking of publications included). It is
+# reported as "prepare" phase by the first profiled job of the worker.
+_prepare_time = None
+
+
+class Job(NamedTuple):
+    mode: int
+    auth_pubs_num: int
+    test_num: int
+    test_try: int
+    seed: int
+    thresholds: Tuple[int, ...] = tuple(THRESHOLDS)
+    alpha: float = ALPHA
+    heuristic_len: float = HEURISTIC_RESULT_PUBS_LEN
+    profile: bool = False
+    profiled_iteration: int = None
+    time_limit: float = TIME_LIMIT
+    max_evaluations: int = MAX_EVALUATIONS
+    patience: int = PATIENCE
+
+
+class JobResult(NamedTuple):
+    job: Job
+    pairs: List[List[int]]
+    goal_fun: float
+    threshold_goal_values: dict
+    wall_time: float
+    profile: dict = None
+    stop_reason: str = None
+
+
+def get_job_seed(seed: int, mode: int, test_num: int, test_try: int) -> int:
+    """
+    Derives independent seed for single test from base seed of experiment.
+    """
+    sequence = np.random.SeedSequence(seed, spawn_key=(mode, test_num, test_try))
+    return int(sequence.generate_state(1)[0])
+
+
+def create_jobs(
+    mode: int,
+    auth_pubs_num: int,
+    number_of_tests: int,
+    test_try: int,
+    seed: int,
+    thresholds: List[int] = THRESHOLDS,
+    alpha: float = ALPHA,
+    heuristic_len: float = HEURISTIC_RESULT_PUBS_LEN,
+) -> List[Job]:
+    """
+    Creates tests of single try of given mode.
+
+    Args:
+        mode: mode of choosing initial publications
+        auth_pubs_num: initial number of publications choosen for each author
+        number_of_tests: number of tests
+        test_try: number of try
+        seed: base seed of experiment
+        thresholds: numbers of full iterations after which goal function values
+            are saved (the last one is iteration budget of test)
+        alpha: probability of publication's revocation
+        heuristic_len: heuristic number of publications to publish divided by
+            number of publications
+
+    Returns:
+        list of tests
+
+    """
+    return [
+        Job(
+            mode,
+            auth_pubs_num,
+            test_num,
+            test_try,
+            get_job_seed(seed, mode, test_num, test_try),
+            tuple(thresholds),
+            alpha,
+            heuristic_len,
+        )
+        for test_num in range(number_of_tests)
+    ]
+
+
+def init_worker(data: dict) -> None:
+    global _shared_data, _shared_instance, _prepare_time
+    start = time.perf_counter()
+    _shared_data = data
+    _shared_instance = ProblemInstance(data) if data is not None else None
+    _prepare_time = time.perf_counter() - start if data is not None else None
+
+
+def run_job(job: Job) -> JobResult:
+    """
+    Runs single test on shared dataset. Shared dataset is not modified, shared
+    problem instance is reset to initial result of the test.
+
+    Args:
+        job: parameters of test
+
+    Returns:
+        accepted publications (as (author's index, publication's index) pairs),
+        goal function value, goal function values for thresholds, wall time of
+        the test, profiling report (if job.profile is True) and reason of
+        stopping the test
+
+    """
+    global _prepare_time
+    start = time.perf_counter()
+    profiler = Profiler(job.profiled_iteration) if job.profile else NULL_PROFILER
+    if profiler.enabled and _prepare_time is not None:
+        profiler.add_time("prepare", _prepare_time)
+        _prepare_time = None
+    rng = np.random.default_rng(job.seed)
+    instance = _shared_instance
+    with profiler.phase("reset"):
+        initial_pubs = instance.get_initial_publications(
+            job.mode, job.auth_pubs_num, rng
+        )
+        instance.reset(initial_pubs)
+    state = SearchState()
+
+    heuristic_len = int(_shared_data[PUBLICATIONS_NUM] * job.heuristic_len)
+    _, goal_function = run_algorithm(
+        _shared_data,
+        heuristic_len,
+        rng=rng,
+        instance=instance,
+        state=state,
+        thresholds=list(job.thresholds),
+        alpha=job.alpha,
+        profiler=profiler,
+        time_limit=job.time_limit,
+        max_evaluations=job.max_evaluations,
+        patience=job.patience,
+    )
+
+    pairs = instance.get_pairs(state.best_ranks).tolist()
+    return JobResult(
+        job,
+        pairs,
+        goal_function,
+        state.threshold_goal_values,
+        time.perf_counter() - start,
+        profiler.get_report() if profiler.enabled else None,
+        state.stop_reason,
+    )
+
+
+def run_jobs(jobs: List[Job], data: dict, workers: int = None) -> Iterator[JobResult]:
+    """
+    Runs tests in pool of processes. Dataset is sent to every worker once.
+
+    Args:
+        jobs: tests to run
+        data: normalized data from input file
+        workers: number of processes (all cores if None)
+
+    Returns:
+        Iterator over results in the same order as jobs
+
+    """
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        init_worker(data)
+        yield from map(run_job, jobs)
+        return
+
+    with multiprocessing.Pool(workers, init_worker, (data,)) as pool:
+        yield from pool.imap(run_job, jobs)
+
+
+def save_job_result(
+    result: JobResult,
+    data: dict,
+    filepath: str,
+    results_dir: str,
+    results_format: str = RESULTS_FORMAT,
+) -> str:
+    """
+    Saves result of single test. Profiling report (if test was profiled) is saved
+    next to the result file.
+
+    Args:
+        result: result of test
+        data: normalized data from input file
+        filepath: path to the input file
+        results_dir: directory to store results
+        results_format: SPARSE_RESULTS (accepted pairs) or DENSE_RESULTS (vector)
+
+    Returns:
+        path to the result file
+
+    Raises:
+        AttributeError if given format does not exist
+
+    """
+    job = result.job
+    result_data = {"threshold_goal_values": result.threshold_goal_values}
+    path = get_result_path(filepath, job.mode, job.test_num, job.test_try, results_dir)
+
+    if results_format == SPARSE_RESULTS:
+        shape = (data[EMPLOYEES_NUM], data[PUBLICATIONS_NUM])
+        save_sparse_results(
+            path, result_data, result.goal_fun, result.pairs, shape, job.seed
+        )
+    elif results_format == DENSE_RESULTS:
+        result_vector = convert_pairs_to_vector(result.pairs, data)
+        save_results(path, result_data, result.goal_fun, result_vector, job.seed)
+    else:
+        raise AttributeError(f"Wrong results format choosen: {results_format}")
+
+    if result.profile is not None:
+        save_report(get_profile_path(path), result.profile)
+    return path
+
+
+def get_store_rows(
+    result: JobResult, filepath: str, result_path: str, run_id: str
+) -> List[dict]:
+    """
+    Prepares rows of results store for single test (one row per threshold). Test
+    stopped before its first threshold gets single row without threshold, so
+    every test is in the store.
+
+    Args:
+        result: result of test
+        filepath: path to the input file
+        result_path: path to the result file of test
+        run_id: identifier of run of the runner (see create_run_id())
+
+    Returns:
+        list of rows
+
+    """
+    job = result.job
+    threshold_goal_values = list(result.threshold_goal_values.items()) or [("", "")]
+    return [
+        {
+            "department": get_department_name(filepath),
+            "mode": job.mode,
+            "test_num": job.test_num,
+            "test_try": job.test_try,
+            "seed": job.seed,
+            "threshold": threshold,
+            "threshold_goal": goal,
+            "final_goal": result.goal_fun,
+            "wall_time": result.wall_time,
+            "stop_reason": result.stop_reason or "",
+            "run_id": run_id,
+            "result_file": result_path,
+        }
+        for threshold, goal in threshold_goal_values
+    ]
+
+
+def run_experiments(
+    jobs: List[Job],
+    data: dict,
+    filepath: str,
+    results_dir: str,
+    workers: int = None,
+    results_format: str = RESULTS_FORMAT,
+) -> Dict[Tuple[int, int], float]:
+    """
+    Runs tests in parallel and saves their results in jobs order. Results are
+    also appended to results store (results_dir/RESULTS_STORE_FILE).
+
+    Args:
+        jobs: tests to run
+        data: normalized data from input file
+        filepath: path to the input file
+        results_dir: directory to store results
+        workers: number of processes (all cores if None)
+        results_format: format of result files (SPARSE_RESULTS or DENSE_RESULTS)
+
+    Returns:
+        dictionary with (mode, test_try) as keys and max goal function values as
+        values
+
+    """
+    max_goals = {}
+    store_path = os.path.join(results_dir, RESULTS_STORE_FILE)
+    run_id = create_run_id()
+    for result in run_jobs(jobs, data, workers):
+        path = save_job_result(result, data, filepath, results_dir, results_format)
+        append_rows(store_path, get_store_rows(result, filepath, path, run_id))
+
+        key = (result.job.mode, result.job.test_try)
+        max_goals[key] = max(max_goals.get(key, 0), result.goal_fun)
+    return max_goals
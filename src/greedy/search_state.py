@@ -0,0 +1,166 @@
+import time
+from math import inf
+from typing import Dict, List
+
+import numpy as np
+
+# Reasons of stopping the run:
+# STOP_THRESHOLDS - goal function was calculated more times than the last threshold
+# STOP_EVALUATIONS - budget of goal function calculations was used
+# STOP_PATIENCE - best result was not improved for patience iterations
+# STOP_DEADLINE - time limit of the run passed
+STOP_THRESHOLDS = "thresholds"
+STOP_EVALUATIONS = "evaluations"
+STOP_PATIENCE = "patience"
+STOP_DEADLINE = "deadline"
+
+
+class SearchState:
+    """
+    State of single run of the algorithm: number of goal function calculations,
+    best result found so far and best goal function values saved for thresholds.
+    Input data is not modified by the run, so it can be shared between runs.
+    Best result is stored as ranks of publications (indices in ranking and
+    publications table), so it does not share any state with authors and
+    publications changed by the search.
+
+    Run can also be stopped earlier by anytime limits: deadline, budget of goal
+    function calculations and patience (number of iterations without improvement
+    of the best result). Limits are checked between iterations, so the last
+    iteration is always finished and its result is taken into account. The first
+    iteration is always run, so there is a result even if limits are very tight.
+    """
+
+    __slots__ = (
+        "thresholds",
+        "next_threshold",
+        "goal_calculations_num",
+        "threshold_goal_values",
+        "best_ranks",
+        "best_goal_fun",
+        "_next_threshold_idx",
+        "deadline",
+        "max_evaluations",
+        "patience",
+        "iterations",
+        "stop_reason",
+        "_last_improvement",
+    )
+
+    def __init__(
+        self,
+        thresholds: List[int] = (),
+        time_limit: float = None,
+        max_evaluations: int = None,
+        patience: int = None,
+    ):
+        self.reset(thresholds, time_limit, max_evaluations, patience)
+
+    def reset(
+        self,
+        thresholds: List[int],
+        time_limit: float = None,
+        max_evaluations: int = None,
+        patience: int = None,
+    ) -> None:
+        """
+        Starts new run with given thresholds (numbers of goal function
+        calculations after which best goal function value is saved) and anytime
+        limits. Without thresholds run is stopped only by anytime limits (or
+        immediately if there are no limits).
+
+        Args:
+            thresholds: numbers of goal function calculations
+            time_limit: time of the run in seconds (no limit if None)
+            max_evaluations: budget of goal function calculations (no limit if
+                None)
+            patience: maximal number of iterations without improvement of the
+                best result (no limit if None)
+
+        """
+        self.thresholds = sorted(thresholds)
+        self.goal_calculations_num = 0
+        self.threshold_goal_values: Dict[int, float] = {}
+        self.best_ranks = np.empty(0, dtype=np.int64)
+        self.best_goal_fun = 0
+        self._next_threshold_idx = 0
+        self.next_threshold = self.thresholds[0] if self.thresholds else inf
+
+        self.deadline = inf if time_limit is None else time.monotonic() + time_limit
+        self.max_evaluations = inf if max_evaluations is None else max_evaluations
+        self.patience = inf if patience is None else patience
+        self.iterations = 0
+        self.stop_reason = None
+        self._last_improvement = 0
+
+    def has_limits(self) -> bool:
+        return self.deadline < inf or self.max_evaluations < inf or self.patience < inf
+
+    def is_finished(self) -> bool:
+        """
+        Returns True if goal function was calculated more times than the last
+        threshold or any anytime limit was reached. Reason of stopping the run is
+        saved in stop_reason.
+        """
+        if self.thresholds:
+            thresholds_passed = self.goal_calculations_num > self.thresholds[-1]
+        else:
+            thresholds_passed = not self.has_limits()
+
+        if thresholds_passed:
+            self.stop_reason = STOP_THRESHOLDS
+        elif not self.iterations:
+            return False
+        elif self.goal_calculations_num >= self.max_evaluations:
+            self.stop_reason = STOP_EVALUATIONS
+        elif self.iterations - self._last_improvement >= self.patience:
+            self.stop_reason = STOP_PATIENCE
+        elif self.deadline < inf and time.monotonic() >= self.deadline:
+            self.stop_reason = STOP_DEADLINE
+        return self.stop_reason is not None
+
+    def count_iteration(self) -> None:
+        self.iterations += 1
+
+    def count_evaluations(self, evaluations: int = 1) -> None:
+        """
+        Counts goal function calculations and saves best goal function value for
+        every threshold reached by these calculations. Threshold is reached by
+        calculation with number (counted from 0) equal to threshold.
+
+        Args:
+            evaluations: number of goal function calculations
+
+        """
+        end = self.goal_calculations_num + evaluations
+        while self.next_threshold < end:
+            self.__save_threshold_goal_value()
+        self.goal_calculations_num = end
+
+    def __save_threshold_goal_value(self) -> None:
+        goal_fun = self.best_goal_fun
+        if self._next_threshold_idx:
+            prev_threshold = self.thresholds[self._next_threshold_idx - 1]
+            goal_fun = max(goal_fun, self.threshold_goal_values[prev_threshold])
+        self.threshold_goal_values[self.next_threshold] = goal_fun
+
+        self._next_threshold_idx += 1
+        if self._next_threshold_idx < len(self.thresholds):
+            self.next_threshold = self.thresholds[self._next_threshold_idx]
+        else:
+            self.next_threshold = inf
+
+    def update_best_result(self, ranks: List[int], goal_fun: float) -> None:
+        """
+        Saves result if it is better than the best one. Ranks are copied to
+        compact array only when result is improved.
+
+        Args:
+            ranks: ranks of publications to publish
+            goal_fun: value of goal function
+
+        """
+        if self.best_goal_fun < goal_fun:
+            self.best_goal_fun = goal_fun
+            self.best_ranks = np.array(ranks, dtype=np.int64)
+            self._last_improvement = self.iterations + 1
@@ -34,6 +34,42 @@ THRESHOLDS = [1, 10, 100, 1000]
 # probability of publication's revocation
 ALPHA = 0.5
 
+# Anytime limits of single run: time limit in seconds, budget of goal function
+# calculations and maximal number of iterations without improvement of the best
+# result (None - no limit, run is stopped after the last threshold)
+TIME_LIMIT = None
+MAX_EVALUATIONS = None
+PATIENCE = None
+
+# Implementations of choosing publications to publish (results of all engines are
+# the same). CACHED_ENGINE caches only bookkeeping of accepted publications
+# between iterations (instead of reading them from authors), values of candidates
+# are not updated incrementally, they are evaluated again in every iteration
+PYTHON_ENGINE = "python"
+NUMPY_ENGINE = "numpy"
+CACHED_ENGINE = "cached"
+ENGINE = NUMPY_ENGINE
+
+# Base seed of experiments. Every test gets its own seed derived from it
+SEED = 0
+
+# Number of processes running tests (None - all cores)
+WORKERS = None
+
+# Maximal size of memory of single worker process in bytes (None - no limit)
+WORKER_MEMORY_LIMIT = None
+
+# Run tests for all input files from DIRPATH instead of FILEPATH
+BATCH_MODE = False
+
+# Default grid of experiments: modes of choosing initial publications, initial
+# number of publications of every author, number of tests in single try and
+# number of tries of mode 3 (shuffled publications)
+MODES = [0, 1, 2, 3]
+AUTH_PUBS_NUM = 2
+TESTS_NUM = 28
+TRIES_NUM = 25
+
 # Heuristic coefficient
 # length of result publications = HEURISTIC_RESULT_PUBS_LEN * length of publications
 HEURISTIC_RESULT_PUBS_LEN = 0.8
@@ -44,9 +80,33 @@ FILEPATH = "data/filozofia-input.txt"
 # Path to the directory with input files
 DIRPATH = "data"
 
+# Suffix of binary dataset files compiled from input files
+DATASET_SUFFIX = ".dataset"
+
 # Path to the directory where results will be stored
 RESULTS_DIR = "data/results/test"
 
+# Run manifest (wall time, peak RSS, best goal of every department) stored in
+# RESULTS_DIR
+MANIFEST_FILE = "manifest.json"
+
+# Results store (one csv table with goal function values of all tests) stored in
+# RESULTS_DIR
+RESULTS_STORE_FILE = "results.csv"
+
+# Suffix of profiling reports of tests (stored next to result files)
+PROFILE_SUFFIX = ".profile.json"
+
+# Benchmark suite: number of timed calls of every stage, thresholds of timed run
+# of the algorithm (the last one is its fixed budget), baseline report, allowed
+# relative increase of metric over baseline and differences of time (in seconds)
+# too small to be reported as regressions
+BENCHMARK_REPEAT = 3
+BENCHMARK_THRESHOLDS = [2]
+BENCHMARK_BASELINE = "data/benchmark/baseline.json"
+BENCHMARK_TOLERANCE = 0.2
+BENCHMARK_TIME_RESOLUTION = 0.005
+
 # Path to the directory where results will be stored
 PLOT_DATA = "data/results/ALHE_ograniczone_limity"
 
@@ -56,8 +116,31 @@ THRESHOLDS_SUFFIX = "threshold_"
 # Directory to store images
 RESULTS_IMAGES_DIR = "data/results/images"
 
+# Non-interactive matplotlib backend used to render plots
+PLOT_BACKEND = "Agg"
+
+# Suffix of files with hashes of plots' data (stored next to plots)
+PLOT_HASH_SUFFIX = ".sha256"
+
 # summaries file
 SUMMARIES_FILE = "data/results/summaries.txt"
 
 # final value of goal function stored in result file
 FINAL_GOAL_FUN = "final_goal_function"
+
+# seed of random numbers generator stored in result file
+SEED_VARIABLE = "seed"
+
+# Formats of result files:
+# SPARSE_RESULTS - indices of authors and publications of accepted pairs
+# DENSE_RESULTS - full vector (A x P) with ones for accepted pairs
+SPARSE_RESULTS = "sparse"
+DENSE_RESULTS = "dense"
+RESULTS_FORMAT = SPARSE_RESULTS
+
+# indices of authors and publications of accepted pairs stored in sparse result file
+RESULT_AUTHORS_IDX = "author_idx"
+RESULT_PUBLICATIONS_IDX = "publication_idx"
+
+# vector of accepted pairs stored in dense result file
+RESULT_VECTOR = "vector"
@@ -0,0 +1,124 @@
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+
+class SparseMatrix:
+    """
+    Author x publication matrix stored in CSR format. Only non-zero values are
+    kept: values of row `idx` are values[indptr[idx]:indptr[idx + 1]] and their
+    column indices are indices[indptr[idx]:indptr[idx + 1]].
+    """
+
+    def __init__(
+        self,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        values: np.ndarray,
+        shape: Tuple[int, int],
+    ):
+        self.indptr = indptr
+        self.indices = indices
+        self.values = values
+        self.shape = shape
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __eq__(self, other):
+        return (
+            self.shape == other.shape
+            and np.array_equal(self.indptr, other.indptr)
+            and np.array_equal(self.indices, other.indices)
+            and np.array_equal(self.values, other.values)
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[np.ndarray], columns: int) -> "SparseMatrix":
+        """
+        Creates matrix from dense rows. Rows are converted one by one, so the
+        whole dense matrix is never stored in memory.
+
+        Args:
+            rows: dense rows of matrix
+            columns: number of columns
+
+        Returns:
+            sparse matrix
+
+        """
+        indptr = [0]
+        indices = []
+        values = []
+        for row in rows:
+            row = np.asarray(row, dtype=float)
+            nonzero = np.flatnonzero(row)
+            indices.append(nonzero)
+            values.append(row[nonzero])
+            indptr.append(indptr[-1] + len(nonzero))
+
+        return cls(
+            np.array(indptr, dtype=np.int64),
+            np.concatenate(indices).astype(np.int64) if indices else np.zeros(0, int),
+            np.concatenate(values) if values else np.zeros(0, float),
+            (len(indptr) - 1, columns),
+        )
+
+    @classmethod
+    def from_dense(cls, dense: List[List[float]]) -> "SparseMatrix":
+        columns = len(dense[0]) if len(dense) else 0
+        return cls.from_rows(dense, columns)
+
+    def get_nonzero_number(self) -> int:
+        return len(self.values)
+
+    def get_row(self, idx: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns column indices and values of non-zero elements in given row.
+        """
+        start, end = self.indptr[idx], self.indptr[idx + 1]
+        return self.indices[start:end], self.values[start:end]
+
+    def to_dense(self) -> List[List[float]]:
+        result = [[0 for _ in range(self.shape[1])] for _ in range(self.shape[0])]
+        for row in range(self.shape[0]):
+            for column, value in zip(*self.get_row(row)):
+                result[row][column] = value
+        return result
+
+
+def as_sparse(matrix) -> SparseMatrix:
+    """
+    Returns given matrix in sparse format. Dense matrices (lists of lists or 2-D
+    arrays) are converted.
+    """
+    if isinstance(matrix, SparseMatrix):
+        return matrix
+    return SparseMatrix.from_dense(matrix)
+
+
+def get_common_nonzero(
+    points: SparseMatrix, contribs: SparseMatrix, idx: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Finds publications with positive points and contribution for single author.
+
+    Args:
+        points: publications' points for authors
+        contribs: publications' contributions for authors
+        idx: author's index (row)
+
+    Returns:
+        publications' indices, points and contributions (sorted by publication
+        index)
+
+    """
+    points_idx, points_values = points.get_row(idx)
+    contribs_idx, contribs_values = contribs.get_row(idx)
+    common, in_points, in_contribs = np.intersect1d(
+        points_idx, contribs_idx, assume_unique=True, return_indices=True
+    )
+    pts = points_values[in_points]
+    ctbs = contribs_values[in_contribs]
+    mask = (pts > 0) & (ctbs > 0)
+    return common[mask], pts[mask], ctbs[mask]
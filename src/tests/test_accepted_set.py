@@ -0,0 +1,74 @@
+import os
+
+import numpy as np
+
+from src.greedy.accepted_set import AcceptedSet
+from src.greedy.data_loader import load_data_from_file
+from src.greedy.data_preparation import normalize_data
+from src.greedy.greedy import get_all_accepted_publications
+from src.greedy.instance import ProblemInstance
+from src.greedy.settings import DIRPATH
+
+INPUT_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "..", DIRPATH, "filozofia-input.txt"
+)
+
+
+def prepare_instance(mode: int = 0) -> ProblemInstance:
+    instance = ProblemInstance(normalize_data(load_data_from_file(INPUT_FILE)))
+    instance.reset(instance.get_initial_publications(mode))
+    return instance
+
+
+def get_authors_sums(instance: ProblemInstance) -> list:
+    return [author.get_accepted_pubs_contrib_sum() for author in instance.authors]
+
+
+def test_accepted_set_contains_authors_publications():
+    instance = prepare_instance()
+    accepted_set = AcceptedSet(instance.table)
+
+    expected = instance.table.get_ranks(get_all_accepted_publications(instance.authors))
+    assert accepted_set.get_ranks().tolist() == expected.tolist()
+    assert accepted_set.authors_sums == get_authors_sums(instance)
+    assert not np.intersect1d(accepted_set.get_candidates(), expected).size
+    assert len(accepted_set.get_candidates()) + len(expected) == len(instance.table)
+
+
+def test_accept_and_cancel_update_authors_sums():
+    instance = prepare_instance()
+    accepted_set = AcceptedSet(instance.table)
+    cancelled = accepted_set.get_ranks()[::3].tolist()
+
+    accepted_set.cancel(cancelled)
+    for pub in instance.table.get_publications(cancelled):
+        pub.get_author().remove_from_accepted_publications(pub)
+    assert accepted_set.authors_sums == get_authors_sums(instance)
+    assert not accepted_set.is_accepted[cancelled].any()
+
+    accepted = cancelled[::-1]
+    accepted_set.accept(accepted)
+    for pub in instance.table.get_publications(accepted):
+        assert pub.get_author().accept_publication(pub)
+    assert accepted_set.authors_sums == get_authors_sums(instance)
+
+    expected = instance.table.get_ranks(get_all_accepted_publications(instance.authors))
+    assert accepted_set.get_ranks().tolist() == expected.tolist()
+
+
+def test_sync_updates_authors():
+    instance = prepare_instance()
+    accepted_set = AcceptedSet(instance.table)
+    cancelled = accepted_set.get_ranks()[1::2].tolist()
+    accepted_set.cancel(cancelled)
+
+    accepted_set.sync()
+
+    accepted = get_all_accepted_publications(instance.authors)
+    assert instance.table.get_ranks(accepted).tolist() == (
+        accepted_set.get_ranks().tolist()
+    )
+    assert accepted_set.authors_sums == get_authors_sums(instance)
+    assert AcceptedSet(instance.table).get_ranks().tolist() == (
+        accepted_set.get_ranks().tolist()
+    )
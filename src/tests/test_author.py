@@ -325,3 +325,49 @@ def test_remove_from_accepted_publications():
         a.remove_from_accepted_publications(pub)
         assert len(a.publications) == 3
         assert len(a.accepted_publications) == 3 - idx
+
+
+def test_accept_publication_twice():
+    a = create_example_author(contrib=4.0)
+    pubs = [create_example_publication(publication_id=i, contrib=1) for i in range(2)]
+    a.load_publications(pubs)
+    assert a.accept_publication(pubs[0])
+    assert not a.accept_publication(pubs[0])
+    assert compare_lists(a.accepted_publications, [pubs[0]])
+
+
+def test_accept_publication_not_on_publications_list():
+    a = create_example_author(contrib=4.0)
+    a.load_publications([create_example_publication(publication_id="1")])
+    try:
+        a.accept_publication(create_example_publication(publication_id="2"))
+    except AttributeError:
+        return
+    assert False
+
+
+def test_get_pubs_to_considerate_after_remove_from_accepted_publications():
+    a = create_example_author(contrib=4.0)
+    pubs = [create_example_publication(publication_id=i, contrib=1) for i in range(3)]
+    a.load_publications(pubs)
+    for pub in pubs:
+        a.accept_publication(pub)
+    a.remove_from_accepted_publications(pubs[1])
+    assert a.get_pubs_to_considerate() == [pubs[1]]
+    assert a.get_accepted_publications() == (pubs[0], pubs[2])
+
+
+def test_accepted_publications_are_cached_until_change():
+    a = create_example_author(contrib=4.0)
+    pubs = [create_example_publication(publication_id=i, contrib=1) for i in range(3)]
+    a.load_publications(pubs)
+    a.accept_publication(pubs[0])
+
+    accepted = a.get_accepted_publications()
+    assert a.get_accepted_publications() is accepted
+    a.accept_publication(pubs[1])
+    assert a.get_accepted_publications() == (pubs[0], pubs[1])
+    a.remove_from_accepted_publications(pubs[0])
+    assert a.get_accepted_publications() == (pubs[1],)
+    a.reset_accepted_publications()
+    assert a.get_accepted_publications() == ()
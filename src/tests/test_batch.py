@@ -0,0 +1,90 @@
+import json
+import os
+import shutil
+
+from src.greedy.batch import BatchJob, run_batch, split_batch_jobs
+from src.greedy.generator import generate_instance, save_generated_files
+from src.greedy.runner import create_jobs
+from src.greedy.settings import DIRPATH, MANIFEST_FILE
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", DIRPATH)
+
+
+def copy_input_files(tmp_path, filenames):
+    paths = []
+    for filename in filenames:
+        path = str(tmp_path / filename)
+        shutil.copy(os.path.join(DATA_DIR, filename), path)
+        paths.append(path)
+    return paths
+
+
+def test_run_batch(tmp_path):
+    files = copy_input_files(
+        tmp_path, ["filozofia-input.txt", "nauki_prawne-input.txt"]
+    )
+    results_dir = str(tmp_path / "results")
+    jobs = create_jobs(0, 2, 1, 0, 0) + create_jobs(3, 2, 1, 0, 0)
+
+    manifest = run_batch(files, jobs, results_dir, workers=2)
+
+    departments = manifest["departments"]
+    assert [info["file"] for info in departments] == files[::-1]
+    for info in departments:
+        assert info["jobs"] == 2
+        assert info["failed_jobs"] == 0
+        assert info["best_goal"] > 0
+        assert list(info["best_goal_by_mode"]) == ["0", "3"]
+        assert info["stop_reasons"] == {"thresholds": 2}
+        assert info["peak_rss_kb"] > 0
+        assert 0 < info["cpu_time"]
+        assert info["wall_time"] >= 0
+    with open(os.path.join(results_dir, MANIFEST_FILE)) as file:
+        assert json.load(file) == manifest
+    assert len(os.listdir(os.path.join(results_dir, "filozofia"))) == 2
+
+
+def test_run_batch_with_broken_input_file(tmp_path):
+    files = copy_input_files(tmp_path, ["filozofia-input.txt"])
+    broken = tmp_path / "broken-input.txt"
+    broken.write_text("A = 3;")
+    results_dir = str(tmp_path / "results")
+
+    manifest = run_batch(
+        files + [str(broken)], create_jobs(0, 2, 1, 0, 0), results_dir, 1
+    )
+
+    filozofia, broken_info = manifest["departments"]
+    assert filozofia["jobs"] == 1
+    assert broken_info["file"] == str(broken)
+    assert broken_info["jobs"] == 0
+    assert len(broken_info["errors"]) == 1
+
+
+def test_run_batch_measures_peak_rss_of_every_department(tmp_path):
+    big_path = str(tmp_path / "big-input.txt")
+    (dataset_path,) = save_generated_files(
+        big_path, generate_instance(300, 20000, seed=0), text=False
+    )
+    files = [dataset_path] + copy_input_files(tmp_path, ["filozofia-input.txt"])
+
+    manifest = run_batch(
+        files, create_jobs(0, 1, 1, 0, 0, [1]), str(tmp_path / "results"), 1
+    )
+
+    big, small = manifest["departments"]
+    assert big["file"] == dataset_path
+    assert small["peak_rss_kb"] < big["peak_rss_kb"]
+
+
+def test_split_batch_jobs():
+    jobs = create_jobs(0, 2, 5, 0, 0)
+    batch_jobs = [BatchJob("a", job) for job in jobs] + [BatchJob("b", jobs[0])]
+
+    chunks = split_batch_jobs(batch_jobs, 2)
+
+    assert [len(chunk) for chunk in chunks] == [3, 2, 1]
+    assert [batch_job for chunk in chunks for batch_job in chunk] == batch_jobs
+    assert all(
+        len({batch_job.filepath for batch_job in chunk}) == 1 for chunk in chunks
+    )
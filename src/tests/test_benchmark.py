@@ -0,0 +1,128 @@
+import copy
+import json
+import os
+
+import numpy as np
+import pytest
+
+from benchmark import main, parse_args
+from src.greedy.benchmark import (
+    STAGES,
+    benchmark_file,
+    compare_with_baseline,
+    measure,
+    measure_load_input,
+    run_benchmarks,
+)
+from src.greedy.data_loader import load_data_from_file
+from src.greedy.dataset import get_dataset_path
+from src.greedy.generator import generate_instance, save_generated_files
+from src.greedy.settings import (
+    BENCHMARK_TIME_RESOLUTION,
+    CONTRIBUTION,
+    DENSE_RESULTS,
+    DIRPATH,
+)
+
+INPUT_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "..", DIRPATH, "filozofia-input.txt"
+)
+
+
+def test_measure_calls_setup_before_every_call():
+    calls = []
+    result, stage = measure(calls.append, lambda: (len(calls),), 3)
+
+    assert calls == [0, 1, 2, 3]
+    assert result is None
+    assert stage["time"] >= 0
+    assert stage["peak_memory_kb"] >= 0
+
+
+def test_measure_load_input(tmp_path):
+    data, cold, cached = measure_load_input(INPUT_FILE, str(tmp_path), 2)
+
+    path = str(tmp_path / os.path.basename(INPUT_FILE))
+    assert os.path.exists(get_dataset_path(path))
+    assert not os.path.exists(get_dataset_path(INPUT_FILE))
+    assert cold["time"] > 0 and cached["time"] > 0
+    expected = load_data_from_file(INPUT_FILE)
+    assert data.keys() == expected.keys()
+    assert np.array_equal(data[CONTRIBUTION], expected[CONTRIBUTION])
+
+
+@pytest.mark.parametrize("results_format", ["sparse", DENSE_RESULTS])
+def test_benchmark_file(results_format):
+    result = benchmark_file(INPUT_FILE, 1, [2], results_format=results_format)
+
+    assert (result["authors"], result["publications"], result["pairs"]) == (12, 56, 58)
+    assert list(result["stages"]) == STAGES
+    assert result["stages"]["choose_publications_to_publish"]["evaluations"] == 58
+    run = result["stages"]["run_algorithm"]
+    assert run["evaluations"] > 2 * 58
+    assert run["evaluations_per_second"] == run["evaluations"] / run["time"]
+
+
+def test_compare_with_baseline():
+    report = run_benchmarks([INPUT_FILE], 1, [1])
+    baseline = copy.deepcopy(report)
+    stages = baseline["departments"]["filozofia"]["stages"]
+    stages["run_algorithm"]["time"] = (
+        report["departments"]["filozofia"]["stages"]["run_algorithm"]["time"] / 2
+        - BENCHMARK_TIME_RESOLUTION
+    )
+    stages["load_input"]["peak_memory_kb"] /= 2
+    del stages["save_results"]
+
+    regressions = compare_with_baseline(report, baseline, 0.2)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("filozofia: load_input peak_memory_kb")
+    assert regressions[1].startswith("filozofia: run_algorithm time")
+    current = report["departments"]["filozofia"]["stages"]
+    assert current["normalize_data"]["time_ratio"] == 1
+    assert "time_ratio" not in current["save_results"]
+
+
+def test_compare_with_baseline_ignores_small_differences_of_time():
+    report = run_benchmarks([INPUT_FILE], 1, [1])
+    baseline = copy.deepcopy(report)
+    for stage in baseline["departments"]["filozofia"]["stages"].values():
+        stage["time"] /= 2
+
+    assert compare_with_baseline(report, baseline, 0.2) == []
+    assert compare_with_baseline(report, {"departments": {}}, 0.2) == []
+
+
+def test_main_saves_and_compares_baseline(tmp_path):
+    baseline = str(tmp_path / "benchmark" / "baseline.json")
+    output = str(tmp_path / "report.json")
+    args = [INPUT_FILE, "-r", "1", "--thresholds", "1", "-b", baseline]
+
+    main(args + ["--save-baseline"])
+    report = main(args + ["-o", output])
+
+    assert report["regressions"] == []
+    with open(output) as file:
+        assert json.load(file) == report
+    with open(baseline) as file:
+        assert list(json.load(file)["departments"]) == ["filozofia"]
+
+
+def test_parse_args_validation():
+    with pytest.raises(SystemExit):
+        parse_args(["--repeat", "0"])
+    with pytest.raises(SystemExit):
+        parse_args(["--tolerance", "-1"])
+
+
+def test_benchmark_generated_dataset(tmp_path):
+    path = str(tmp_path / "synthetic-input.txt")
+    dataset_path = save_generated_files(
+        path, generate_instance(30, 150, seed=0), text=False
+    )[0]
+
+    result = run_benchmarks([dataset_path], 1, [1])["departments"]["synthetic"]
+
+    assert (result["authors"], result["publications"]) == (30, 150)
+    assert result["stages"]["run_algorithm"]["evaluations"] > result["pairs"]
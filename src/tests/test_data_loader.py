@@ -1,3 +1,7 @@
+import io
+
+import numpy as np
+
 from src.greedy.data_loader import (
     extract_vars,
     find_data_segment,
@@ -5,7 +9,10 @@ from src.greedy.data_loader import (
     get_list_of_floats_pattern,
     get_list_of_strings_pattern,
     get_nested_list_pattern,
+    iter_statements,
     load_data,
+    load_data_from_file,
+    parse_value,
 )
 
 
@@ -102,3 +109,65 @@ def test_load_data_with_string_list_variable():
 def test_load_data_with_multiple_variables():
     data = "A = 3; B = [0.5, 1.0, 1.0];"
     assert load_data(data, ["A"], ["B"]) == {"A": 3, "B": [0.5, 1.0, 1.0]}
+
+
+def test_iter_statements_with_statements_split_between_chunks():
+    file = io.StringIO("A = 12;\nB = [1, 2];\nC = [];")
+    result = list(iter_statements(file, chunk_size=3))
+    assert result == [("A", "12"), ("B", "[1, 2]"), ("C", "[]")]
+
+
+def test_parse_value_with_numbers():
+    assert parse_value("12") == 12
+    assert parse_value("0.5") == 0.5
+
+
+def test_parse_value_with_list_of_ints():
+    result = parse_value("[1, 0, 1]")
+    assert result.dtype == int
+    assert result.tolist() == [1, 0, 1]
+
+
+def test_parse_value_with_list_of_floats():
+    result = parse_value("[0.5, 1.0]")
+    assert result.dtype == float
+    assert result.tolist() == [0.5, 1.0]
+
+
+def test_parse_value_with_nested_list():
+    result = parse_value("[[1, 0, 0.5], [0, 2.5, 0]]")
+    assert result.shape == (2, 3)
+    assert result.get_nonzero_number() == 3
+    assert result.to_dense() == [[1.0, 0, 0.5], [0, 2.5, 0]]
+
+
+def test_parse_value_with_list_of_strings():
+    assert parse_value('["abc", "d-e"]') == ["abc", "d-e"]
+
+
+def test_load_data_from_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text('A = 3;\n\nB = [0.5, 1.0];\n\nG = ["a", "b"];\n')
+    result = load_data_from_file(str(path), ["A", "G"])
+    assert result == {"A": 3, "G": ["a", "b"]}
+
+
+def test_load_data_from_file_with_missing_variable(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("A = 3;")
+    try:
+        load_data_from_file(str(path), ["B"])
+    except ValueError:
+        return
+    assert False
+
+
+def test_load_data_from_file_returns_same_values_as_load_data(tmp_path):
+    source = "A = 2; P = 2; u = [[1.0, 0], [0, 0.5]]; c = [1, 0];"
+    path = tmp_path / "input.txt"
+    path.write_text(source)
+    result = load_data_from_file(str(path))
+    expected = load_data(source, ["A", "P"], ["c"])
+    for var in expected:
+        assert np.array_equal(result[var], expected[var])
+    assert result["u"].to_dense() == load_data(source, None, None, ["u"])["u"]
@@ -0,0 +1,86 @@
+import os
+
+import numpy as np
+
+import src.greedy.dataset as dataset
+from src.greedy.data_loader import load_data_from_file
+from src.greedy.dataset import (
+    compile_dataset,
+    get_dataset_path,
+    load_dataset,
+    load_input,
+    read_dataset_header,
+)
+
+INPUT_DATA = """A = 2;
+N0 = 1;
+N1 = 0;
+N2 = 0;
+P = 3;
+udzial = [1.0, 0.5];
+doktorant = [0, 1];
+pracownik = [1, 1];
+czyN = [1, 0];
+u = [[1.0, 0, 0.5], [0, 0, 0]];
+w = [[20.0, 0, 40.0], [0, 0, 0]];
+monografia = [0, 1, 0];
+authorIdList = ["a", "b"];
+publicationIdList = ["p1", "p2", "p3"];
+"""
+
+
+def create_input_file(tmp_path) -> str:
+    path = tmp_path / "test-input.txt"
+    path.write_text(INPUT_DATA)
+    return str(path)
+
+
+def test_get_dataset_path():
+    assert get_dataset_path("data/x-input.txt") == "data/x-input.dataset"
+
+
+def test_load_dataset_returns_the_same_data_as_input_file(tmp_path):
+    filepath = create_input_file(tmp_path)
+    expected = load_data_from_file(filepath)
+    result = load_dataset(compile_dataset(filepath))
+
+    assert result.keys() == expected.keys()
+    for var in expected:
+        if isinstance(expected[var], np.ndarray):
+            assert np.array_equal(result[var], expected[var])
+        else:
+            assert result[var] == expected[var]
+
+
+def test_load_input_compiles_dataset(tmp_path):
+    filepath = create_input_file(tmp_path)
+    assert not os.path.exists(get_dataset_path(filepath))
+    load_input(filepath)
+    assert os.path.exists(get_dataset_path(filepath))
+
+
+def test_load_input_without_writable_directory(tmp_path, monkeypatch):
+    filepath = create_input_file(tmp_path)
+
+    def open_read_only(path, mode="r", *args, **kwargs):
+        if "w" in mode:
+            raise PermissionError(f"Read-only file system: {path}")
+        return open(path, mode, *args, **kwargs)
+
+    monkeypatch.setattr(dataset, "open", open_read_only, raising=False)
+
+    assert load_input(filepath)["A"] == 2
+    assert os.listdir(tmp_path) == [os.path.basename(filepath)]
+
+
+def test_load_input_recompiles_dataset_after_input_file_change(tmp_path):
+    filepath = create_input_file(tmp_path)
+    load_input(filepath)
+    old_hash = read_dataset_header(get_dataset_path(filepath))[0]["source_hash"]
+
+    with open(filepath, "w") as file:
+        file.write(INPUT_DATA.replace("A = 2;", "A = 3;"))
+
+    assert load_input(filepath)["A"] == 3
+    new_hash = read_dataset_header(get_dataset_path(filepath))[0]["source_hash"]
+    assert old_hash != new_hash
@@ -0,0 +1,146 @@
+import os
+
+import numpy as np
+import pytest
+
+from generate import main, parse_args
+from src.greedy.data_loader import load_data_from_file
+from src.greedy.data_preparation import get_initial_publications, normalize_data
+from src.greedy.dataset import load_input
+from src.greedy.generator import (
+    DIRICHLET_CONTRIBUTIONS,
+    EQUAL_CONTRIBUTIONS,
+    generate_instance,
+    save_generated_files,
+)
+from src.greedy.greedy import run_algorithm
+from src.greedy.settings import (
+    CONTRIBUTION,
+    INITIAL_PUBS,
+    IS_EMPLOYEE,
+    IS_MONOGRAPH,
+    IS_PHD_STUDENT,
+    PUBLICATION_CONTRIB_FOR_AUTHOR,
+    PUBLICATION_POINTS_FOR_AUTHOR,
+)
+
+
+def assert_data_equal(data: dict, expected: dict):
+    assert list(data) == list(expected)
+    for key, value in expected.items():
+        if isinstance(value, np.ndarray):
+            assert np.array_equal(data[key], value)
+        else:
+            assert data[key] == value
+
+
+def get_contribs_of_publications(data: dict) -> np.ndarray:
+    contribs = data[PUBLICATION_CONTRIB_FOR_AUTHOR]
+    return np.bincount(contribs.indices, contribs.values, contribs.shape[1])
+
+
+def test_generate_instance_is_reproducible():
+    data = generate_instance(20, 100, seed=3)
+    assert_data_equal(generate_instance(20, 100, seed=3), data)
+    other = generate_instance(20, 100, seed=4)
+    assert (
+        not other[PUBLICATION_CONTRIB_FOR_AUTHOR]
+        == data[PUBLICATION_CONTRIB_FOR_AUTHOR]
+    )
+
+
+@pytest.mark.parametrize("contribution", [EQUAL_CONTRIBUTIONS, DIRICHLET_CONTRIBUTIONS])
+def test_generate_instance_shape_and_contributions(contribution):
+    data = generate_instance(30, 200, 2.5, contribution=contribution, seed=0)
+
+    contribs = data[PUBLICATION_CONTRIB_FOR_AUTHOR]
+    points = data[PUBLICATION_POINTS_FOR_AUTHOR]
+    assert contribs.shape == points.shape == (30, 200)
+    assert np.array_equal(contribs.indices, points.indices)
+    assert np.all(contribs.values > 0) and np.all(points.values > 0)
+    pub_contribs = get_contribs_of_publications(data)
+    assert np.all(pub_contribs > 0) and np.all(pub_contribs <= 1.001)
+    assert 2 < contribs.get_nonzero_number() / 200 < 3
+
+
+def test_generate_instance_without_external_authors():
+    data = generate_instance(10, 50, 1, external_authors=0, seed=0)
+    assert np.allclose(get_contribs_of_publications(data), 1)
+    assert data[PUBLICATION_CONTRIB_FOR_AUTHOR].get_nonzero_number() == 50
+
+
+def test_generate_instance_ratios():
+    data = generate_instance(
+        200,
+        1000,
+        monograph_ratio=1,
+        phd_ratio=0,
+        employee_ratio=1,
+        part_time_ratio=0,
+        seed=0,
+    )
+    assert np.all(data[IS_MONOGRAPH] == 1)
+    assert np.all(data[IS_PHD_STUDENT] == 0)
+    assert np.all(data[IS_EMPLOYEE] == 1)
+    assert np.all(data[CONTRIBUTION] == 1.0)
+
+    data = generate_instance(2000, 1000, monograph_ratio=0.3, phd_ratio=0.5, seed=0)
+    assert 0.25 < np.mean(data[IS_MONOGRAPH]) < 0.35
+    assert 0.45 < np.mean(data[IS_PHD_STUDENT]) < 0.55
+
+
+def test_generate_instance_wrong_contribution():
+    with pytest.raises(AttributeError):
+        generate_instance(5, 5, contribution="normal")
+
+
+def test_saved_files_are_loaded_as_generated_data(tmp_path):
+    data = generate_instance(15, 60, contribution=DIRICHLET_CONTRIBUTIONS, seed=2)
+    path = str(tmp_path / "synthetic-input.txt")
+
+    paths = save_generated_files(path, data)
+
+    assert paths == [path, str(tmp_path / "synthetic-input.dataset")]
+    with open(path, "rb") as file:
+        assert file.read().startswith(b"A = 15;\r\nN0 = 1;\r\n")
+    assert_data_equal(load_data_from_file(path), data)
+    mtime = os.path.getmtime(paths[1])
+    loaded = load_input(path)
+    assert os.path.getmtime(paths[1]) == mtime
+    assert loaded[PUBLICATION_POINTS_FOR_AUTHOR] == data[PUBLICATION_POINTS_FOR_AUTHOR]
+
+
+def test_run_algorithm_on_generated_dataset(tmp_path):
+    path = str(tmp_path / "synthetic-input.txt")
+    dataset_path = save_generated_files(
+        path, generate_instance(40, 250, seed=1), text=False
+    )[0]
+
+    data = normalize_data(load_input(dataset_path))
+    data[INITIAL_PUBS] = get_initial_publications(0, data)
+    pubs, goal = run_algorithm(data, 200, rng=np.random.default_rng(0), thresholds=[2])
+
+    assert not os.path.exists(path)
+    assert pubs and goal > 0
+
+
+def test_main(tmp_path):
+    path = str(tmp_path / "synthetic-input.txt")
+    assert main([path, "-a", "5", "-p", "20", "-f", "text"]) == [path]
+    assert load_data_from_file(path)[PUBLICATION_CONTRIB_FOR_AUTHOR].shape == (5, 20)
+
+
+def test_main_creates_output_directory(tmp_path):
+    path = str(tmp_path / "synthetic" / "x-input.txt")
+    assert main([path, "-a", "5", "-p", "20", "-f", "binary"]) == [
+        str(tmp_path / "synthetic" / "x-input.dataset")
+    ]
+
+
+def test_parse_args_validation():
+    with pytest.raises(SystemExit):
+        parse_args(["x-input.txt", "-a", "0", "-p", "5"])
+    with pytest.raises(SystemExit):
+        parse_args(["x-input.txt", "-a", "5", "-p", "5", "--phd-ratio", "2"])
+    with pytest.raises(SystemExit):
+        parse_args(["x-input.txt", "-a", "5", "-p", "5", "--density", "0.5"])
@@ -0,0 +1,226 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import src.greedy.greedy as greedy
+from src.greedy.data_loader import load_data_from_file
+from src.greedy.data_preparation import get_initial_publications, normalize_data
+from src.greedy.greedy import (
+    get_heuristic_value,
+    get_points_prefix_sums,
+    get_replaced_points,
+    run_algorithm,
+)
+from src.greedy.ranking import (
+    get_ranked_publications_to_considerate,
+    order_by_ranking,
+    rank_publications,
+    sort_publications,
+)
+from src.greedy.search_state import (
+    STOP_DEADLINE,
+    STOP_EVALUATIONS,
+    STOP_PATIENCE,
+    SearchState,
+)
+from src.greedy.settings import (
+    CACHED_ENGINE,
+    DIRPATH,
+    HEURISTIC_RESULT_PUBS_LEN,
+    INITIAL_PUBS,
+    NUMPY_ENGINE,
+    PUBLICATIONS_NUM,
+    PYTHON_ENGINE,
+)
+from src.tests.test_author import (
+    create_complex_publications_list,
+    create_example_author,
+    create_example_publications_list,
+)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", DIRPATH)
+INPUT_FILES = sorted(f for f in os.listdir(DATA_DIR) if f.endswith(".txt"))
+INPUT_FILE = os.path.join(DATA_DIR, INPUT_FILES[0])
+ROOT_DIR = os.path.join(os.path.dirname(__file__), "..", "..")
+
+
+def run_test_algorithm(source_data: dict, mode: int, engine: str):
+    rng = np.random.default_rng(mode)
+    data = source_data.copy()
+    data[INITIAL_PUBS] = get_initial_publications(mode, data, 2, rng)
+    state = SearchState()
+
+    heur_pubs = int(data[PUBLICATIONS_NUM] * HEURISTIC_RESULT_PUBS_LEN)
+    pubs, goal_fun = run_algorithm(data, heur_pubs, engine, rng, state=state)
+    pairs = sorted((pub.get_id(), pub.get_author().get_id()) for pub in pubs)
+    return pairs, goal_fun, state.threshold_goal_values
+
+
+def prepare_authors_with_publications():
+    first = create_example_author(a_id="first", contrib=1.0)
+    first.load_publications(create_complex_publications_list())
+    second = create_example_author(a_id="second", contrib=1.0)
+    second.load_publications(create_example_publications_list())
+    return [first, second]
+
+
+def test_rank_publications():
+    authors = prepare_authors_with_publications()
+    publications = authors[0].publications + authors[1].publications
+
+    ranking = rank_publications(authors)
+
+    assert ranking == sort_publications(publications)
+    assert [pub.get_rank() for pub in ranking] == list(range(len(ranking)))
+
+
+def test_get_ranked_publications_to_considerate():
+    authors = prepare_authors_with_publications()
+    ranking = rank_publications(authors)
+    for pub in (ranking[0], ranking[3]):
+        assert pub.get_author().accept_publication(pub)
+
+    result = get_ranked_publications_to_considerate(ranking)
+
+    assert result == ranking[1:3] + ranking[4:]
+
+
+def test_order_by_ranking():
+    authors = prepare_authors_with_publications()
+    ranking = rank_publications(authors)
+    pubs = [ranking[5], ranking[1], ranking[3]]
+
+    assert order_by_ranking(pubs, ranking) == [ranking[1], ranking[3], ranking[5]]
+
+
+@pytest.mark.parametrize("filename", INPUT_FILES)
+def test_run_algorithm_with_numpy_engine_gives_the_same_result(monkeypatch, filename):
+    monkeypatch.setattr(greedy, "THRESHOLDS", [1, 5])
+    data = normalize_data(load_data_from_file(os.path.join(DATA_DIR, filename)))
+
+    for mode in (0, 1, 3):
+        expected = run_test_algorithm(data, mode, PYTHON_ENGINE)
+        assert run_test_algorithm(data, mode, NUMPY_ENGINE) == expected
+
+
+@pytest.mark.parametrize("filename", INPUT_FILES)
+def test_run_algorithm_with_cached_engine_gives_the_same_result(monkeypatch, filename):
+    monkeypatch.setattr(greedy, "THRESHOLDS", [1, 5, 20])
+    data = normalize_data(load_data_from_file(os.path.join(DATA_DIR, filename)))
+
+    for mode in (0, 1, 3):
+        expected = run_test_algorithm(data, mode, NUMPY_ENGINE)
+        assert run_test_algorithm(data, mode, CACHED_ENGINE) == expected
+
+
+def test_get_points_prefix_sums():
+    assert get_points_prefix_sums([3.0, 2.0, 1.0]) == [0, 3.0, 5.0, 6.0]
+
+
+def test_get_replaced_points():
+    points = [5.0, 4.0, 3.0, 2.0, 1.0]
+    assert get_replaced_points(points, 1, 1) == 4.0
+    assert get_replaced_points(points, 1, 3) == 2.0
+    assert get_replaced_points(points, 3, 5) == 0
+    assert get_replaced_points(points, 1, 0) == 0
+    assert get_replaced_points(points, 1, -2) == 0
+
+
+def test_get_replaced_points_decides_ties_exactly():
+    points = [0.3, 0.1, 0.3, 6.67]
+    prefix_sums = get_points_prefix_sums(points)
+    # differences of prefix sums accept publication with the same points as
+    # the replaced one because of rounding errors
+    assert points[0] + get_heuristic_value(prefix_sums, 1, 1) > get_heuristic_value(
+        prefix_sums, 1, 2
+    )
+    assert not points[0] > get_replaced_points(points, 1, 2)
+
+
+def test_get_heuristic_value():
+    prefix_sums = get_points_prefix_sums([5.0, 4.0, 3.0, 2.0, 1.0])
+    assert get_heuristic_value(prefix_sums, 0, 2) == 9.0
+    assert get_heuristic_value(prefix_sums, 1, 3) == 9.0
+    assert get_heuristic_value(prefix_sums, 3, 5) == 3.0
+
+
+def test_get_heuristic_value_with_no_remaining_pubs():
+    prefix_sums = get_points_prefix_sums([5.0, 4.0])
+    assert get_heuristic_value(prefix_sums, 0, 0) == 0
+    assert get_heuristic_value(prefix_sums, 1, -2) == 0
+    assert get_heuristic_value(prefix_sums, 5, 1) == 0
+
+
+@pytest.mark.parametrize("engine", [CACHED_ENGINE, NUMPY_ENGINE, PYTHON_ENGINE])
+def test_run_algorithm_without_assertions_gives_the_same_result(engine):
+    code = (
+        "import numpy as np\n"
+        "from src.greedy.data_loader import load_data_from_file\n"
+        "from src.greedy.data_preparation import get_initial_publications, "
+        "normalize_data\n"
+        "from src.greedy.greedy import run_algorithm\n"
+        "from src.greedy.settings import INITIAL_PUBS\n"
+        f"data = normalize_data(load_data_from_file({INPUT_FILE!r}))\n"
+        "data[INITIAL_PUBS] = get_initial_publications(0, data)\n"
+        "rng = np.random.default_rng(0)\n"
+        f"print(run_algorithm(data, 10, {engine!r}, rng, thresholds=[1, 5])[1])\n"
+    )
+    outputs = [
+        subprocess.run(
+            [sys.executable, *flags, "-c", code],
+            cwd=ROOT_DIR,
+            stdout=subprocess.PIPE,
+            check=True,
+        ).stdout
+        for flags in ([], ["-O"])
+    ]
+    assert outputs[0] == outputs[1]
+
+
+def test_run_algorithm_does_not_modify_input_data(monkeypatch):
+    monkeypatch.setattr(greedy, "THRESHOLDS", [1, 5])
+    data = normalize_data(load_data_from_file(os.path.join(DATA_DIR, INPUT_FILES[0])))
+    data[INITIAL_PUBS] = get_initial_publications(1, data)
+    keys = set(data)
+
+    run_algorithm(data, 10, rng=np.random.default_rng(0))
+    assert set(data) == keys
+
+
+@pytest.mark.parametrize(
+    "limits, reason",
+    [
+        ({"max_evaluations": 100}, STOP_EVALUATIONS),
+        ({"patience": 3}, STOP_PATIENCE),
+        ({"time_limit": 0}, STOP_DEADLINE),
+    ],
+)
+def test_run_algorithm_stops_at_anytime_limits(limits, reason):
+    data = normalize_data(load_data_from_file(os.path.join(DATA_DIR, INPUT_FILES[0])))
+    data[INITIAL_PUBS] = get_initial_publications(0, data)
+    state = SearchState()
+
+    pubs, goal_fun = run_algorithm(
+        data, 10, rng=np.random.default_rng(0), state=state, **limits
+    )
+
+    assert state.stop_reason == reason
+    assert state.iterations >= 1
+    assert goal_fun == state.best_goal_fun > 0
+    assert len(pubs) == len(state.best_ranks)
+    assert state.goal_calculations_num <= state.thresholds[-1]
+
+
+def test_run_algorithm_evaluations_budget_without_thresholds():
+    data = normalize_data(load_data_from_file(os.path.join(DATA_DIR, INPUT_FILES[0])))
+    data[INITIAL_PUBS] = get_initial_publications(0, data)
+    state = SearchState()
+
+    run_algorithm(data, 10, state=state, thresholds=[], max_evaluations=5000)
+
+    assert state.stop_reason == STOP_EVALUATIONS
+    assert state.threshold_goal_values == {}
+    assert 5000 <= state.goal_calculations_num
@@ -0,0 +1,47 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.join(os.path.dirname(__file__), "..", "..")
+ENTRY_POINTS = [
+    "main",
+    "summaries",
+    "benchmark",
+    "generate",
+    "src.greedy.runner",
+    "src.greedy.batch",
+]
+PLOTTING_MODULES = ["matplotlib", "pandas", "seaborn"]
+
+# Maximal time of importing entry point in new interpreter (in seconds). Most of
+# it is taken by numpy, plotting libraries alone take more.
+IMPORT_TIME_BUDGET = 1.5
+
+
+def import_in_new_interpreter(module: str) -> dict:
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "end = time.perf_counter()\n"
+        "print(json.dumps({'time': end - start, 'modules': list(sys.modules)}))\n"
+    )
+    process = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT_DIR, stdout=subprocess.PIPE, check=True
+    )
+    return json.loads(process.stdout)
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_import_does_not_load_plotting_modules(module):
+    modules = import_in_new_interpreter(module)["modules"]
+    assert not [name for name in PLOTTING_MODULES if name in modules]
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_import_time_budget(module):
+    times = [import_in_new_interpreter(module)["time"] for _ in range(2)]
+    assert min(times) < IMPORT_TIME_BUDGET
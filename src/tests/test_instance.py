@@ -0,0 +1,116 @@
+import os
+
+import numpy as np
+import pytest
+
+from src.greedy.data_loader import load_data_from_file
+from src.greedy.data_preparation import (
+    get_initial_publications,
+    normalize_data,
+    prepare_authors_and_their_publications,
+)
+from src.greedy.greedy import run_algorithm
+from src.greedy.instance import ProblemInstance
+from src.greedy.output_converter import (
+    convert_dictionary_to_vector,
+    convert_pairs_to_vector,
+    convert_publications_to_dictionary,
+)
+from src.greedy.search_state import SearchState
+from src.greedy.settings import (
+    DIRPATH,
+    HEURISTIC_RESULT_PUBS_LEN,
+    INITIAL_PUBS,
+    PUBLICATIONS_NUM,
+)
+
+INPUT_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "..", DIRPATH, "filozofia-input.txt"
+)
+
+
+def load_normalized_data() -> dict:
+    return normalize_data(load_data_from_file(INPUT_FILE))
+
+
+def get_accepted_ids(authors) -> list:
+    return [
+        [pub.get_id() for pub in author.get_accepted_publications()]
+        for author in authors
+    ]
+
+
+@pytest.mark.parametrize("mode", [0, 1, 2, 3])
+def test_reset_accepts_the_same_publications_as_data_preparation(mode):
+    data = load_normalized_data()
+    instance = ProblemInstance(data)
+
+    initial = instance.get_initial_publications(mode, 2, np.random.default_rng(5))
+    instance.reset(initial)
+
+    data[INITIAL_PUBS] = get_initial_publications(
+        mode, data, 2, np.random.default_rng(5)
+    )
+    authors = prepare_authors_and_their_publications(data)
+    assert get_accepted_ids(instance.authors) == get_accepted_ids(authors)
+    assert sum(pub.is_accepted() for pub in instance.ranking) == sum(
+        len(author.get_accepted_publications()) for author in authors
+    )
+
+
+def test_reset_cancels_publications_from_previous_run():
+    data = load_normalized_data()
+    instance = ProblemInstance(data)
+    instance.reset(instance.get_initial_publications(1))
+    instance.reset(instance.get_initial_publications(0))
+
+    assert all(not pub.is_accepted() for pub in instance.ranking)
+    assert all(not author.get_accepted_publications() for author in instance.authors)
+    assert all(
+        author.get_accepted_pubs_contrib_sum() == 0 for author in instance.authors
+    )
+
+
+def test_get_initial_publications_wrong_mode():
+    instance = ProblemInstance(load_normalized_data())
+    with pytest.raises(AttributeError):
+        instance.get_initial_publications(4)
+
+
+def test_run_algorithm_on_reused_instance_gives_the_same_results():
+    data = load_normalized_data()
+    instance = ProblemInstance(data)
+    heur_pubs = int(data[PUBLICATIONS_NUM] * HEURISTIC_RESULT_PUBS_LEN)
+
+    for mode in [0, 3, 1, 3]:
+        rng = np.random.default_rng(mode)
+        instance.reset(instance.get_initial_publications(mode, 2, rng))
+        state = SearchState()
+        pubs, goal = run_algorithm(
+            data, heur_pubs, rng=rng, instance=instance, state=state
+        )
+
+        rng = np.random.default_rng(mode)
+        expected_data = data.copy()
+        expected_data[INITIAL_PUBS] = get_initial_publications(mode, data, 2, rng)
+        expected_state = SearchState()
+        expected_pubs, expected_goal = run_algorithm(
+            expected_data, heur_pubs, rng=rng, state=expected_state
+        )
+
+        assert goal == expected_goal
+        assert [pub.get_id() for pub in pubs] == [pub.get_id() for pub in expected_pubs]
+        assert state.threshold_goal_values == expected_state.threshold_goal_values
+
+
+def test_get_pairs_gives_the_same_vector_as_publications():
+    data = load_normalized_data()
+    instance = ProblemInstance(data)
+    ranks = np.arange(0, len(instance.ranking), 3)
+    pubs = instance.table.get_publications(ranks.tolist())
+
+    expected = convert_dictionary_to_vector(
+        convert_publications_to_dictionary(pubs), data
+    )
+    vector = convert_pairs_to_vector(instance.get_pairs(ranks).tolist(), data)
+    assert vector == expected
@@ -0,0 +1,111 @@
+import os
+import shutil
+
+import pytest
+
+from main import create_all_jobs, expand_input_patterns, main, parse_args
+from src.greedy.runner import create_jobs
+from src.greedy.settings import DIRPATH, MANIFEST_FILE, RESULTS_STORE_FILE
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", DIRPATH)
+
+
+def test_create_all_jobs_with_default_grid():
+    expected = []
+    for mode in [0, 1, 2]:
+        expected += create_jobs(mode, 2, 28, 0, 0)
+    for test_try in range(0, 25):
+        expected += create_jobs(3, 2, 28, test_try, 0)
+
+    assert create_all_jobs(0) == expected
+
+
+def test_create_all_jobs_with_parameters():
+    jobs = create_all_jobs(1, [3, 0], 1, 2, 3, [1, 5], 0.25, 0.5)
+
+    assert [(job.mode, job.test_try) for job in jobs] == [
+        (3, 0),
+        (3, 0),
+        (3, 1),
+        (3, 1),
+        (3, 2),
+        (3, 2),
+        (0, 0),
+        (0, 0),
+    ]
+    assert {(job.thresholds, job.alpha, job.heuristic_len) for job in jobs} == {
+        ((1, 5), 0.25, 0.5)
+    }
+
+
+def test_expand_input_patterns(tmp_path):
+    for filename in ["b-input.txt", "a-input.txt", "notes.md"]:
+        (tmp_path / filename).touch()
+    pattern = str(tmp_path / "*.txt")
+    missing = str(tmp_path / "missing-input.txt")
+
+    assert expand_input_patterns([pattern, str(tmp_path / "a-input.txt"), missing]) == [
+        str(tmp_path / "a-input.txt"),
+        str(tmp_path / "b-input.txt"),
+        missing,
+    ]
+
+
+def test_parse_args():
+    args = parse_args(["a.txt", "-m", "0", "3", "-n", "2", "--thresholds", "1", "5"])
+
+    assert args.inputs == ["a.txt"]
+    assert args.modes == [0, 3]
+    assert args.tests == 2
+    assert args.thresholds == [1, 5]
+
+
+def test_parse_args_with_sub_second_time_limit():
+    assert parse_args(["a.txt", "--time-limit", "0.5"]).time_limit == 0.5
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["-m", "4"],
+        ["-n", "0"],
+        ["-w", "0"],
+        ["--alpha", "1.5"],
+        ["--time-limit", "0"],
+        ["--time-limit", "-0.5"],
+        ["--patience", "0"],
+        ["--max-evaluations", "-1"],
+    ],
+)
+def test_parse_args_with_wrong_values(argv):
+    with pytest.raises(SystemExit):
+        parse_args(argv)
+
+
+def test_main(tmp_path, capsys):
+    input_file = str(tmp_path / "filozofia-input.txt")
+    shutil.copy(os.path.join(DATA_DIR, "filozofia-input.txt"), input_file)
+    results_dir = str(tmp_path / "results")
+
+    argv = [str(tmp_path / "*-input.txt"), "-m", "0", "3", "-n", "1", "-t", "2"]
+    argv += ["--thresholds", "1", "2", "-w", "1", "-o", results_dir]
+    manifest = main(argv)
+
+    department = manifest["departments"][0]
+    assert department["file"] == input_file
+    assert department["jobs"] == 3
+    assert list(department["best_goal_by_mode"]) == ["0", "3"]
+    assert os.path.exists(os.path.join(results_dir, MANIFEST_FILE))
+    assert os.path.exists(os.path.join(results_dir, RESULTS_STORE_FILE))
+    assert os.path.exists(os.path.join(results_dir, "filozofia", "filozofia_3_0_1.txt"))
+    assert input_file in capsys.readouterr().out
+
+
+def test_main_with_anytime_limits(tmp_path):
+    input_file = str(tmp_path / "filozofia-input.txt")
+    shutil.copy(os.path.join(DATA_DIR, "filozofia-input.txt"), input_file)
+
+    argv = [input_file, "-m", "0", "-n", "2", "-w", "1", "-o", str(tmp_path)]
+    manifest = main(argv + ["--max-evaluations", "100", "--patience", "50"])
+
+    assert manifest["departments"][0]["stop_reasons"] == {"evaluations": 2}
@@ -0,0 +1,80 @@
+from src.greedy.output_converter import (
+    convert_pairs_to_vector,
+    export_dense_results,
+    load_results,
+    save_results,
+    save_sparse_results,
+)
+from src.greedy.settings import (
+    EMPLOYEES_NUM,
+    FINAL_GOAL_FUN,
+    PUBLICATIONS_NUM,
+    RESULT_AUTHORS_IDX,
+    RESULT_PUBLICATIONS_IDX,
+    RESULT_VECTOR,
+    SEED_VARIABLE,
+)
+
+RESULT_DATA = {"threshold_goal_values": {12: 10.5, 120: 20.0}}
+SHAPE = {EMPLOYEES_NUM: 2, PUBLICATIONS_NUM: 3}
+
+
+def test_convert_pairs_to_vector():
+    assert convert_pairs_to_vector([[1, 2], [0, 0]], SHAPE) == [[1, 0, 0], [0, 0, 1]]
+
+
+def test_save_and_load_sparse_results(tmp_path):
+    path = str(tmp_path / "result.txt")
+    save_sparse_results(path, RESULT_DATA, 25.25, [[1, 2], [0, 0]], (2, 3), 7)
+
+    result = load_results(path)
+    assert result["threshold_goal_values"] == {12: 10.5, 120: 20.0}
+    assert result[FINAL_GOAL_FUN] == 25.25
+    assert result[SEED_VARIABLE] == 7
+    assert result[RESULT_AUTHORS_IDX].tolist() == [0, 1]
+    assert result[RESULT_PUBLICATIONS_IDX].tolist() == [0, 2]
+
+
+def test_save_sparse_results_without_pairs(tmp_path):
+    path = str(tmp_path / "result.txt")
+    save_sparse_results(path, RESULT_DATA, 0, [], (2, 3))
+
+    result = load_results(path)
+    assert SEED_VARIABLE not in result
+    assert result[RESULT_AUTHORS_IDX].tolist() == []
+    assert result[RESULT_PUBLICATIONS_IDX].tolist() == []
+
+
+def test_load_results_without_pairs(tmp_path):
+    path = str(tmp_path / "result.txt")
+    save_results(path, RESULT_DATA, 25.25, [[1, 0, 0], [0, 0, 1]])
+
+    result = load_results(path, with_pairs=False)
+    assert RESULT_VECTOR not in result
+    assert result["threshold_goal_values"] == {12: 10.5, 120: 20.0}
+    assert result[FINAL_GOAL_FUN] == 25.25
+
+
+def test_export_dense_results(tmp_path):
+    sparse_path = str(tmp_path / "sparse.txt")
+    dense_path = str(tmp_path / "dense.txt")
+    expected_path = str(tmp_path / "expected.txt")
+    vector = [[1, 0, 0], [0, 0, 1]]
+
+    save_sparse_results(sparse_path, RESULT_DATA, 25.25, [[1, 2], [0, 0]], (2, 3), 7)
+    save_results(expected_path, RESULT_DATA, 25.25, vector, 7)
+    export_dense_results(sparse_path, dense_path)
+
+    with open(dense_path) as dense, open(expected_path) as expected:
+        assert dense.read() == expected.read()
+
+
+def test_load_results_without_pairs_stops_on_pairs(tmp_path):
+    path = str(tmp_path / "result.txt")
+    save_sparse_results(path, RESULT_DATA, 25.25, [[1, 2]], (2, 3))
+    with open(path, "a") as file:
+        file.write("\nunterminated = [1, 2")
+
+    result = load_results(path, with_pairs=False)
+    assert result[FINAL_GOAL_FUN] == 25.25
+    assert RESULT_AUTHORS_IDX not in result
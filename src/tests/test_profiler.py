@@ -0,0 +1,93 @@
+import os
+
+import numpy as np
+
+from src.greedy.data_loader import load_data_from_file
+from src.greedy.data_preparation import get_initial_publications, normalize_data
+from src.greedy.greedy import run_algorithm
+from src.greedy.profiler import NULL_PROFILER, Profiler
+from src.greedy.settings import (
+    CACHED_ENGINE,
+    DIRPATH,
+    INITIAL_PUBS,
+    NUMPY_ENGINE,
+    PYTHON_ENGINE,
+)
+
+INPUT_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "..", DIRPATH, "filozofia-input.txt"
+)
+
+
+def run_profiled_algorithm(profiler: Profiler, engine: str = None):
+    data = normalize_data(load_data_from_file(INPUT_FILE))
+    data[INITIAL_PUBS] = get_initial_publications(0, data)
+    params = {"engine": engine} if engine else {}
+    return run_algorithm(
+        data,
+        10,
+        rng=np.random.default_rng(0),
+        thresholds=[1, 3],
+        profiler=profiler,
+        **params
+    )
+
+
+def test_profiler_measures_phases():
+    profiler = Profiler()
+    with profiler.phase("first"):
+        pass
+    with profiler.phase("first"):
+        pass
+    profiler.count("evaluations", 5)
+    profiler.add_time("second", 0.5)
+
+    report = profiler.get_report()
+    assert report["phases"]["first"]["calls"] == 2
+    assert report["phases"]["second"] == {"time": 0.5, "calls": 1}
+    assert report["phases"]["first"]["time"] >= 0
+    assert report["counters"] == {"evaluations": 5}
+    assert report["iteration_profile"] is None
+
+
+def test_profiler_profiles_single_iteration():
+    profiler = Profiler(profiled_iteration=1)
+    for idx in range(3):
+        with profiler.iteration(idx):
+            sorted(range(100))
+
+    report = profiler.get_report()
+    assert report["counters"] == {"iterations": 3}
+    assert report["iteration_profile"]["iteration"] == 1
+    assert "sorted" in report["iteration_profile"]["stats"]
+
+
+def test_run_algorithm_with_profiler():
+    profiler = Profiler(profiled_iteration=0)
+    expected = run_profiled_algorithm(NULL_PROFILER, CACHED_ENGINE)
+    assert run_profiled_algorithm(profiler, CACHED_ENGINE) == expected
+
+    report = profiler.get_report()
+    iterations = report["counters"]["iterations"]
+    assert set(report["phases"]) == {
+        "prepare",
+        "choose_publications_to_publish",
+        "choose_publications_to_cancel",
+        "check_limits",
+    }
+    assert report["phases"]["choose_publications_to_publish"]["calls"] == iterations
+    assert report["phases"]["check_limits"]["calls"] == 1
+    assert report["counters"]["evaluations"] > 0
+    assert "choose_publications_to_publish" in report["iteration_profile"]["stats"]
+
+
+def test_run_algorithm_with_profiler_and_numpy_engine():
+    profiler = Profiler()
+    run_profiled_algorithm(profiler, NUMPY_ENGINE)
+    assert "get_all_accepted_publications" in profiler.get_report()["phases"]
+
+
+def test_run_algorithm_with_profiler_and_python_engine():
+    profiler = Profiler()
+    run_profiled_algorithm(profiler, PYTHON_ENGINE)
+    assert "get_publications_to_considerate" in profiler.get_report()["phases"]
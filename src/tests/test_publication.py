@@ -85,3 +85,23 @@ def test_set_is_accepted_with_truth_base():
     p = create_example_publication(accepted=True)
     p.set_is_accepted(False)
     assert not p.is_accepted()
+
+
+def test_get_rank():
+    assert create_example_publication().get_rank() is None
+
+
+def test_set_rank():
+    p = create_example_publication()
+    p.set_rank(7)
+    assert p.get_rank() == 7
+
+
+def test_publication_has_no_instance_dictionary():
+    p = create_example_publication()
+    assert not hasattr(p, "__dict__")
+    try:
+        p.unknown_attribute = 1
+    except AttributeError:
+        return
+    assert False
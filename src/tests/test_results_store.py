@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from src.greedy.results_store import (
+    NO_THRESHOLD,
+    append_rows,
+    load_store,
+    split_by_department,
+)
+
+
+def create_row(
+    department: str, mode: int, threshold: int, goal: float, run_id: str = "run"
+) -> dict:
+    return {
+        "department": department,
+        "mode": mode,
+        "test_num": 0,
+        "test_try": 1,
+        "seed": 123,
+        "threshold": threshold,
+        "threshold_goal": goal,
+        "final_goal": 2.5,
+        "wall_time": 0.25,
+        "stop_reason": "thresholds",
+        "run_id": run_id,
+        "result_file": f"{department}_{mode}_0_1.txt",
+    }
+
+
+def test_append_rows_and_load_store(tmp_path):
+    path = str(tmp_path / "results.csv")
+    append_rows(path, [create_row("b", 0, 10, 1.5), create_row("b", 0, 100, 2.5)])
+    append_rows(path, [create_row("a", 3, 10, 0.5)])
+
+    store = load_store(path)
+    assert store["department"].tolist() == ["b", "b", "a"]
+    assert store["mode"].tolist() == [0, 0, 3]
+    assert store["threshold"].tolist() == [10, 100, 10]
+    assert store["threshold_goal"].tolist() == [1.5, 2.5, 0.5]
+    assert store["seed"].dtype.kind == "i"
+    assert store["wall_time"].dtype.kind == "f"
+
+
+def test_load_empty_store(tmp_path):
+    path = str(tmp_path / "results.csv")
+    append_rows(path, [])
+
+    store = load_store(path)
+    assert store["mode"].tolist() == []
+    assert store["final_goal"].dtype.kind == "f"
+
+
+def test_split_by_department(tmp_path):
+    path = str(tmp_path / "results.csv")
+    rows = [create_row("b", 0, 10, 1.5), create_row("a", 3, 10, 0.5)]
+    append_rows(path, rows + [create_row("b", 1, 10, 1.0)])
+
+    departments = split_by_department(load_store(path))
+    assert list(departments) == ["b", "a"]
+    assert departments["b"]["mode"].tolist() == [0, 1]
+    assert departments["a"]["threshold_goal"].tolist() == [0.5]
+
+
+def test_load_store_with_empty_cells(tmp_path):
+    path = str(tmp_path / "results.csv")
+    append_rows(path, [create_row("a", 0, "", "")])
+    with open(path) as file:
+        header, row = file.read().splitlines()
+    with open(path, "w") as file:
+        # store written before stop_reason column was added
+        file.write(header.replace(",stop_reason,run_id", "") + "\n")
+        file.write(row.replace(",thresholds,run", "") + "\n")
+
+    store = load_store(path)
+    assert store["threshold"].tolist() == [NO_THRESHOLD]
+    assert np.isnan(store["threshold_goal"][0])
+    assert store["final_goal"].tolist() == [2.5]
+    assert store["stop_reason"].tolist() == [""]
+    assert store["run_id"].tolist() == [""]
+
+
+def test_load_store_selects_latest_runs(tmp_path):
+    path = str(tmp_path / "results.csv")
+    first_run = [create_row("a", 0, 10, 1.5, "first"), create_row("a", 0, 100, 2.5)]
+    append_rows(path, first_run + [create_row("a", 3, 10, 0.5, "first")])
+    append_rows(path, [create_row("a", 0, 10, 2.0, "second")])
+
+    store = load_store(path)
+    assert store["mode"].tolist() == [3, 0]
+    assert store["threshold_goal"].tolist() == [0.5, 2.0]
+    assert len(load_store(path, latest_runs=False)["mode"]) == 4
+
+
+def test_append_rows_rewrites_store_with_old_header(tmp_path):
+    path = str(tmp_path / "results.csv")
+    append_rows(path, [create_row("a", 0, 10, 1.5, "")])
+    with open(path) as file:
+        header, row = file.read().splitlines()
+    with open(path, "w") as file:
+        file.write(header.replace(",stop_reason,run_id", "") + "\n")
+        file.write(row.replace(",thresholds,", "") + "\n")
+
+    append_rows(path, [create_row("b", 0, 10, 0.5)])
+
+    store = load_store(path)
+    assert store["department"].tolist() == ["a", "b"]
+    assert store["stop_reason"].tolist() == ["", "thresholds"]
+    assert store["result_file"].tolist() == ["a_0_0_1.txt", "b_0_0_1.txt"]
+
+
+def test_load_store_without_required_column(tmp_path):
+    path = str(tmp_path / "results.csv")
+    append_rows(path, [create_row("a", 0, 10, 1.5)])
+    with open(path) as file:
+        content = file.read()
+    with open(path, "w") as file:
+        file.write(content.replace("seed", "random_seed", 1))
+
+    with pytest.raises(ValueError, match="seed"):
+        load_store(path)
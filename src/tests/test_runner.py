@@ -0,0 +1,187 @@
+import json
+import os
+
+import numpy as np
+
+from src.greedy.data_loader import load_data, load_data_from_file
+from src.greedy.data_preparation import normalize_data
+from src.greedy.output_converter import export_dense_results, load_results
+from src.greedy.results_store import NO_THRESHOLD, load_store
+from src.greedy.runner import (
+    create_jobs,
+    get_job_seed,
+    init_worker,
+    run_experiments,
+    run_job,
+)
+from src.greedy.search_state import STOP_EVALUATIONS, STOP_THRESHOLDS
+from src.greedy.settings import (
+    DENSE_RESULTS,
+    DIRPATH,
+    FINAL_GOAL_FUN,
+    PROFILE_SUFFIX,
+    RESULTS_STORE_FILE,
+    SEED_VARIABLE,
+    THRESHOLDS,
+)
+
+INPUT_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "..", DIRPATH, "filozofia-input.txt"
+)
+
+
+def read_results(results_dir: str) -> dict:
+    results = {}
+    for root, _, files in os.walk(results_dir):
+        for filename in files:
+            if filename == RESULTS_STORE_FILE:
+                continue
+            with open(os.path.join(root, filename)) as file:
+                results[filename] = file.read()
+    return results
+
+
+def test_get_job_seed_is_different_for_every_job():
+    seeds = {get_job_seed(0, mode, num, 0) for mode in range(4) for num in range(5)}
+    assert len(seeds) == 20
+
+
+def test_get_job_seed_is_reproducible():
+    assert get_job_seed(7, 3, 1, 2) == get_job_seed(7, 3, 1, 2)
+    assert not get_job_seed(7, 3, 1, 2) == get_job_seed(8, 3, 1, 2)
+
+
+def test_create_jobs():
+    jobs = create_jobs(3, 2, 4, 1, 0)
+    assert [job.test_num for job in jobs] == [0, 1, 2, 3]
+    assert all(job.mode == 3 and job.test_try == 1 for job in jobs)
+
+
+def test_run_experiments_gives_the_same_results_in_parallel(tmp_path):
+    data = normalize_data(load_data_from_file(INPUT_FILE))
+    jobs = create_jobs(0, 2, 1, 0, 0) + create_jobs(3, 2, 2, 0, 0)
+    os.mkdir(tmp_path / "serial")
+    os.mkdir(tmp_path / "parallel")
+
+    serial = run_experiments(jobs, data, INPUT_FILE, str(tmp_path / "serial"), 1)
+    parallel = run_experiments(jobs, data, INPUT_FILE, str(tmp_path / "parallel"), 2)
+
+    assert serial == parallel
+    assert list(serial) == [(0, 0), (3, 0)]
+    assert read_results(tmp_path / "serial") == read_results(tmp_path / "parallel")
+    assert len(read_results(tmp_path / "serial")) == 3
+
+
+def test_run_job_is_replayable():
+    init_worker(normalize_data(load_data_from_file(INPUT_FILE)))
+    job = create_jobs(3, 2, 1, 0, 5)[0]
+    assert run_job(job)._replace(wall_time=None) == run_job(job)._replace(
+        wall_time=None
+    )
+
+
+def test_run_experiments_saves_seed(tmp_path):
+    data = normalize_data(load_data_from_file(INPUT_FILE))
+    job = create_jobs(0, 2, 1, 0, 0)[0]
+    run_experiments([job], data, INPUT_FILE, str(tmp_path), 1)
+    with open(tmp_path / "filozofia" / "filozofia_0_0_0.txt") as file:
+        assert load_data(file.read(), [SEED_VARIABLE]) == {SEED_VARIABLE: job.seed}
+
+
+def test_sparse_results_export_to_dense_results(tmp_path):
+    data = normalize_data(load_data_from_file(INPUT_FILE))
+    jobs = create_jobs(3, 2, 1, 0, 0)
+    os.mkdir(tmp_path / "sparse")
+    os.mkdir(tmp_path / "dense")
+    run_experiments(jobs, data, INPUT_FILE, str(tmp_path / "sparse"), 1)
+    run_experiments(jobs, data, INPUT_FILE, str(tmp_path / "dense"), 1, DENSE_RESULTS)
+
+    result_path = os.path.join("filozofia", "filozofia_3_0_0.txt")
+    export_dense_results(
+        str(tmp_path / "sparse" / result_path), str(tmp_path / "exported.txt")
+    )
+    with open(tmp_path / "exported.txt") as exported:
+        with open(tmp_path / "dense" / result_path) as dense:
+            assert exported.read() == dense.read()
+
+
+def test_run_experiments_appends_results_to_store(tmp_path):
+    data = normalize_data(load_data_from_file(INPUT_FILE))
+    jobs = create_jobs(0, 2, 1, 0, 0) + create_jobs(3, 2, 2, 1, 0)
+    run_experiments(jobs, data, INPUT_FILE, str(tmp_path), 1)
+    run_experiments(jobs[:1], data, INPUT_FILE, str(tmp_path), 1)
+
+    store = load_store(str(tmp_path / RESULTS_STORE_FILE))
+    thresholds = len(THRESHOLDS)
+    # rows of the first run of rerun test are stale
+    assert len(store["mode"]) == 3 * thresholds
+    assert set(store["department"]) == {"filozofia"}
+    assert store["mode"].tolist() == [
+        mode for mode in [3, 3, 0] for _ in range(thresholds)
+    ]
+    assert store["seed"][0] == jobs[1].seed
+    assert store["result_file"][-1].endswith("filozofia_0_0_0.txt")
+    assert len(set(store["run_id"])) == 2
+    all_rows = load_store(str(tmp_path / RESULTS_STORE_FILE), latest_runs=False)
+    assert len(all_rows["mode"]) == 4 * thresholds
+
+    result = load_results(store["result_file"][-1])
+    rerun = slice(2 * thresholds, 3 * thresholds)
+    assert store["threshold"][rerun].tolist() == list(result["threshold_goal_values"])
+    assert store["threshold_goal"][rerun].tolist() == list(
+        result["threshold_goal_values"].values()
+    )
+    assert (store["final_goal"][rerun] == result[FINAL_GOAL_FUN]).all()
+    assert set(store["stop_reason"]) == {STOP_THRESHOLDS}
+
+
+def test_run_experiments_stores_runs_stopped_before_first_threshold(tmp_path):
+    data = normalize_data(load_data_from_file(INPUT_FILE))
+    jobs = [job._replace(max_evaluations=1) for job in create_jobs(0, 2, 2, 0, 0)]
+    run_experiments(jobs, data, INPUT_FILE, str(tmp_path), 1)
+
+    store = load_store(str(tmp_path / RESULTS_STORE_FILE))
+    assert store["test_num"].tolist() == [0, 1]
+    assert store["threshold"].tolist() == [NO_THRESHOLD] * 2
+    assert np.isnan(store["threshold_goal"]).all()
+    assert (store["final_goal"] > 0).all()
+    assert store["stop_reason"].tolist() == [STOP_EVALUATIONS] * 2
+
+
+def test_run_job_uses_thresholds_of_job():
+    init_worker(normalize_data(load_data_from_file(INPUT_FILE)))
+    job = create_jobs(3, 2, 1, 0, 5, thresholds=[1, 3])[0]
+    result = run_job(job)
+
+    pairs_num = min(result.threshold_goal_values)
+    assert list(result.threshold_goal_values) == [pairs_num, 3 * pairs_num]
+
+
+def test_run_experiments_saves_profiling_report(tmp_path):
+    data = normalize_data(load_data_from_file(INPUT_FILE))
+    jobs = [
+        job._replace(profile=True, profiled_iteration=0)
+        for job in create_jobs(3, 2, 2, 0, 0)
+    ]
+    run_experiments(jobs, data, INPUT_FILE, str(tmp_path), 1)
+
+    reports = []
+    for test_num in range(2):
+        filename = f"filozofia_3_{test_num}_0{PROFILE_SUFFIX}"
+        with open(tmp_path / "filozofia" / filename) as file:
+            reports.append(json.load(file))
+    assert "reset" in reports[0]["phases"]
+    assert reports[0]["iteration_profile"]["iteration"] == 0
+    # instance is prepared once per worker and reported by its first test
+    assert reports[0]["phases"]["prepare"]["calls"] == 1
+    assert "prepare" not in reports[1]["phases"]
+
+
+def test_run_job_with_anytime_limits():
+    init_worker(normalize_data(load_data_from_file(INPUT_FILE)))
+    job = create_jobs(0, 2, 1, 0, 5)[0]
+
+    assert run_job(job).stop_reason == STOP_THRESHOLDS
+    result = run_job(job._replace(max_evaluations=200))
+    assert result.stop_reason == STOP_EVALUATIONS
+    assert list(result.threshold_goal_values) == [min(result.threshold_goal_values)]
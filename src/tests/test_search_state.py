@@ -0,0 +1,121 @@
+import src.greedy.search_state as search_state
+from src.greedy.search_state import (
+    STOP_DEADLINE,
+    STOP_EVALUATIONS,
+    STOP_PATIENCE,
+    STOP_THRESHOLDS,
+    SearchState,
+)
+
+
+def test_count_evaluations_saves_best_goal_for_reached_thresholds():
+    state = SearchState([1, 3, 10])
+    state.count_evaluations()
+    state.update_best_result([], 5)
+    state.count_evaluations()
+    assert state.threshold_goal_values == {1: 5}
+
+    state.update_best_result([], 7)
+    state.count_evaluations(8)
+    assert state.threshold_goal_values == {1: 5, 3: 7}
+    assert state.next_threshold == 10
+    assert state.goal_calculations_num == 10
+    assert not state.is_finished()
+
+    state.count_evaluations()
+    assert state.threshold_goal_values == {1: 5, 3: 7, 10: 7}
+    assert state.is_finished()
+
+
+def test_update_best_result_keeps_copy_of_better_result():
+    state = SearchState([1])
+    ranks = [4, 1]
+    state.update_best_result(ranks, 2)
+    ranks.append(7)
+    state.update_best_result([3], 1)
+
+    assert state.best_ranks.tolist() == [4, 1]
+    assert state.best_goal_fun == 2
+
+
+def test_reset_starts_new_run():
+    state = SearchState([0])
+    state.update_best_result([0], 2)
+    state.count_evaluations(2)
+    state.reset([5, 2])
+
+    assert state.thresholds == [2, 5]
+    assert state.next_threshold == 2
+    assert state.goal_calculations_num == 0
+    assert state.threshold_goal_values == {}
+    assert state.best_ranks.tolist() == []
+    assert state.best_goal_fun == 0
+
+
+def test_is_finished_after_last_threshold():
+    state = SearchState([2], max_evaluations=10)
+    state.count_evaluations(3)
+
+    assert state.is_finished()
+    assert state.stop_reason == STOP_THRESHOLDS
+
+
+def test_is_finished_without_thresholds_and_limits():
+    state = SearchState()
+    assert state.is_finished()
+    assert state.stop_reason == STOP_THRESHOLDS
+
+
+def test_is_finished_after_evaluations_budget():
+    state = SearchState([100])
+    state.reset([], max_evaluations=5)
+    state.count_evaluations(6)
+    assert not state.is_finished()
+
+    state.reset([], max_evaluations=5)
+    state.count_iteration()
+    state.count_evaluations(4)
+    assert not state.is_finished()
+
+    state.count_evaluations()
+    assert state.is_finished()
+    assert state.stop_reason == STOP_EVALUATIONS
+
+
+def test_is_finished_after_patience():
+    state = SearchState([100])
+    state.reset([100], patience=2)
+    for goal in [1, 3, 3, 2]:
+        assert not state.is_finished()
+        state.update_best_result([], goal)
+        state.count_iteration()
+
+    assert state.is_finished()
+    assert state.stop_reason == STOP_PATIENCE
+    assert state.iterations == 4
+
+
+def test_is_finished_after_deadline(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(search_state.time, "monotonic", lambda: now[0])
+    state = SearchState([100])
+    state.reset([100], time_limit=1.5)
+    state.count_iteration()
+    now[0] = 101.4
+    assert not state.is_finished()
+
+    now[0] = 101.5
+    assert state.is_finished()
+    assert state.stop_reason == STOP_DEADLINE
+
+
+def test_reset_clears_limits():
+    state = SearchState()
+    state.reset([1], time_limit=0, max_evaluations=0, patience=0)
+    state.count_iteration()
+    assert state.is_finished()
+
+    state.reset([1])
+    assert not state.has_limits()
+    assert not state.is_finished()
+    assert state.stop_reason is None
@@ -0,0 +1,46 @@
+from src.greedy.sparse_matrix import SparseMatrix, as_sparse, get_common_nonzero
+
+DENSE = [[0, 1.0, 0, 0.5], [0, 0, 0, 0], [2.0, 0, 0, 0]]
+
+
+def test_from_dense():
+    matrix = SparseMatrix.from_dense(DENSE)
+    assert matrix.shape == (3, 4)
+    assert matrix.indptr.tolist() == [0, 2, 2, 3]
+    assert matrix.indices.tolist() == [1, 3, 0]
+    assert matrix.values.tolist() == [1.0, 0.5, 2.0]
+
+
+def test_get_nonzero_number():
+    assert SparseMatrix.from_dense(DENSE).get_nonzero_number() == 3
+
+
+def test_get_row():
+    indices, values = SparseMatrix.from_dense(DENSE).get_row(0)
+    assert indices.tolist() == [1, 3]
+    assert values.tolist() == [1.0, 0.5]
+
+
+def test_get_row_with_empty_row():
+    indices, values = SparseMatrix.from_dense(DENSE).get_row(1)
+    assert len(indices) == 0
+    assert len(values) == 0
+
+
+def test_to_dense():
+    assert SparseMatrix.from_dense(DENSE).to_dense() == DENSE
+
+
+def test_as_sparse():
+    matrix = SparseMatrix.from_dense(DENSE)
+    assert as_sparse(matrix) is matrix
+    assert as_sparse(DENSE) == matrix
+
+
+def test_get_common_nonzero():
+    points = SparseMatrix.from_dense([[10, 20, 0, 40]])
+    contribs = SparseMatrix.from_dense([[1.0, 0, 0.5, 0.25]])
+    pubs_idx, pts, ctbs = get_common_nonzero(points, contribs, 0)
+    assert pubs_idx.tolist() == [0, 3]
+    assert pts.tolist() == [10, 40]
+    assert ctbs.tolist() == [1.0, 0.25]
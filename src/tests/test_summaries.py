@@ -0,0 +1,62 @@
+import os
+
+import summaries
+from src.greedy.data_loader import load_data_from_file
+from src.greedy.data_preparation import normalize_data
+from src.greedy.results_store import NO_THRESHOLD
+from src.greedy.runner import create_jobs, run_experiments
+from src.greedy.settings import DIRPATH, RESULTS_STORE_FILE
+
+INPUT_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "..", DIRPATH, "filozofia-input.txt"
+)
+
+
+def test_summarize_result_dirs_gives_the_same_summaries_as_store(tmp_path):
+    data = normalize_data(load_data_from_file(INPUT_FILE))
+    jobs = create_jobs(0, 2, 1, 0, 0) + create_jobs(3, 2, 2, 0, 0)
+    run_experiments(jobs, data, INPUT_FILE, str(tmp_path), 1)
+
+    from_store = list(summaries.summarize_store(str(tmp_path / RESULTS_STORE_FILE)))
+    from_dirs = list(summaries.summarize_result_dirs(str(tmp_path), 1))
+
+    assert len(from_store) == len(from_dirs) == 1
+    store_summary, dir_summary = from_store[0], from_dirs[0]
+    assert store_summary.name == dir_summary.name == "filozofia"
+    assert store_summary.max_goal == dir_summary.max_goal
+    assert store_summary.file_with_max_goal == dir_summary.file_with_max_goal
+    assert sorted(zip(store_summary.thresholds, store_summary.points)) == sorted(
+        zip(dir_summary.thresholds, dir_summary.points)
+    )
+
+
+def test_summarize_store_with_runs_stopped_before_first_threshold(tmp_path):
+    data = normalize_data(load_data_from_file(INPUT_FILE))
+    jobs = create_jobs(0, 2, 1, 0, 0, [1, 3])
+    stopped = [job._replace(test_num=1, max_evaluations=1) for job in jobs]
+    run_experiments(jobs + stopped, data, INPUT_FILE, str(tmp_path), 1)
+
+    (summary,) = summaries.summarize_store(str(tmp_path / RESULTS_STORE_FILE))
+    assert len(summary.thresholds) == len(summary.points) == 2
+    assert NO_THRESHOLD not in summary.thresholds
+    assert summary.max_goal > 0
+
+
+def test_render_plots_skips_plots_with_unchanged_data(tmp_path, monkeypatch):
+    rendered = []
+
+    def make_plot(name, x, y, result_dir):
+        rendered.append(name)
+        path = os.path.join(result_dir, f"{name}.png")
+        open(path, "w").close()
+        return path
+
+    monkeypatch.setattr(summaries, "make_plot", make_plot)
+    first = summaries.Summary("first", [1, 10], [2.0, 3.0], 3.0, "first.txt")
+    second = summaries.Summary("second", [1, 10], [1.0, 4.0], 4.0, "second.txt")
+
+    summaries.render_plots([first, second], str(tmp_path), 1)
+    summaries.render_plots(
+        [first, second._replace(points=[1.0, 5.0])], str(tmp_path), 1
+    )
+    assert rendered == ["first", "second", "second"]
@@ -1,27 +1,22 @@
 from src.greedy.settings import (
     PLOT_DATA,
-    THRESHOLDS_SUFFIX,
     RESULTS_IMAGES_DIR,
+    RESULTS_STORE_FILE,
     SUMMARIES_FILE,
     FINAL_GOAL_FUN,
+    PLOT_HASH_SUFFIX,
+    PLOT_BACKEND,
+    WORKERS,
 )
 from src.greedy.tools import get_list_of_files_from_dir
-from src.greedy.data_loader import load_data
+from src.greedy.output_converter import load_results
+from src.greedy.results_store import NO_THRESHOLD, load_store, split_by_department
+import hashlib
+import json
+import multiprocessing
 import os
-import re
-import matplotlib.pyplot as plt
-from typing import List
-import pandas as pd
-import seaborn as sns
-
-
-def find_thresholds_names(input_data: str) -> List[str]:
-    pattern = THRESHOLDS_SUFFIX + r"[0-9]+"
-    return re.findall(pattern, input_data)
-
-
-def find_threshold(threshold_name: str) -> int:
-    return int(re.search(r"[0-9]+", threshold_name).group())
+from functools import partial
+from typing import Iterable, Iterator, List, NamedTuple
 
 
 def get_filename(filepath: str) -> str:
@@ -29,17 +24,32 @@ def get_filename(filepath: str) -> str:
 
 
 def make_plot(name: str, x: List[int], y: List[float], result_dir: str) -> str:
+    # plotting libraries are imported only when plot is made, because importing
+    # them takes more time than summarizing results
+    import matplotlib
+
+    matplotlib.use(PLOT_BACKEND)
+
+    import matplotlib.pyplot as plt
+    import pandas as pd
+    import seaborn as sns
+
     df = pd.DataFrame({"thresholds": x, "points": y})
-    path = os.path.join(RESULTS_IMAGES_DIR, f"{name}.png")
+    path = os.path.join(result_dir, f"{name}.png")
 
     g = sns.catplot(x="thresholds", y="points", jitter=False, data=df)
     plt.title(f"Publications' points for {name}")
     plt.subplots_adjust(top=0.90)
     plt.savefig(path)
+    plt.close(g.fig)
 
     return path
 
 
+def get_plot_data_hash(name: str, x: List[int], y: List[float]) -> str:
+    return hashlib.sha256(json.dumps([name, x, y]).encode()).hexdigest()
+
+
 def save_best_result(filepath: str, file_with_max_goal: str, max_goal: float) -> None:
     with open(filepath, "a") as file:
         file.write(f"file = {file_with_max_goal}")
@@ -49,52 +59,161 @@ def save_best_result(filepath: str, file_with_max_goal: str, max_goal: float) ->
         file.write("\n")
 
 
-def find_best_goal_function_in_files(filenames):
+class Summary(NamedTuple):
+    name: str
+    thresholds: List[int]
+    points: List[float]
+    max_goal: float
+    file_with_max_goal: str
+
+
+def summarize_result_dir(result_dir: str) -> Summary:
+    """
+    Counts data for plot and the best result of single department. Every result
+    file is read once and only up to accepted pairs.
+
+    Args:
+        result_dir: directory with result files of department
+
+    Returns:
+        thresholds, goal function values for thresholds, max goal function value
+        and file with max goal function value
+
+    """
+    x = []
+    y = []
     max_goal = 0
     file_with_max_goal = None
 
-    for filename in filenames:
-        with open(filename, "r") as file:
-            source_data = file.read()
+    for filename in get_list_of_files_from_dir(result_dir, ".txt"):
+        data = load_results(filename, with_pairs=False)
 
-        data = load_data(source_data, [FINAL_GOAL_FUN])
+        for threshold, goal in data["threshold_goal_values"].items():
+            x.append(threshold)
+            y.append(goal)
 
         if max_goal < data[FINAL_GOAL_FUN]:
             max_goal = data[FINAL_GOAL_FUN]
             file_with_max_goal = filename
 
-    return max_goal, file_with_max_goal
+    return Summary(get_filename(result_dir), x, y, max_goal, file_with_max_goal)
 
 
-def get_points_and_thresholds(filenames):
-    x = []
-    y = []
+def summarize_department(name: str, rows: dict) -> Summary:
+    """
+    Counts data for plot and the best result of single department from rows of
+    results store. Rows of runs stopped before their first threshold count only
+    for the best result.
+    """
+    has_threshold = rows["threshold"] != NO_THRESHOLD
+    x = rows["threshold"][has_threshold].tolist()
+    y = rows["threshold_goal"][has_threshold].tolist()
+    if not len(rows["final_goal"]) or not rows["final_goal"].max() > 0:
+        return Summary(name, x, y, 0, None)
 
-    for filename in filenames:
-        with open(filename, "r") as file:
-            source_data = file.read()
+    best = int(rows["final_goal"].argmax())
+    max_goal = float(rows["final_goal"][best])
+    return Summary(name, x, y, max_goal, str(rows["result_file"][best]))
 
-        thresholds_names = find_thresholds_names(source_data)
-        data = load_data(source_data, thresholds_names)
 
-        for threshold in thresholds_names:
-            x.append(find_threshold(threshold))
-            y.append(data[threshold])
-    return x, y
+def summarize_store(store_path: str) -> Iterator[Summary]:
+    for department, rows in split_by_department(load_store(store_path)).items():
+        yield summarize_department(department, rows)
 
 
-if __name__ == "__main__":
-    files_in_results_dir = get_list_of_files_from_dir(PLOT_DATA, "")
+def summarize_result_dirs(results_dir: str, workers: int = None) -> Iterator[Summary]:
+    """
+    Summarizes departments' result directories in pool of processes.
+
+    Args:
+        results_dir: directory with departments' result directories
+        workers: number of processes (all cores if None)
+
+    Returns:
+        Iterator over summaries in the same order as directories
+
+    """
+    files_in_results_dir = get_list_of_files_from_dir(results_dir, "")
     result_dirs = filter(lambda x: os.path.isdir(x), files_in_results_dir)
     result_dirs = list(filter(lambda x: not x == "data/results/final", result_dirs))
 
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        yield from map(summarize_result_dir, result_dirs)
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap(summarize_result_dir, result_dirs)
+
+
+def render_plot(summary: Summary, result_dir: str) -> str:
+    """
+    Makes plot of department. Plot is not rendered again if its data has not
+    changed since the last rendering (hash of data is stored next to the plot).
+
+    Args:
+        summary: summary of department
+        result_dir: directory to store plots
+
+    Returns:
+        path to the plot
+
+    """
+    x, y = summary.thresholds, summary.points
+    data_hash = get_plot_data_hash(summary.name, x, y)
+    path = os.path.join(result_dir, f"{summary.name}.png")
+    hash_path = path + PLOT_HASH_SUFFIX
+
+    if os.path.exists(path) and os.path.exists(hash_path):
+        with open(hash_path, "r") as file:
+            if file.read() == data_hash:
+                return path
+
+    path = make_plot(summary.name, x, y, result_dir)
+    with open(hash_path, "w") as file:
+        file.write(data_hash)
+    return path
+
+
+def render_plots(
+    summaries: List[Summary], result_dir: str, workers: int = None
+) -> List[str]:
+    """
+    Makes plots of departments in pool of processes.
+
+    Args:
+        summaries: summaries of departments
+        result_dir: directory to store plots
+        workers: number of processes (all cores if None)
+
+    Returns:
+        paths to the plots
+
+    """
+    os.makedirs(result_dir, exist_ok=True)
+    render = partial(render_plot, result_dir=result_dir)
+
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        return list(map(render, summaries))
+
+    with multiprocessing.Pool(workers) as pool:
+        return pool.map(render, summaries)
+
+
+def save_summaries(summaries: Iterable[Summary], workers: int = None) -> None:
+    summaries = list(summaries)
+    for summary in summaries:
+        save_best_result(SUMMARIES_FILE, summary.file_with_max_goal, summary.max_goal)
+    render_plots(summaries, RESULTS_IMAGES_DIR, workers)
+
+
+if __name__ == "__main__":
     if os.path.exists(SUMMARIES_FILE):
         os.remove(SUMMARIES_FILE)
 
-    for single_result_dir in result_dirs:
-        filenames = get_list_of_files_from_dir(single_result_dir, ".txt")
-        x, y = get_points_and_thresholds(filenames)
-        max_goal, file_with_max_goal = find_best_goal_function_in_files(filenames)
-
-        make_plot(get_filename(single_result_dir), x, y, RESULTS_IMAGES_DIR)
-        save_best_result(SUMMARIES_FILE, file_with_max_goal, max_goal)
+    store_path = os.path.join(PLOT_DATA, RESULTS_STORE_FILE)
+    if os.path.exists(store_path):
+        save_summaries(summarize_store(store_path), WORKERS)
+    else:
+        save_summaries(summarize_result_dirs(PLOT_DATA, WORKERS), WORKERS)